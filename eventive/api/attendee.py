@@ -1,35 +1,52 @@
 import frappe
 
+from eventive.events.catalog import get_published_events
+from eventive.utils.pagination import select_fields
+
+EVENT_LIST_FIELDS = [
+	"name",
+	"event_name",
+	"banner_image",
+	"start_date",
+	"end_date",
+	"status",
+	"capacity",
+	"venue",
+	"currency",
+	"is_paid_event",
+	"description",
+	"organizer"
+]
+
 
 @frappe.whitelist(allow_guest=True)
-def get_all_events():
+def get_all_events(from_date=None, to_date=None, venue=None, organizer=None, status=None, fields=None, cursor=None, limit=None):
 	"""
 	Fetch all available events.
 	
+	Args:
+	    from_date (str): Only events ending on or after this date
+	    to_date (str): Only events starting on or before this date
+	    venue (str): Venue ID
+	    organizer (str): Event Host ID
+	    status (str): Event status
+	    fields (list): Optional subset of fields to return
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
+	
 	Returns:
-	    list: List of event dictionaries containing event details
+	    list: List of event dictionaries containing event details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
 	"""
-	events = frappe.get_all(
-		"Main Event",
+	return get_published_events(
+		fields=select_fields(fields, EVENT_LIST_FIELDS),
 		filters={
-			"is_published": 1,
+			"from_date": from_date,
+			"to_date": to_date,
+			"venue": venue,
+			"organizer": organizer,
+			"status": status
 		},
-		fields=[
-			"name",
-			"event_name",
-			"banner_image",
-			"start_date",
-			"end_date",
-			"status",
-			"capacity",
-			"venue",
-			"currency",
-			"is_paid_event",
-			"description",
-			"organizer"
-		],
-		order_by="start_date asc",
-		ignore_permissions=True
+		cursor=cursor,
+		limit=limit
 	)
-	
-	return events
@@ -1,8 +1,11 @@
 import frappe
 
+from eventive.ticketing import waiting_room
+from eventive.ticketing.doctype.checkout_hold import checkout_hold
+
 
 @frappe.whitelist(allow_guest=True)
-def create_booking(event_id, email, discount_code=None, attendees=None):
+def create_booking(event_id, email, discount_code=None, attendees=None, hold_id=None, queue_id=None, hold_token=None):
 	"""
 	Create a booking for an event.
 	
@@ -11,6 +14,11 @@ def create_booking(event_id, email, discount_code=None, attendees=None):
 	    email (str): The booker's email
 	    discount_code (str): Optional discount code
 	    attendees (list): List of attendee dictionaries
+	    hold_id (str): Optional checkout hold whose seats the booking takes over
+	    queue_id (str): Waiting room queue ID, required while the event's
+	        waiting room is on
+	    hold_token (str): Token returned by start_checkout, required for guests
+	        taking over a hold
 	
 	Returns:
 	    dict: Booking result with registration ID and ticket IDs
@@ -18,6 +26,11 @@ def create_booking(event_id, email, discount_code=None, attendees=None):
 	if not attendees:
 		frappe.throw("At least one attendee is required", frappe.ValidationError)
 	
+	waiting_room.check_admission(event_id, queue_id)
+	
+	if hold_id:
+		checkout_hold.get_hold(hold_id, hold_token)
+	
 	# Parse attendees if it's a JSON string
 	if isinstance(attendees, str):
 		attendees = frappe.parse_json(attendees)
@@ -33,6 +46,7 @@ def create_booking(event_id, email, discount_code=None, attendees=None):
 		"discount_code": discount_code,
 		"status": "Pending",
 		"payment_status": "Unpaid",
+		"checkout_hold": hold_id,
 	})
 	
 	# Add attendees
@@ -64,20 +78,130 @@ def create_booking(event_id, email, discount_code=None, attendees=None):
 		registration.append("attendees", attendee_row)
 	
 	registration.insert(ignore_permissions=True)
+	waiting_room.consume_admission(event_id, queue_id)
 	
-	# Get created tickets
-	tickets = frappe.get_all(
-		"Event Ticket",
-		filters={
-			"registration": registration.name
-		},
-		fields=["name", "email", "ticket_type"],
-		ignore_permissions=True
-	)
-	
+	# Tickets are issued in the background, poll ticket.get_issuance_status for them
 	return {
 		"registration_id": registration.name,
-		"tickets": tickets,
+		"tickets": [],
+		"issuance_status": registration.issuance_status,
 		"total_amount": total_amount,
 		"status": "Booking created successfully"
 	}
+
+
+@frappe.whitelist(allow_guest=True)
+def start_checkout(event_id, items, email=None, queue_id=None):
+	"""
+	Hold tickets and merchandise while the attendee completes checkout.
+	
+	Args:
+	    event_id (str): The event ID
+	    items (list): List of dictionaries with `ticket_type` or `merchandise`
+	        and `quantity`
+	    email (str): Optional booker email
+	    queue_id (str): Waiting room queue ID, required while the event's
+	        waiting room is on
+	
+	Returns:
+	    dict: Hold ID, hold token and expiry time. Pass both to create_booking.
+	"""
+	if isinstance(items, str):
+		items = frappe.parse_json(items)
+	
+	if not items:
+		frappe.throw("Select at least one ticket or merchandise item", frappe.ValidationError)
+	
+	waiting_room.check_admission(event_id, queue_id)
+	
+	hold = checkout_hold.create_hold(event_id, items, email=email)
+	
+	return {
+		"hold_id": hold.name,
+		"hold_token": hold.hold_token,
+		"expires_at": hold.expires_at,
+		"status": hold.status
+	}
+
+
+@frappe.whitelist(allow_guest=True)
+def get_checkout_hold(hold_id, hold_token=None):
+	"""
+	Fetch the status of a checkout hold.
+	
+	Args:
+	    hold_id (str): The hold ID returned by start_checkout
+	    hold_token (str): The hold token returned by start_checkout, required
+	        for guests
+	
+	Returns:
+	    dict: Hold status, expiry time and held items
+	"""
+	hold = checkout_hold.get_hold(hold_id, hold_token)
+	
+	return {
+		"hold_id": hold.name,
+		"event_id": hold.event,
+		"status": "Expired" if hold.status == "Active" and hold.is_expired() else hold.status,
+		"expires_at": hold.expires_at,
+		"items": [
+			{
+				"ticket_type": item.ticket_type,
+				"merchandise": item.merchandise,
+				"quantity": item.quantity
+			}
+			for item in hold.items
+		]
+	}
+
+
+@frappe.whitelist(allow_guest=True)
+def cancel_checkout(hold_id, hold_token=None):
+	"""
+	Release a checkout hold before it expires.
+	
+	Args:
+	    hold_id (str): The hold ID returned by start_checkout
+	    hold_token (str): The hold token returned by start_checkout, required
+	        for guests
+	
+	Returns:
+	    dict: Final hold status
+	"""
+	hold = checkout_hold.release_hold(hold_id, hold_token)
+	
+	return {
+		"hold_id": hold.name,
+		"status": hold.status
+	}
+
+
+@frappe.whitelist(allow_guest=True)
+def join_queue(event_id):
+	"""
+	Join the waiting room for an event's ticket sales.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: Queue ID, position and admission status. When the waiting room
+	        is off the buyer is admitted straight away.
+	"""
+	return waiting_room.join(event_id)
+
+
+@frappe.whitelist(allow_guest=True)
+def get_queue_status(event_id, queue_id):
+	"""
+	Poll a waiting room position. Served from Redis only.
+	
+	Args:
+	    event_id (str): The event ID
+	    queue_id (str): The queue ID returned by join_queue
+	
+	Returns:
+	    dict: Position, buyers ahead, estimated wait in seconds and whether
+	        the buyer may book
+	"""
+	return waiting_room.get_status(event_id, queue_id)
@@ -0,0 +1,96 @@
+import frappe
+from werkzeug.wrappers import Response
+
+from eventive.events import calendar_feed
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_event_feed(event_id):
+	"""
+	Fetch the iCalendar feed of every session of a published event.
+
+	Args:
+	    event_id (str): The event ID
+
+	Returns:
+	    Response: The feed, with ETag and Last-Modified headers
+	"""
+	check_published(event_id)
+	return get_feed_response(event_id, "event", public=True)
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_track_feed(track_id):
+	"""
+	Fetch the iCalendar feed of the sessions on one track of a published event.
+
+	Args:
+	    track_id (str): The Event Day Track ID
+
+	Returns:
+	    Response: The feed, with ETag and Last-Modified headers
+	"""
+	event_id = frappe.db.get_value("Event Day Track", track_id, "event")
+	if not event_id:
+		frappe.throw("Track not found", frappe.DoesNotExistError)
+
+	check_published(event_id)
+	return get_feed_response(event_id, f"track:{track_id}", public=True)
+
+
+@frappe.whitelist(allow_guest=True, methods=["GET"])
+def get_attendee_feed(token):
+	"""
+	Fetch the iCalendar feed of the sessions in an attendee's schedule.
+
+	Args:
+	    token (str): Signed feed token from `get_feed_urls`
+
+	Returns:
+	    Response: The feed, with ETag and Last-Modified headers
+	"""
+	user, event_id = calendar_feed.verify_feed_token(token)
+	return get_feed_response(event_id, f"user:{user}", public=False)
+
+
+@frappe.whitelist()
+def get_feed_urls(event_id):
+	"""
+	Fetch the calendar subscription URLs for an event.
+
+	Args:
+	    event_id (str): The event ID
+
+	Returns:
+	    dict: Event, per track and, for logged in users, personal agenda feed URLs
+	"""
+	check_published(event_id)
+	return calendar_feed.get_feed_urls(event_id, frappe.session.user)
+
+
+def check_published(event_id):
+	if not frappe.db.get_value("Main Event", event_id, "is_published"):
+		frappe.throw("Event not found", frappe.DoesNotExistError)
+
+
+def get_feed_response(event_id, feed, public):
+	cached = calendar_feed.get_feed(event_id, feed)
+
+	response = Response(mimetype="text/calendar")
+	response.set_etag(cached["etag"])
+	response.last_modified = cached["last_modified"]
+	response.headers["Cache-Control"] = f"{'public' if public else 'private'}, max-age={calendar_feed.REFRESH_INTERVAL}"
+
+	request = frappe.request
+	if request.if_none_match:
+		not_modified = cached["etag"] in request.if_none_match
+	else:
+		since = request.if_modified_since
+		not_modified = bool(since) and since.timestamp() >= cached["last_modified"]
+
+	if not_modified:
+		response.status_code = 304
+		return response
+
+	response.data = cached["ics"]
+	return response
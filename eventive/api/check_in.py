@@ -0,0 +1,90 @@
+import frappe
+from werkzeug.wrappers import Response
+
+from eventive.ticketing import check_in, manifest
+
+
+@frappe.whitelist(methods=["POST"])
+def check_in_batch(event_id, scans):
+	"""
+	Check in a batch of ticket scans from a gate device.
+	
+	Args:
+	    event_id (str): The event ID
+	    scans (list): Scans with `token`, `scanner_id` and `scanned_at`
+	
+	Returns:
+	    dict: Admitted, Duplicate or Rejected per scan, plus totals
+	"""
+	frappe.has_permission("Event Check-in", "create", throw=True)
+	
+	if isinstance(scans, str):
+		scans = frappe.parse_json(scans)
+	
+	if not scans:
+		frappe.throw("No scans to check in")
+	
+	return check_in.check_in_batch(event_id, scans)
+
+
+@frappe.whitelist()
+def get_duplicate_scans(event_id, since=None):
+	"""
+	Fetch repeated scans of already admitted tickets for reporting.
+	
+	Args:
+	    event_id (str): The event ID
+	    since (str): Only return duplicates scanned at or after this datetime
+	
+	Returns:
+	    list: Duplicate scans with the scanner and time of the original admission
+	"""
+	frappe.has_permission("Event Check-in", "read", throw=True)
+	
+	return check_in.get_duplicate_scans(event_id, since)
+
+
+@frappe.whitelist()
+def get_manifest(event_id):
+	"""
+	Download the gzipped list of an event's tickets for offline scanning.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    Response: Gzipped JSON with `generated_at`, `columns` and `tickets`
+	"""
+	frappe.has_permission("Event Check-in", "read", throw=True)
+	
+	data = manifest.get_manifest(event_id)
+	
+	response = Response(mimetype="application/json")
+	response.set_etag(data["etag"])
+	response.headers["Cache-Control"] = "private, no-cache"
+	
+	if data["etag"] in frappe.request.if_none_match:
+		response.status_code = 304
+		return response
+	
+	response.headers["Content-Encoding"] = "gzip"
+	response.data = data["data"]
+	return response
+
+
+@frappe.whitelist()
+def get_manifest_changes(event_id, since):
+	"""
+	Fetch the tickets that changed since a device's last sync.
+	
+	Args:
+	    event_id (str): The event ID
+	    since (str): `generated_at` of the last manifest or change set
+	
+	Returns:
+	    dict: Changed tickets, or `full_sync` when the manifest should be downloaded again.
+	        Tickets changed shortly before `since` are repeated, so dedupe by ticket ID.
+	"""
+	frappe.has_permission("Event Check-in", "read", throw=True)
+	
+	return manifest.get_changes(event_id, since)
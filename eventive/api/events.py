@@ -1,5 +1,10 @@
 import frappe
 
+from eventive.events import bundle, counters
+from eventive.events.catalog import CATALOG_FIELDS, get_published_events
+from eventive.ticketing import waiting_room
+from eventive.utils.pagination import select_fields
+
 
 @frappe.whitelist(allow_guest=True)
 def get_sponsor_tiers(event_id):
@@ -144,41 +149,39 @@ def create_sponsor(sponsor_name, tier, event=None, company=None, company_logo=No
 
 
 @frappe.whitelist(allow_guest=True)
-def get_all():
+def get_all(from_date=None, to_date=None, venue=None, organizer=None, status=None, fields=None, cursor=None, limit=None):
 	"""
 	Fetch all published events.
 	
+	Served from the published-event catalog cache, which is invalidated
+	whenever a Main Event is saved or deleted.
+	
+	Args:
+	    from_date (str): Only events ending on or after this date
+	    to_date (str): Only events starting on or before this date
+	    venue (str): Venue ID
+	    organizer (str): Event Host ID
+	    status (str): Event status
+	    fields (list): Optional subset of fields to return
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
+	
 	Returns:
-	    list: List of event dictionaries containing event details
+	    list: List of event dictionaries containing event details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
 	"""
-	events = frappe.get_all(
-		"Main Event",
+	return get_published_events(
+		fields=select_fields(fields, CATALOG_FIELDS),
 		filters={
-			"is_published": 1,
+			"from_date": from_date,
+			"to_date": to_date,
+			"venue": venue,
+			"organizer": organizer,
+			"status": status
 		},
-		fields=[
-			"name",
-			"event_name",
-			"banner_image",
-			"start_date",
-			"end_date",
-			"status",
-			"capacity",
-			"venue",
-			"venue_name",
-			"currency",
-			"is_paid_event",
-			"description",
-			"organizer",
-			"host_name",
-			"allow_networking",
-			"allow_digital_content"
-		],
-		order_by="start_date asc",
-		ignore_permissions=True
+		cursor=cursor,
+		limit=limit
 	)
-	
-	return events
 
 
 @frappe.whitelist()
@@ -215,6 +218,42 @@ def get_by_id(event_id):
 	}
 
 
+@frappe.whitelist()
+def get_event_bundle(event_id, include=None):
+	"""
+	Fetch everything the event detail pages need in a single request.
+	
+	Args:
+	    event_id (str): The event ID
+	    include (list): Sections to return, any of event, sessions,
+	        ticket_types, merchandise, sponsor_tiers, booth_packages and
+	        content. Defaults to all sections.
+	
+	Returns:
+	    dict: Section name -> the payload of the matching endpoint
+	"""
+	return bundle.get_event_bundle(event_id, include)
+
+
+@frappe.whitelist()
+def get_event_counters(event_id):
+	"""
+	Fetch the live registration, ticket and check-in counts of an event.
+	
+	Subscribe to the `eventive_event_counters` realtime event on the Main
+	Event document for updates instead of polling this.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: Totals plus issued and checked in counts per ticket type
+	"""
+	frappe.has_permission("Main Event", "write", doc=event_id, throw=True)
+	
+	return counters.get_counters(event_id)
+
+
 @frappe.whitelist()
 def get_my_events():
 	"""
@@ -271,13 +310,15 @@ def get_my_events():
 
 
 @frappe.whitelist()
-def register_for_event(event, attendees=None):
+def register_for_event(event, attendees=None, queue_id=None):
 	"""
 	Register for an event.
 	
 	Args:
 	    event (str): The event ID
 	    attendees (list): List of attendee dictionaries with email, name, ticket_type
+	    queue_id (str): Waiting room queue ID, required while the event's
+	        waiting room is on
 	
 	Returns:
 	    dict: Registration details
@@ -285,25 +326,14 @@ def register_for_event(event, attendees=None):
 	if not frappe.session.user or frappe.session.user == "Guest":
 		frappe.throw("Please login to register for events", frappe.PermissionError)
 	
+	waiting_room.check_admission(event, queue_id)
+	
 	event_doc = frappe.get_doc("Main Event", event, ignore_permissions=True)
 	
 	if not event_doc.is_published:
 		frappe.throw("This event is not open for registration")
 	
-	# Check capacity
-	existing_registrations = frappe.get_all(
-		"Event Registration",
-		filters={
-			"event": event,
-			"docstatus": 1
-		},
-		fields=["name"],
-		ignore_permissions=True
-	)
-	
-	if event_doc.capacity and len(existing_registrations) >= event_doc.capacity:
-		frappe.throw("This event is fully booked")
-	
+	# Capacity is enforced by the seat inventory when the registration is saved
 	registration = frappe.get_doc({
 		"doctype": "Event Registration",
 		"event": event,
@@ -326,10 +356,12 @@ def register_for_event(event, attendees=None):
 	
 	registration.insert(ignore_permissions=True)
 	registration.submit()
+	waiting_room.consume_admission(event, queue_id)
 	
 	return {
 		"registration_id": registration.name,
 		"event": event,
+		"issuance_status": registration.issuance_status,
 		"status": "Registered",
 		"message": "Successfully registered for the event"
 	}
@@ -1,31 +1,46 @@
 import frappe
 
+from eventive.utils.pagination import paginate_query, select_fields
+
+MERCHANDISE_FIELDS = [
+	"name",
+	"item_name",
+	"description",
+	"price",
+	"currency",
+	"item_image",
+	"stock_quantity",
+]
+
 
 @frappe.whitelist()
-def get_by_event(event_id):
+def get_by_event(event_id, fields=None, cursor=None, limit=None):
 	"""
 	Fetch all merchandise available for a specific event.
 	
 	Args:
 	    event_id (str): The event ID
+	    fields (list): Optional subset of fields to return
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
 	
 	Returns:
-	    list: List of merchandise dictionaries containing item details
+	    list: List of merchandise dictionaries containing item details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
 	"""
+	fields = select_fields(fields, MERCHANDISE_FIELDS)
+
+	if cursor or limit:
+		return paginate_query(
+			"Merchandise", fields, "item_name", filters={"event": event_id}, cursor=cursor, limit=limit
+		)
+
 	merchandise_items = frappe.get_all(
 		"Merchandise",
 		filters={
 			"event": event_id,
 		},
-		fields=[
-			"name",
-			"item_name",
-			"description",
-			"price",
-			"currency",
-			"item_image",
-			"stock_quantity",
-		],
+		fields=fields,
 		order_by="item_name asc",
 		ignore_permissions=True
 	)
@@ -1,20 +1,109 @@
 import frappe
 
+from eventive.networking import lsh, matchmaking, unread
+from eventive.networking.doctype.networking_message.networking_message import get_conversation_key
+from eventive.utils.pagination import decode_cursor, encode_cursor, get_page_length
+
+MATCH_FIELDS = ["name", "attendee_1", "attendee_2", "event", "match_score", "status", "creation", "modified"]
+
+PROFILE_FIELDS = ["name", "user", "full_name", "company", "job_title", "bio", "profile_image", "social_link", "open_to_networking"]
+
 
 @frappe.whitelist()
-def get_matches(event_id=None):
+def get_matches(event_id=None, cursor=None, limit=None):
 	"""
 	Fetch networking matches for the current user.
 	
 	Args:
 	    event_id (str): Optional event ID to filter matches
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
 	
 	Returns:
-	    list: List of match dictionaries with attendee details
+	    list: List of match dictionaries with attendee details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
+	"""
+	return get_match_list("Suggested", "match_score", event_id, cursor, limit)
+
+
+@frappe.whitelist()
+def get_connected_matches(event_id=None, cursor=None, limit=None):
+	"""
+	Fetch connected networking matches for the current user.
+	
+	Args:
+	    event_id (str): Optional event ID to filter matches
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
+	
+	Returns:
+	    list: List of connected match dictionaries with attendee details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
+	"""
+	return get_match_list("Connected", "creation", event_id, cursor, limit)
+
+
+@frappe.whitelist(methods=["POST"])
+def generate_matches(event_id):
+	"""
+	Queue match suggestions for every networking attendee of an event.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: The queued job ID
+	"""
+	frappe.has_permission("Main Event", "write", doc=event_id, throw=True)
+	
+	job = matchmaking.enqueue_match_generation(event_id)
+	return {"job_id": job.id if job else None}
+
+
+@frappe.whitelist()
+def get_suggestions(event_id, limit=None):
+	"""
+	Fetch the attendees the current user should meet at an event, from the LSH index.
+	
+	Args:
+	    event_id (str): The event ID
+	    limit (int): Number of attendees to return
+	
+	Returns:
+	    list: Attendee profiles with their similarity score, best first
+	"""
+	if not frappe.session.user or frappe.session.user == "Guest":
+		frappe.throw("Please login to view networking matches", frappe.PermissionError)
+	
+	profile = frappe.db.get_value("Attendee Profile", {"user": frappe.session.user, "open_to_networking": 1}, "name")
+	if not profile:
+		return []
+	
+	nearest = lsh.get_nearest(event_id, profile, k=get_page_length(limit))
+	profiles = get_profiles({name for name, _ in nearest})
+	
+	return [
+		{"attendee": profiles[name], "score": score}
+		for name, score in nearest
+		if name in profiles
+	]
+
+
+def get_match_list(status, sort_field, event_id=None, cursor=None, limit=None):
+	"""
+	Matches of the current user's profile with a status, newest or best first.
+	
+	The user's matches are read from each side of the pair through the
+	(attendee_1, status, match_score) and (attendee_2, status, match_score)
+	indexes, then the other attendees' profiles and interests are loaded in
+	one query each. Pages are cut on the matches, so a page may hold fewer
+	rows when some attendees have since closed their profile to networking.
 	"""
 	if not frappe.session.user or frappe.session.user == "Guest":
 		frappe.throw("Please login to view networking matches", frappe.PermissionError)
 	
+	paginate = bool(cursor or limit)
+	
 	# Get current user's attendee profile
 	current_user_profile = frappe.get_all(
 		"Attendee Profile",
@@ -24,220 +113,144 @@ def get_matches(event_id=None):
 		ignore_permissions=True
 	)
 	
-	if not current_user_profile:
-		return []
+	# Check if current user is open to networking
+	if not current_user_profile or not current_user_profile[0].get("open_to_networking"):
+		return {"data": [], "next_cursor": None} if paginate else []
 	
-	current_profile = current_user_profile[0]
+	current_profile = current_user_profile[0].get("name")
+	page_length = get_page_length(limit) if paginate else None
 	
-	# Check if current user is open to networking
-	if not current_profile.get("open_to_networking"):
-		return []
+	matches = []
+	for field in ("attendee_1", "attendee_2"):
+		matches += get_side_matches(field, current_profile, status, sort_field, event_id, cursor, page_length)
 	
-	filters = {
-		"status": "Suggested",
-	}
+	matches.sort(key=lambda match: (match.get(sort_field), match.get("name")), reverse=True)
 	
-	if event_id:
-		filters["event"] = event_id
+	next_cursor = None
+	if paginate and len(matches) > page_length:
+		matches = matches[:page_length]
+		next_cursor = encode_cursor([matches[-1].get(sort_field), matches[-1].get("name")])
 	
-	matches = frappe.get_all(
-		"Match Suggestion",
-		filters=filters,
-		fields=[
-			"name",
-			"attendee_1",
-			"attendee_2",
-			"event",
-			"match_score",
-			"status"
-		],
-		order_by="match_score desc",
-		ignore_permissions=True
-	)
+	others = {
+		match.get("name"): match.get("attendee_2") if match.get("attendee_1") == current_profile else match.get("attendee_1")
+		for match in matches
+	}
+	profiles = get_profiles(set(others.values()))
 	
-	# Get attendee profile details for each match
 	result = []
 	for match in matches:
-		# Only process if current user is attendee_1 or attendee_2
-		if match.attendee_1 != current_profile.name and match.attendee_2 != current_profile.name:
-			continue
-		
-		# Determine the other attendee
-		other_attendee = match.attendee_2 if match.attendee_1 == current_profile.name else match.attendee_1
-		
-		# Get the matched user's profile
-		attendee_profile = frappe.get_all(
-			"Attendee Profile",
-			filters={"name": other_attendee},
-			fields=["name", "user", "full_name", "company", "job_title", "bio", "profile_image", "social_link", "open_to_networking", "interests"],
-			limit=1,
-			ignore_permissions=True
-		)
-		
-		if not attendee_profile:
-			continue
-		
-		profile = attendee_profile[0]
-		
-		# Check if the other attendee is open to networking
-		if not profile.get("open_to_networking"):
+		profile = profiles.get(others[match.get("name")])
+		if not profile:
 			continue
 		
-		# Get interests for the matched user
-		interests = frappe.get_all(
-			"Interest Tags",
-			filters={"parent": profile.name},
-			fields=["interest"],
-			ignore_permissions=True
-		)
-		
-		# Build nested profile object
-		nested_profile = {
-			"name": profile.name,
-			"user": profile.user,
-			"full_name": profile.full_name,
-			"company": profile.company,
-			"job_title": profile.job_title,
-			"bio": profile.bio,
-			"profile_image": profile.profile_image,
-			"social_link": profile.social_link,
-			"open_to_networking": profile.open_to_networking,
-			"interests": [{"interest": i.interest} for i in interests]
+		row = {
+			"match_id": match.get("name"),
+			"attendee_2": profile,
+			"match_score": match.get("match_score"),
+			"event": match.get("event"),
+			"status": match.get("status")
 		}
-		
-		result.append({
-			"match_id": match.name,
-			"attendee_2": nested_profile,
-			"match_score": match.match_score,
-			"event": match.event,
-			"status": match.status
-		})
+		if status == "Connected":
+			row["connected_on"] = match.get("modified")
+		result.append(row)
+	
+	if paginate:
+		return {"data": result, "next_cursor": next_cursor}
 	
 	return result
-@frappe.whitelist()
-def get_connected_matches(event_id=None):
+
+
+def get_side_matches(field, profile, status, sort_field, event_id=None, cursor=None, page_length=None):
 	"""
-	Fetch connected networking matches for the current user.
-	
-	Args:
-	    event_id (str): Optional event ID to filter matches
+	Matches where `profile` is `field`, in descending (sort_field, name) order.
 	
-	Returns:
-	    list: List of connected match dictionaries with attendee details
+	The cursor condition `(sort_field, name) < (value, name)` is expressed as
+	`sort_field <= value AND (sort_field < value OR name < name)` to fit
+	`frappe.get_all` filters.
 	"""
-	if not frappe.session.user or frappe.session.user == "Guest":
-		frappe.throw("Please login to view networking matches", frappe.PermissionError)
-	
-	# Get current user's attendee profile
-	current_user_profile = frappe.get_all(
-		"Attendee Profile",
-		filters={"user": frappe.session.user},
-		fields=["name", "open_to_networking"],
-		limit=1,
-		ignore_permissions=True
-	)
-	
-	if not current_user_profile:
-		return []
-	
-	current_profile = current_user_profile[0]
-	
-	# Check if current user is open to networking
-	if not current_profile.get("open_to_networking"):
-		return []
-	
 	filters = {
-		"status": "Connected",
+		field: profile,
+		"status": status,
 	}
 	
 	if event_id:
 		filters["event"] = event_id
 	
-	matches = frappe.get_all(
+	or_filters = None
+	if cursor:
+		last_value, last_name = decode_cursor(cursor)
+		filters[sort_field] = ["<=", last_value]
+		or_filters = [[sort_field, "<", last_value], ["name", "<", last_name]]
+	
+	return frappe.get_all(
 		"Match Suggestion",
 		filters=filters,
-		fields=[
-			"name",
-			"attendee_1",
-			"attendee_2",
-			"event",
-			"match_score",
-			"status"
-		],
-		order_by="creation desc",
+		or_filters=or_filters,
+		fields=MATCH_FIELDS,
+		order_by=f"{sort_field} desc, name desc",
+		limit_page_length=page_length + 1 if page_length else 0,
 		ignore_permissions=True
 	)
+
+
+def get_profiles(names):
+	"""
+	Nested profiles with interests for attendees open to networking, in two queries.
 	
-	# Get attendee profile details for each match
-	result = []
-	for match in matches:
-		# Only process if current user is attendee_1 or attendee_2
-		if match.attendee_1 != current_profile.name and match.attendee_2 != current_profile.name:
-			continue
-		
-		# Determine the other attendee
-		other_attendee = match.attendee_2 if match.attendee_1 == current_profile.name else match.attendee_1
-		
-		# Get the matched user's profile
-		attendee_profile = frappe.get_all(
-			"Attendee Profile",
-			filters={"name": other_attendee},
-			fields=["name", "user", "full_name", "company", "job_title", "bio", "profile_image", "social_link", "open_to_networking"],
-			limit=1,
-			ignore_permissions=True
-		)
-		
-		if not attendee_profile:
-			continue
-		
-		profile = attendee_profile[0]
-		
-		# Check if the other attendee is open to networking
-		if not profile.get("open_to_networking"):
-			continue
-		
-		# Get interests for the matched user
-		interests = frappe.get_all(
-			"Interest Tags",
-			filters={"parent": profile.name},
-			fields=["interest"],
-			ignore_permissions=True
-		)
-		
-		# Build nested profile object
-		nested_profile = {
-			"name": profile.name,
-			"user": profile.user,
-			"full_name": profile.full_name,
-			"company": profile.company,
-			"job_title": profile.job_title,
-			"bio": profile.bio,
-			"profile_image": profile.profile_image,
-			"social_link": profile.social_link,
-			"open_to_networking": profile.open_to_networking,
-			"interests": [{"interest": i.interest} for i in interests]
-		}
-		
-		result.append({
-			"match_id": match.name,
-			"attendee_2": nested_profile,
-			"match_score": match.match_score,
-			"event": match.event,
-			"status": match.status,
-			"connected_on": match.modified
-		})
+	Returns:
+	    dict: Attendee Profile ID -> profile
+	"""
+	if not names:
+		return {}
 	
-	return result
+	profiles = frappe.get_all(
+		"Attendee Profile",
+		filters={
+			"name": ["in", list(names)],
+			"open_to_networking": 1
+		},
+		fields=PROFILE_FIELDS,
+		ignore_permissions=True
+	)
+	if not profiles:
+		return {}
+	
+	interests = frappe.get_all(
+		"Interest Tags",
+		filters={
+			"parenttype": "Attendee Profile",
+			"parent": ["in", [profile.get("name") for profile in profiles]]
+		},
+		fields=["parent", "interest"],
+		order_by="idx asc",
+		ignore_permissions=True
+	)
+	
+	by_profile = {}
+	for interest in interests:
+		by_profile.setdefault(interest.get("parent"), []).append({"interest": interest.get("interest")})
+	
+	return {
+		profile.get("name"): dict(
+			{field: profile.get(field) for field in PROFILE_FIELDS},
+			interests=by_profile.get(profile.get("name"), [])
+		)
+		for profile in profiles
+	}
 
 
 @frappe.whitelist()
-def send_message(receiver_id=None, message=None):
+def send_message(receiver_id=None, message=None, event_id=None):
 	"""
 	Send a networking message to another attendee.
 	
+	The message is pushed to the receiver's socket.io room once committed, as
+	an `eventive_message` realtime event, and counted as unread for them.
+	
 	Args:
 	    receiver_id (str): User ID of the message recipient
 	    message (str): Message content
+	    event_id (str): Optional event the conversation belongs to
 
 	Returns:
 	    dict: Created message details
@@ -248,6 +261,9 @@ def send_message(receiver_id=None, message=None):
 	if not receiver_id or not message:
 		frappe.throw("Missing required fields: receiver_id and message are required")
 
+	if receiver_id == frappe.session.user:
+		frappe.throw("You cannot send a message to yourself")
+
 	# Get sender's attendee profile
 	sender_profile = frappe.get_all(
 		"Attendee Profile",
@@ -268,6 +284,7 @@ def send_message(receiver_id=None, message=None):
 	# Create the Networking Message
 	msg = frappe.get_doc({
 		"doctype": "Networking Message",
+		"event": event_id,
 		"sender": frappe.session.user,
 		"receiver": receiver_id,
 		"sender_name": sender_name,
@@ -276,9 +293,12 @@ def send_message(receiver_id=None, message=None):
 		"is_read": 0
 	})
 	msg.insert(ignore_permissions=True)
+
+	unread.deliver(msg)
 	
 	return {
 		"message_id": msg.name,
+		"event_id": event_id,
 		"sender": frappe.session.user,
 		"receiver": receiver_id,
 		"message": message,
@@ -287,12 +307,18 @@ def send_message(receiver_id=None, message=None):
 
 
 @frappe.whitelist()
-def get_messages(other_user_id=None):
+def get_messages(other_user_id=None, event_id=None, before=None, limit=None):
 	"""
-	Get networking messages between current user and another user for an event.
+	Get a page of networking messages between current user and another user, newest first.
+	
+	Messages are read through the (conversation, creation) index, so each page
+	costs the same however long the conversation is.
 	
 	Args:
 	    other_user_id (str): User ID of the other participant
+	    event_id (str): Optional event ID to filter messages
+	    before (str): ID of the oldest message already loaded, to fetch older ones
+	    limit (int): Page length
 	
 	Returns:
 	    list: List of message dictionaries
@@ -303,15 +329,29 @@ def get_messages(other_user_id=None):
 	if not other_user_id:
 		frappe.throw("Missing required fields: other_user_id is required")
 
-	# Get messages where current user is sender or receiver, and other_user_id is the other party
+	conversation = get_conversation_key(frappe.session.user, other_user_id)
+	filters = [["conversation", "=", conversation]]
+	or_filters = None
+	
+	if event_id:
+		filters.append(["event", "=", event_id])
+	
+	if before:
+		cursor = frappe.db.get_value("Networking Message", before, ["conversation", "creation"], as_dict=True)
+		if not cursor or cursor.conversation != conversation:
+			frappe.throw("Invalid pagination cursor", frappe.ValidationError)
+		
+		# (creation, name) < (cursor creation, cursor name)
+		filters.append(["creation", "<=", cursor.creation])
+		or_filters = [["creation", "<", cursor.creation], ["name", "<", before]]
+
 	messages = frappe.get_all(
 		"Networking Message",
-		filters=[
-			["Networking Message", "sender", "in", [frappe.session.user, other_user_id]],
-			["Networking Message", "receiver", "in", [frappe.session.user, other_user_id]]
-		],
+		filters=filters,
+		or_filters=or_filters,
 		fields=[
 			"name",
+			"event",
 			"sender",
 			"receiver",
 			"sender_name",
@@ -320,21 +360,59 @@ def get_messages(other_user_id=None):
 			"is_read",
 			"creation"
 		],
-		order_by="creation asc",
+		order_by="creation desc, name desc",
+		limit_page_length=get_page_length(limit),
 		ignore_permissions=True
 	)
 	
 	result = []
 	for msg in messages:
 		result.append({
-			"id": msg.name,
-			"sender_id": msg.sender,
-			"receiver_id": msg.receiver,
-			"sender_name": msg.sender_name,
-			"receiver_name": msg.receiver_name,
-			"message": msg.message,
-			"is_read": bool(msg.is_read),
-			"created_at": msg.creation
+			"id": msg.get("name"),
+			"event_id": msg.get("event"),
+			"sender_id": msg.get("sender"),
+			"receiver_id": msg.get("receiver"),
+			"sender_name": msg.get("sender_name"),
+			"receiver_name": msg.get("receiver_name"),
+			"message": msg.get("message"),
+			"is_read": bool(msg.get("is_read")),
+			"created_at": msg.get("creation")
 		})
 	
 	return result
+
+
+@frappe.whitelist()
+def get_unread_counts():
+	"""
+	Get the current user's unread networking messages, per conversation.
+	
+	Counts are kept in Redis and seeded from the database on first read.
+	
+	Returns:
+	    dict: `total` and `conversations`, other user ID -> unread count
+	"""
+	if not frappe.session.user or frappe.session.user == "Guest":
+		frappe.throw("Please login to view messages", frappe.PermissionError)
+
+	return unread.get_unread_counts(frappe.session.user)
+
+
+@frappe.whitelist(methods=["POST"])
+def mark_conversation_read(other_user_id=None):
+	"""
+	Mark every message another user sent to the current user as read.
+	
+	Args:
+	    other_user_id (str): User ID of the other participant
+	
+	Returns:
+	    dict: Number of messages marked as read
+	"""
+	if not frappe.session.user or frappe.session.user == "Guest":
+		frappe.throw("Please login to view messages", frappe.PermissionError)
+
+	if not other_user_id:
+		frappe.throw("Missing required field: other_user_id is required")
+
+	return {"updated": unread.mark_conversation_read(frappe.session.user, other_user_id)}
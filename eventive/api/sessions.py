@@ -1,5 +1,8 @@
 import frappe
 
+from eventive.events import timetable
+from eventive.personalized import agenda, session_booking
+
 
 @frappe.whitelist()
 def get_by_event(event_id):
@@ -43,3 +46,120 @@ def get_by_event(event_id):
 			session.end_time = str(session.end_time)
 	
 	return sessions
+
+
+@frappe.whitelist(methods=["POST"])
+def book_session(session_id):
+	"""
+	Book a seat in a session for the current user.
+	
+	Args:
+	    session_id (str): The session ID
+	
+	Returns:
+	    dict: The session's remaining seats and the user's booked sessions
+	"""
+	schedule = session_booking.book_session(session_id, frappe.session.user)
+	return get_booking_response(session_id, schedule)
+
+
+@frappe.whitelist(methods=["POST"])
+def cancel_session_booking(session_id):
+	"""
+	Cancel the current user's booking for a session.
+	
+	Args:
+	    session_id (str): The session ID
+	
+	Returns:
+	    dict: The session's remaining seats and the user's booked sessions
+	"""
+	schedule = session_booking.cancel_session(session_id, frappe.session.user)
+	return get_booking_response(session_id, schedule)
+
+
+@frappe.whitelist()
+def get_free_slots(event_id, day=1):
+	"""
+	Fetch the free time in the current user's day and the sessions that fit it.
+	
+	Args:
+	    event_id (str): The event ID
+	    day (int): Day of the event, starting at 1
+	
+	Returns:
+	    list: Free slots with their start, end and fitting sessions
+	"""
+	return session_booking.get_free_slots(frappe.session.user, event_id, day)
+
+
+@frappe.whitelist(methods=["POST"])
+def generate_agendas(event_id):
+	"""
+	Queue Auto agendas for every ticket holder of an event.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: The queued job ID
+	"""
+	frappe.has_permission("Main Event", "write", doc=event_id, throw=True)
+	
+	job = agenda.enqueue_agenda_generation(event_id)
+	return {"job_id": job.id if job else None}
+
+
+@frappe.whitelist(methods=["POST"])
+def solve_timetable(event_id):
+	"""
+	Queue a proposed timetable for an event's sessions, tracks and speakers.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: The queued job ID
+	"""
+	frappe.has_permission("Main Event", "write", doc=event_id, throw=True)
+	
+	job = timetable.enqueue_timetable(event_id)
+	return {"job_id": job.id if job else None}
+
+
+@frappe.whitelist()
+def get_timetable_proposal(event_id):
+	"""
+	Fetch the last proposed timetable for an event.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: Proposed sessions, unplaced sessions and conflicts, or None
+	"""
+	frappe.has_permission("Main Event", "write", doc=event_id, throw=True)
+	
+	return timetable.get_proposal(event_id)
+
+
+def get_booking_response(session_id, schedule):
+	session = frappe.db.get_value("Event Session", session_id, ["capacity", "booked_spots", "is_booked"], as_dict=True)
+	
+	return {
+		"session_id": session_id,
+		"capacity": session.capacity,
+		"booked_spots": session.booked_spots,
+		"is_booked": session.is_booked,
+		"schedule_id": schedule.name,
+		"booked_sessions": [
+			{
+				"event_session": row.event_session,
+				"session_title": row.session_title,
+				"start_time": str(row.start_time) if row.start_time else None,
+				"end_time": str(row.end_time) if row.end_time else None,
+				"attendance_status": row.attendance_status
+			}
+			for row in schedule.booked_sessions
+		]
+	}
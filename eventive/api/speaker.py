@@ -1,26 +1,41 @@
 import frappe
 
+from eventive.utils.pagination import paginate_query, select_fields
+
+SPEAKER_FIELDS = [
+	"name",
+	"full_name",
+	"bio",
+	"photo",
+	"sessions",
+	# "social_links" uncomment on fix
+	"role",
+	"company",
+]
+
 
 @frappe.whitelist(allow_guest=True)
-def get_all_speakers():
+def get_all_speakers(fields=None, cursor=None, limit=None):
 	"""
 	Fetch all speakers.
 	
+	Args:
+	    fields (list): Optional subset of fields to return
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; when given, a paginated response is returned
+	
 	Returns:
-	    list: List of speaker dictionaries containing speaker details
+	    list: List of speaker dictionaries containing speaker details, or
+	        dict: {"data", "next_cursor"} when `cursor` or `limit` is given
 	"""
+	fields = select_fields(fields, SPEAKER_FIELDS)
+
+	if cursor or limit:
+		return paginate_query("Speaker", fields, "full_name", cursor=cursor, limit=limit)
+
 	speakers = frappe.get_all(
 		"Speaker",
-		fields=[
-			"name",
-			"full_name",
-			"bio",
-			"photo",
-			"sessions",
-			# "social_links" uncomment on fix
-			"role",
-			"company",
-		],
+		fields=fields,
 		order_by="full_name asc",
 		ignore_permissions=True
 	)
@@ -0,0 +1,100 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+
+def session(name, title, start, end, speaker_text=""):
+    return frappe._dict({
+        "name": name,
+        "session_title": title,
+        "start_time": datetime(2026, 11, 2, start),
+        "end_time": datetime(2026, 11, 2, end),
+        "speaker_text": speaker_text,
+    })
+
+
+class TestAgendaGeneration(unittest.TestCase):
+    """Unit tests for automatic agenda planning."""
+
+    def setUp(self):
+        from eventive.personalized.agenda import build_index
+
+        self.sessions = {
+            "SES-1": session("SES-1", "Machine Learning in Production", 9, 11),
+            "SES-2": session("SES-2", "Learning Rust", 10, 11),
+            "SES-3": session("SES-3", "Cloud Security", 11, 12, "Jane Doe machine learning researcher"),
+            "SES-4": session("SES-4", "Gardening", 12, 13),
+        }
+        self.index = build_index(self.sessions)
+
+    def test_best_non_overlapping_agenda(self):
+        """Test that the highest scoring set of non-overlapping sessions is picked."""
+        from eventive.personalized.agenda import plan_agenda
+
+        agenda = plan_agenda({"machine", "learning", "security"}, self.sessions, self.index, {})
+
+        self.assertEqual(agenda, ["SES-1", "SES-3"])
+
+    def test_full_sessions_are_skipped(self):
+        """Test that sessions without seats left are not planned."""
+        from eventive.personalized.agenda import plan_agenda
+
+        agenda = plan_agenda({"machine", "learning"}, self.sessions, self.index, {"SES-1": 0})
+
+        self.assertEqual(agenda, ["SES-2", "SES-3"])
+
+    def test_no_matching_interests(self):
+        """Test that attendees with no matching interests get no agenda."""
+        from eventive.personalized.agenda import plan_agenda
+
+        self.assertEqual(plan_agenda({"cooking"}, self.sessions, self.index, {}), [])
+
+    @patch('eventive.personalized.agenda.try_claim_seats')
+    @patch('frappe.db')
+    def test_claim_seats_drops_sessions_filled_meanwhile(self, mock_db, mock_try_claim):
+        """Test that seats left after concurrent bookings go to the earliest attendees."""
+        from eventive.personalized.agenda import claim_seats
+
+        # SES-1 had one seat left, SES-2 was booked out
+        mock_try_claim.side_effect = lambda name, seats: name == "SES-3" or (name == "SES-1" and seats == 1)
+        mock_db.sql.side_effect = lambda query, values: [(1,)] if values["name"] == "SES-1" else [(0,)]
+
+        claimed = claim_seats([
+            ("a@example.com", ["SES-1", "SES-3"]),
+            ("b@example.com", ["SES-1", "SES-2"]),
+            ("c@example.com", ["SES-2"]),
+        ])
+
+        self.assertEqual(claimed, [("a@example.com", ["SES-1", "SES-3"])])
+
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_only_bookable_sessions_with_seats_are_planned(self, mock_get_all, mock_db):
+        """Test that a non-bookable session does not push out a bookable one at the same time."""
+        from eventive.personalized.agenda import build_index, get_sessions, plan_agenda
+
+        rows = [
+            frappe._dict(session("SES-1", "Machine Learning Keynote", 9, 11), allow_booking=0, capacity=0, booked_spots=0),
+            frappe._dict(session("SES-2", "Learning Rust", 10, 11), allow_booking=1, capacity=50, booked_spots=10),
+            frappe._dict(session("SES-3", "Machine Learning Ops", 11, 12), allow_booking=1, capacity=20, booked_spots=20),
+            frappe._dict(session("SES-4", "Machine Learning Lab", 12, 13), allow_booking=1, capacity=20, booked_spots=20),
+        ]
+        mock_get_all.side_effect = lambda doctype, filters, **kwargs: [
+            row for row in rows if row.allow_booking == filters["allow_booking"]
+        ]
+        mock_db.sql.return_value = []
+
+        # SES-4 is only full with seats held by the Auto schedules being replaced
+        sessions = get_sessions("EVT-1", {"SES-4": 1})
+
+        self.assertEqual(sorted(sessions), ["SES-2", "SES-4"])
+        agenda = plan_agenda({"machine", "learning"}, sessions, build_index(sessions), {})
+        self.assertEqual(agenda, ["SES-2", "SES-4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
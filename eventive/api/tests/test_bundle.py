@@ -0,0 +1,67 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch, MagicMock
+
+
+class TestEventBundle(unittest.TestCase):
+    """Unit tests for the event detail bundle."""
+
+    def _mock_cache(self, store):
+        cache = MagicMock()
+        cache.hget.side_effect = lambda key, field: store.get(key, {}).get(field)
+        cache.hset.side_effect = lambda key, field, value: store.setdefault(key, {}).__setitem__(field, value)
+        cache.hdel.side_effect = lambda key, field: store.get(key, {}).pop(field, None)
+        return cache
+
+    @patch('frappe.get_attr')
+    @patch('frappe.db')
+    @patch('frappe.cache')
+    def test_only_missing_sections_are_built(self, mock_cache, mock_db, mock_get_attr):
+        """Test that cached sections are served and only missing ones are rebuilt."""
+        store = {"eventive:event_bundle:EVT-1": {"event": {"name": "EVT-1"}}}
+        mock_cache.return_value = self._mock_cache(store)
+        mock_db.exists.return_value = True
+        loader = MagicMock(return_value=[{"name": "SES-1"}])
+        mock_get_attr.return_value = loader
+
+        from eventive.events.bundle import get_event_bundle
+
+        result = get_event_bundle("EVT-1", include=["event", "sessions"])
+
+        loader.assert_called_once_with("EVT-1")
+        self.assertEqual(result["event"], {"name": "EVT-1"})
+        self.assertEqual(result["sessions"], [{"name": "SES-1"}])
+        self.assertIn("sessions", store["eventive:event_bundle:EVT-1"])
+
+    @patch('frappe.cache')
+    def test_invalid_section_rejected(self, mock_cache):
+        """Test that unknown sections raise a validation error."""
+        from eventive.events.bundle import get_event_bundle
+
+        with self.assertRaises(frappe.ValidationError):
+            get_event_bundle("EVT-1", include=["attendees"])
+
+    @patch('frappe.db')
+    @patch('frappe.cache')
+    def test_child_change_clears_its_section(self, mock_cache, mock_db):
+        """Test that saving a child document drops only its section for its event."""
+        store = {"eventive:event_bundle:EVT-1": {"event": {}, "sessions": []}}
+        mock_cache.return_value = self._mock_cache(store)
+
+        doc = MagicMock()
+        doc.doctype = "Event Session"
+        doc.get.return_value = "EVT-1"
+        doc.get_doc_before_save.return_value = None
+
+        from eventive.events.bundle import invalidate_event_bundle
+
+        invalidate_event_bundle(doc, "on_update")
+
+        self.assertEqual(store["eventive:event_bundle:EVT-1"], {"event": {}})
+
+
+if __name__ == "__main__":
+    unittest.main()
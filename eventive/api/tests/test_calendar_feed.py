@@ -0,0 +1,104 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+
+def session(name, title, description=None):
+    return frappe._dict({
+        "name": name,
+        "session_title": title,
+        "description": description,
+        "session_type": "Talk",
+        "start_time": datetime(2026, 11, 2, 9),
+        "end_time": datetime(2026, 11, 2, 10),
+        "modified": datetime(2026, 10, 1, 12),
+    })
+
+
+@patch("eventive.events.calendar_feed.get_system_timezone", return_value="UTC")
+class TestCalendarFeed(unittest.TestCase):
+    """Unit tests for iCalendar agenda feeds."""
+
+    def test_render_calendar(self, _):
+        """Test that sessions are rendered as escaped VEVENTs with CRLF line endings."""
+        from eventive.events.calendar_feed import render_calendar
+
+        ics = render_calendar("DevConf", [session("SES-1", "Rust, Go; and C")], "Main Hall")
+
+        self.assertTrue(ics.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(ics.endswith("END:VCALENDAR\r\n"))
+        self.assertIn("DTSTART:20261102T090000Z\r\n", ics)
+        self.assertIn("SUMMARY:Rust\\, Go\\; and C\r\n", ics)
+        self.assertIn("LOCATION:Main Hall\r\n", ics)
+
+    def test_long_lines_are_folded(self, _):
+        """Test that lines longer than 75 octets are folded without splitting characters."""
+        from eventive.events.calendar_feed import render_calendar
+
+        ics = render_calendar("DevConf", [session("SES-1", "é" * 100)])
+
+        for line in ics.split("\r\n"):
+            self.assertLessEqual(len(line.encode()), 75)
+        self.assertIn("é" * 100, ics.replace("\r\n ", ""))
+
+    def test_feed_token_round_trip(self, _):
+        """Test that feed tokens verify and tampered ones are rejected."""
+        from eventive.events.calendar_feed import get_feed_token, verify_feed_token
+
+        with patch("eventive.events.calendar_feed.get_encryption_key", return_value="secret"), \
+                patch("frappe.throw", side_effect=frappe.PermissionError):
+            token = get_feed_token("user@example.com", "EVT-001")
+            self.assertEqual(verify_feed_token(token), ("user@example.com", "EVT-001"))
+
+            with self.assertRaises(frappe.PermissionError):
+                verify_feed_token(token[:-2] + "xx")
+
+    def test_cached_feed_is_served(self, _):
+        """Test that a cached feed is returned without building it again."""
+        from eventive.events.calendar_feed import get_feed
+
+        cache = MagicMock()
+        cache.hget.return_value = {"ics": "BEGIN:VCALENDAR", "etag": "abc", "last_modified": 1}
+
+        with patch("frappe.cache", return_value=cache), \
+                patch("eventive.events.calendar_feed.build_feed") as build_feed:
+            feed = get_feed("EVT-001", "event")
+
+        build_feed.assert_not_called()
+        self.assertEqual(feed["etag"], "abc")
+
+    def test_schedule_change_clears_attendee_feed(self, _):
+        """Test that a schedule change only drops its attendee's feed."""
+        from eventive.events.calendar_feed import invalidate_feeds
+
+        doc = MagicMock(doctype="Attendee Schedule", event="EVT-001", user="user@example.com")
+        doc.get_doc_before_save.return_value = None
+
+        with patch("eventive.events.calendar_feed.clear_feeds") as clear_feeds, \
+                patch("frappe.db") as db:
+            invalidate_feeds(doc, "on_update")
+
+        clear_feeds.assert_called_once_with("EVT-001", "user:user@example.com")
+        db.after_commit.add.assert_called_once()
+
+    def test_renamed_event_clears_old_feeds(self, _):
+        """Test that renaming an event drops the feeds cached under its old name."""
+        from eventive.events.calendar_feed import invalidate_feeds
+
+        doc = MagicMock(doctype="Main Event")
+        doc.name = "EVT-NEW"
+
+        with patch("eventive.events.calendar_feed.clear_feeds") as clear_feeds, \
+                patch("frappe.db"):
+            invalidate_feeds(doc, "after_rename", "EVT-OLD", "EVT-NEW", False)
+
+        clear_feeds.assert_any_call("EVT-OLD", None)
+        clear_feeds.assert_any_call("EVT-NEW", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
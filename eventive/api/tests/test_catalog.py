@@ -0,0 +1,82 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch, MagicMock
+
+
+class TestPublishedEventCatalog(unittest.TestCase):
+    """Unit tests for the published-event catalog cache."""
+
+    def setUp(self):
+        frappe.local.site = "test_site"
+        from eventive.events import catalog
+        catalog._local_catalog.clear()
+
+    def _mock_cache(self, store):
+        cache = MagicMock()
+        cache.get_value.side_effect = lambda key: store.get(key)
+        cache.set_value.side_effect = lambda key, value: store.__setitem__(key, value)
+        cache.delete_value.side_effect = lambda key: store.pop(key, None)
+        return cache
+
+    @patch('frappe.get_all')
+    @patch('frappe.cache')
+    def test_serves_redis_payload_without_query(self, mock_cache, mock_get_all):
+        """Test that a current Redis payload is served without hitting the database."""
+        store = {
+            "eventive:catalog_version": "v1",
+            "eventive:published_events": {
+                "version": "v1",
+                "events": [frappe._dict({"name": "EVT-1", "event_name": "Launch"})]
+            }
+        }
+        mock_cache.return_value = self._mock_cache(store)
+
+        from eventive.events.catalog import get_published_events
+
+        result = get_published_events(fields=["name", "event_name"])
+
+        mock_get_all.assert_not_called()
+        self.assertEqual(result[0].event_name, "Launch")
+
+    @patch('frappe.get_all')
+    @patch('frappe.cache')
+    def test_rebuilds_on_version_mismatch(self, mock_cache, mock_get_all):
+        """Test that a stale Redis payload is rebuilt from the database."""
+        store = {
+            "eventive:catalog_version": "v2",
+            "eventive:published_events": {"version": "v1", "events": []}
+        }
+        mock_cache.return_value = self._mock_cache(store)
+        mock_get_all.return_value = [frappe._dict({"name": "EVT-2"})]
+
+        from eventive.events.catalog import get_published_events
+
+        result = get_published_events(fields=["name"])
+
+        mock_get_all.assert_called_once()
+        self.assertEqual(result[0].name, "EVT-2")
+        self.assertEqual(store["eventive:published_events"]["version"], "v2")
+
+    @patch('frappe.get_all')
+    @patch('frappe.cache')
+    def test_local_copy_used_after_first_load(self, mock_cache, mock_get_all):
+        """Test that the in-process copy is reused while the version is unchanged."""
+        store = {"eventive:catalog_version": "v1"}
+        cache = self._mock_cache(store)
+        mock_cache.return_value = cache
+        mock_get_all.return_value = [frappe._dict({"name": "EVT-1"})]
+
+        from eventive.events.catalog import get_published_events
+
+        get_published_events()
+        store.pop("eventive:published_events")
+        get_published_events()
+
+        mock_get_all.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch
+
+
+class TestBatchCheckIn(unittest.TestCase):
+    """Unit tests for batch check-in."""
+
+    def _ticket(self, name, **kwargs):
+        ticket = {"name": name, "event": "EVT-1", "status": "Valid", "docstatus": 1, "checked_in": 0}
+        ticket.update(kwargs)
+        return frappe._dict(ticket)
+
+    @patch('eventive.ticketing.check_in.get_admissions', return_value={})
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_batch_is_validated_in_one_query(self, mock_get_all, mock_db, mock_admissions):
+        """Test that a batch loads tickets once, flips them once and inserts once."""
+        mock_get_all.return_value = [self._ticket("TKT-1"), self._ticket("TKT-2")]
+
+        from eventive.ticketing.check_in import check_in_batch
+
+        response = check_in_batch("EVT-1", [
+            {"token": "TKT-1", "scanner_id": "GATE-A", "scanned_at": "2026-11-02 09:00:00"},
+            {"token": "TKT-2", "scanner_id": "GATE-A", "scanned_at": "2026-11-02 09:00:05"},
+        ])
+
+        self.assertEqual(response["admitted"], 2)
+        self.assertEqual(mock_get_all.call_count, 1)
+        self.assertEqual(mock_db.sql.call_count, 1)
+        self.assertEqual(mock_db.bulk_insert.call_count, 1)
+        self.assertEqual(len(mock_db.bulk_insert.call_args.kwargs["values"]), 2)
+
+    @patch('eventive.ticketing.check_in._load_admissions', return_value={})
+    @patch('eventive.ticketing.check_in.get_admissions', return_value={})
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_duplicates_and_invalid_tickets(self, mock_get_all, mock_db, mock_admissions, mock_load):
+        """Test that rescans, checked in and invalid tickets are not admitted."""
+        mock_get_all.return_value = [
+            self._ticket("TKT-1"),
+            self._ticket("TKT-2", checked_in=1),
+            self._ticket("TKT-3", status="Invalid"),
+        ]
+
+        from eventive.ticketing.check_in import check_in_batch
+
+        response = check_in_batch("EVT-1", [
+            {"token": "TKT-1", "scanner_id": "GATE-B", "scanned_at": "2026-11-02 09:00:10"},
+            {"token": "TKT-1", "scanner_id": "GATE-A", "scanned_at": "2026-11-02 09:00:00"},
+            {"token": "TKT-2", "scanner_id": "GATE-A", "scanned_at": "2026-11-02 09:00:20"},
+            {"token": "TKT-3", "scanner_id": "GATE-A", "scanned_at": "2026-11-02 09:00:30"},
+            {"token": "", "scanner_id": "GATE-A"},
+        ])
+
+        statuses = [result["status"] for result in response["results"]]
+        self.assertEqual(statuses, ["Duplicate", "Admitted", "Duplicate", "Rejected", "Rejected"])
+        self.assertEqual(mock_db.sql.call_args.args[1]["names"], ("TKT-1",))
+
+        rows = mock_db.bulk_insert.call_args.kwargs["values"]
+        admission = next(row for row in rows if row[11] == "Admitted")
+        rescan = next(row for row in rows if row[7] == "TKT-1" and row[11] == "Duplicate")
+        self.assertEqual(rescan[12], admission[0])
+
+    @patch('eventive.ticketing.check_in.get_admissions')
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_admitted_tickets_are_answered_from_redis(self, mock_get_all, mock_db, mock_admissions):
+        """Test that a rescan of an admitted ticket skips the database lookup."""
+        mock_admissions.return_value = {
+            "TKT-1": {"check_in": "CHK-1", "scanner_id": "GATE-A", "checkin_time": "2026-11-02 09:00:00"}
+        }
+
+        from eventive.ticketing.check_in import check_in_batch
+
+        response = check_in_batch("EVT-1", [
+            {"token": "TKT-1", "scanner_id": "GATE-C", "scanned_at": "2026-11-02 09:30:00"},
+        ])
+
+        result = response["results"][0]
+        self.assertEqual(result["status"], "Duplicate")
+        self.assertEqual(result["admitted_scanner_id"], "GATE-A")
+        mock_get_all.assert_not_called()
+        mock_db.sql.assert_not_called()
+        self.assertEqual(mock_db.bulk_insert.call_args.kwargs["values"][0][12], "CHK-1")
+
+
+class TestScanTimes(unittest.TestCase):
+    """Unit tests for how scan times from gate devices are handled."""
+
+    @patch('eventive.ticketing.check_in.get_system_timezone', return_value="Africa/Nairobi")
+    def test_scan_times_are_normalised_to_site_time(self, mock_timezone):
+        """Test that scans with and without an offset compare in site time."""
+        from datetime import datetime
+        from eventive.ticketing.check_in import _get_scanned_at
+
+        # 06:30 UTC is 09:30 in Nairobi, after the naive 09:00 local scan
+        aware = _get_scanned_at("2026-11-02T06:30:00+00:00")
+        naive = _get_scanned_at("2026-11-02 09:00:00")
+
+        self.assertIsNone(aware.tzinfo)
+        self.assertEqual(aware, datetime(2026, 11, 2, 9, 30))
+        self.assertLess(naive, aware)
+
+    @patch('eventive.ticketing.check_in.verify_ticket_token')
+    def test_token_validity_uses_server_time(self, mock_verify):
+        """Test that a device's clock cannot move a token into its validity window."""
+        mock_verify.side_effect = frappe.ValidationError("This ticket has expired")
+
+        from eventive.ticketing.check_in import _resolve_scan
+
+        result = _resolve_scan("EVT-1", 0, {"token": "payload.signature", "scanned_at": "2026-11-02 09:00:00"})
+
+        mock_verify.assert_called_once_with("payload.signature")
+        self.assertEqual(result.status, "Rejected")
+
+
+if __name__ == "__main__":
+    unittest.main()
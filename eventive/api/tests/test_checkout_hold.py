@@ -0,0 +1,223 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import MagicMock, patch
+
+from frappe.utils import add_to_date, now_datetime
+
+HOLD_MODULE = 'eventive.ticketing.doctype.checkout_hold.checkout_hold'
+REGISTRATION_MODULE = 'eventive.ticketing.doctype.event_registration.event_registration'
+
+
+def make_hold(status="Active", minutes=10, owner="Guest", token="secret"):
+    from eventive.ticketing.doctype.checkout_hold.checkout_hold import CheckoutHold
+
+    hold = CheckoutHold.__new__(CheckoutHold)
+    hold.__dict__.update({
+        "name": "HOLD-1",
+        "event": "EVT-1",
+        "owner": owner,
+        "hold_token": token,
+        "status": status,
+        "expires_at": add_to_date(now_datetime(), minutes=minutes),
+        "items": [
+            frappe._dict(idx=1, ticket_type="TKT-VIP", merchandise=None, quantity=2),
+            frappe._dict(idx=2, ticket_type=None, merchandise="MERCH-CAP", quantity=1),
+        ],
+    })
+    hold.db_set = MagicMock()
+    return hold
+
+
+class TestCheckoutHold(unittest.TestCase):
+    """Unit tests for checkout holds, from reservation to conversion or release."""
+
+    @patch(f'{HOLD_MODULE}.clear_event_bundle')
+    @patch(f'{HOLD_MODULE}.claim_stock')
+    @patch(f'{HOLD_MODULE}.reserve_seats')
+    def test_hold_reserves_seats_and_stock(self, mock_reserve_seats, mock_claim_stock, mock_clear_bundle):
+        """Test that a new hold reserves its ticket seats and claims merchandise stock."""
+        hold = make_hold()
+        hold.after_insert()
+
+        mock_reserve_seats.assert_called_once_with("EVT-1", {"TKT-VIP": 2})
+        mock_claim_stock.assert_called_once_with("MERCH-CAP", 1)
+
+    @patch(f'{HOLD_MODULE}.clear_event_bundle')
+    @patch(f'{HOLD_MODULE}.release_seats')
+    @patch(f'{HOLD_MODULE}.claim_stock')
+    @patch(f'{HOLD_MODULE}.reserve_seats')
+    def test_out_of_stock_releases_seats(self, mock_reserve_seats, mock_claim_stock, mock_release_seats, mock_clear_bundle):
+        """Test that a failed stock claim hands the reserved seats back."""
+        mock_claim_stock.side_effect = frappe.ValidationError("Not enough stock")
+
+        hold = make_hold()
+        with self.assertRaises(frappe.ValidationError):
+            hold.after_insert()
+
+        mock_release_seats.assert_called_once_with("EVT-1", {"TKT-VIP": 2})
+
+    @patch('frappe.get_doc')
+    def test_convert_hands_seats_to_registration(self, mock_get_doc):
+        """Test that converting an active hold returns its seats and marks it converted."""
+        hold = make_hold()
+        mock_get_doc.return_value = hold
+
+        from eventive.ticketing.doctype.checkout_hold.checkout_hold import convert_hold
+
+        self.assertEqual(convert_hold("HOLD-1", "EVT-1"), {"TKT-VIP": 2})
+        hold.db_set.assert_called_once_with("status", "Converted")
+
+    @patch('frappe.get_doc')
+    def test_expired_hold_cannot_convert(self, mock_get_doc):
+        """Test that an expired hold is rejected at booking time."""
+        hold = make_hold(minutes=-1)
+        mock_get_doc.return_value = hold
+
+        from eventive.ticketing.doctype.checkout_hold.checkout_hold import convert_hold
+
+        with self.assertRaises(frappe.ValidationError):
+            convert_hold("HOLD-1", "EVT-1")
+        hold.db_set.assert_not_called()
+
+    @patch(f'{HOLD_MODULE}.clear_event_bundle')
+    @patch(f'{HOLD_MODULE}.restore_stock')
+    @patch(f'{HOLD_MODULE}.release_seats')
+    @patch('frappe.db')
+    @patch('frappe.get_doc')
+    @patch('frappe.get_all')
+    def test_expire_holds_releases_seats_and_stock(self, mock_get_all, mock_get_doc, mock_db, mock_release_seats, mock_restore_stock, mock_clear_bundle):
+        """Test that the scheduled job releases expired holds and marks them expired."""
+        hold = make_hold(minutes=-1)
+        mock_get_all.return_value = ["HOLD-1"]
+        mock_get_doc.return_value = hold
+
+        from eventive.ticketing.doctype.checkout_hold.checkout_hold import expire_holds
+
+        expire_holds()
+
+        mock_release_seats.assert_called_once_with("EVT-1", {"TKT-VIP": 2})
+        mock_restore_stock.assert_called_once_with("MERCH-CAP", 1)
+        hold.db_set.assert_called_once_with("status", "Expired")
+
+    @patch(f'{HOLD_MODULE}.release_seats')
+    @patch('frappe.get_doc')
+    def test_released_hold_is_not_released_twice(self, mock_get_doc, mock_release_seats):
+        """Test that releasing a converted hold leaves the registration's seats alone."""
+        mock_get_doc.return_value = make_hold(status="Converted", owner="user@example.com")
+
+        with patch('frappe.session', frappe._dict(user="user@example.com")):
+            from eventive.ticketing.doctype.checkout_hold.checkout_hold import release_hold
+
+            release_hold("HOLD-1")
+
+        mock_release_seats.assert_not_called()
+
+
+class TestCheckoutHoldAccess(unittest.TestCase):
+    """Unit tests for checkout hold ownership."""
+
+    @patch('frappe.get_doc')
+    def test_guest_needs_hold_token(self, mock_get_doc):
+        """Test that guests can only read a hold with its token."""
+        mock_get_doc.return_value = make_hold()
+
+        from eventive.ticketing.doctype.checkout_hold.checkout_hold import get_hold
+
+        with patch('frappe.session', frappe._dict(user="Guest")):
+            with self.assertRaises(frappe.PermissionError):
+                get_hold("HOLD-1")
+            with self.assertRaises(frappe.PermissionError):
+                get_hold("HOLD-1", "wrong")
+            self.assertEqual(get_hold("HOLD-1", "secret").name, "HOLD-1")
+
+    @patch('frappe.get_doc')
+    def test_user_owns_their_holds(self, mock_get_doc):
+        """Test that signed in users reach their own holds and nobody else's."""
+        mock_get_doc.return_value = make_hold(owner="user@example.com")
+
+        from eventive.api.booking import cancel_checkout, get_checkout_hold
+
+        with patch('frappe.session', frappe._dict(user="user@example.com")):
+            self.assertEqual(get_checkout_hold("HOLD-1")["status"], "Active")
+
+        with patch('frappe.session', frappe._dict(user="other@example.com")):
+            with self.assertRaises(frappe.PermissionError):
+                cancel_checkout("HOLD-1")
+
+
+class TestCheckoutHoldLimits(unittest.TestCase):
+    """Unit tests for the limits on what one client can hold."""
+
+    def test_hold_quantity_is_capped(self):
+        """Test that a single hold cannot reserve more than the configured quantity."""
+        hold = make_hold()
+        hold.items = [frappe._dict(idx=1, ticket_type="TKT-VIP", merchandise=None, quantity=11)]
+
+        with self.assertRaises(frappe.ValidationError):
+            hold.validate()
+
+        hold.items[0].quantity = 10
+        hold.validate()
+
+    @patch('frappe.db')
+    def test_active_holds_are_capped_per_client(self, mock_db):
+        """Test that a client with too many active holds on an event cannot start another."""
+        hold = make_hold()
+        hold.email = "guest@example.com"
+        mock_db.sql.return_value = [(2,)]
+
+        with patch('frappe.session', frappe._dict(user="Guest")):
+            with self.assertRaises(frappe.ValidationError):
+                hold.before_insert()
+
+        query, values = mock_db.sql.call_args[0]
+        self.assertIn("email = %(email)s", query)
+        self.assertEqual(values["client_key"], hold.client_key)
+
+        mock_db.sql.return_value = [(1,)]
+        with patch('frappe.session', frappe._dict(user="Guest")):
+            hold.before_insert()
+        self.assertEqual(hold.status, "Active")
+
+
+class TestRegistrationFromHold(unittest.TestCase):
+    """Unit tests for registrations taking over a checkout hold."""
+
+    def make_registration(self):
+        from eventive.ticketing.doctype.event_registration.event_registration import EventRegistration
+
+        def attendee(ticket_type, price, merchandise):
+            row = frappe._dict(ticket_type=ticket_type, ticket_price=price)
+            row.get_merchandise_total = lambda: merchandise
+            return row
+
+        registration = EventRegistration.__new__(EventRegistration)
+        registration.__dict__.update({
+            "event": "EVT-1",
+            "checkout_hold": "HOLD-1",
+            "attendees": [attendee("TKT-VIP", 100, 25), attendee("TKT-VIP", 100, 0), attendee("TKT-STD", 40, 0)],
+        })
+        registration.get_doc_before_save = lambda: None
+        return registration
+
+    @patch(f'{REGISTRATION_MODULE}.release_seats')
+    @patch(f'{REGISTRATION_MODULE}.reserve_seats')
+    @patch(f'{REGISTRATION_MODULE}.convert_hold')
+    def test_validate_reserves_only_unheld_seats(self, mock_convert_hold, mock_reserve_seats, mock_release_seats):
+        """Test that held seats move over and only the remainder is reserved."""
+        mock_convert_hold.return_value = {"TKT-VIP": 2}
+
+        registration = self.make_registration()
+        registration.validate()
+
+        mock_convert_hold.assert_called_once_with("HOLD-1", "EVT-1")
+        mock_reserve_seats.assert_called_once_with("EVT-1", {"TKT-STD": 1})
+        mock_release_seats.assert_called_once_with("EVT-1", {})
+        self.assertEqual(registration.total_amount, 265)
+
+
+if __name__ == "__main__":
+    unittest.main()
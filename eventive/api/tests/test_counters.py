@@ -0,0 +1,140 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestEventCounters(unittest.TestCase):
+    """Unit tests for the realtime event counters."""
+
+    @patch('eventive.events.counters._apply')
+    @patch('frappe.db')
+    def test_increment_runs_after_commit(self, mock_db, mock_apply):
+        """Test that counter changes are merged and only applied after commit."""
+        from eventive.events.counters import increment
+
+        increment("EVT-1", issued={"TT-VIP": 2, "TT-STD": 1})
+
+        mock_apply.assert_not_called()
+        mock_db.after_commit.add.call_args.args[0]()
+        mock_apply.assert_called_once_with(
+            "EVT-1", {"tickets_issued": 3, "issued:TT-VIP": 2, "issued:TT-STD": 1}
+        )
+
+    @patch('frappe.enqueue')
+    @patch('frappe.publish_realtime')
+    @patch('frappe.cache')
+    def test_pushes_are_throttled(self, mock_cache, mock_publish, mock_enqueue):
+        """Test that a push inside the throttle window is deferred to a trailing push job."""
+        cache = MagicMock()
+        cache.set.return_value = None
+        cache.make_key.side_effect = lambda key: f"site|{key}"
+        cache.execute_command.return_value = 1
+        mock_cache.return_value = cache
+
+        from eventive.events.counters import push_counters
+
+        push_counters("EVT-1")
+
+        mock_publish.assert_not_called()
+        cache.execute_command.assert_called_once_with("SADD", "site|eventive:event_counters:pending", "EVT-1")
+        self.assertEqual(mock_enqueue.call_args[0][0], "eventive.events.counters.push_trailing_counters")
+        self.assertEqual(mock_enqueue.call_args[1]["event"], "EVT-1")
+        self.assertTrue(mock_enqueue.call_args[1]["deduplicate"])
+
+    @patch('eventive.events.counters.push_counters')
+    @patch('frappe.cache')
+    def test_pending_counters_are_popped_in_one_command(self, mock_cache, mock_push_counters):
+        """Test that the scheduled sweep pops a batch of events through the raw client."""
+        class Cache:
+            """Matches the RedisWrapper signatures the sweep may use."""
+
+            def __init__(self):
+                self.commands = []
+
+            def make_key(self, key):
+                return f"site|{key}"
+
+            def spop(self, name):
+                raise AssertionError("RedisWrapper.spop pops a single member of a prefixed key")
+
+            def execute_command(self, *args):
+                self.commands.append(args)
+                return [b"EVT-1", b"EVT-2"]
+
+        cache = Cache()
+        mock_cache.return_value = cache
+
+        from eventive.events.counters import push_pending_counters
+
+        push_pending_counters()
+
+        self.assertEqual(cache.commands, [("SPOP", "site|eventive:event_counters:pending", 1000)])
+        self.assertEqual([c.args[0] for c in mock_push_counters.call_args_list], ["EVT-1", "EVT-2"])
+
+    @patch('eventive.events.counters.time.sleep')
+    @patch('eventive.events.counters.push_counters')
+    @patch('frappe.cache')
+    def test_trailing_push_waits_for_the_window(self, mock_cache, mock_push_counters, mock_sleep):
+        """Test that the trailing push waits out the throttle and stops once nothing is pending."""
+        cache = MagicMock()
+        cache.execute_command.side_effect = [1500, 1, -2, 0]
+        mock_cache.return_value = cache
+
+        from eventive.events.counters import push_trailing_counters
+
+        push_trailing_counters("EVT-1")
+
+        mock_sleep.assert_called_once_with(1.5)
+        mock_push_counters.assert_called_once_with("EVT-1")
+
+    @patch('eventive.events.counters._read')
+    def test_counters_are_grouped_by_ticket_type(self, mock_read):
+        """Test that per ticket type fields are nested under ticket_types."""
+        mock_read.return_value = {
+            "registrations": 4, "tickets_issued": 5, "checked_in": 2,
+            "issued:TT-VIP": 2, "checked_in:TT-VIP": 2, "issued:TT-STD": 3,
+        }
+
+        from eventive.events.counters import get_counters
+
+        counters = get_counters("EVT-1")
+
+        self.assertEqual(counters["checked_in"], 2)
+        self.assertEqual(counters["ticket_types"]["TT-VIP"], {"issued": 2, "checked_in": 2})
+        self.assertEqual(counters["ticket_types"]["TT-STD"], {"issued": 3, "checked_in": 0})
+
+
+class TestTicketCheckInUndo(unittest.TestCase):
+    """Unit tests for check-in counters when staff edit a ticket."""
+
+    def _ticket(self, checked_in, changed=True):
+        from eventive.ticketing.doctype.event_ticket.event_ticket import EventTicket
+
+        ticket = EventTicket.__new__(EventTicket)
+        ticket.__dict__.update({"name": "TKT-1", "event": "EVT-1", "ticket_type": "TT-VIP", "checked_in": checked_in})
+        ticket.has_value_changed = lambda field: changed
+        return ticket
+
+    @patch('eventive.ticketing.doctype.event_ticket.event_ticket.forget_admission')
+    @patch('eventive.ticketing.doctype.event_ticket.event_ticket.increment')
+    def test_undo_check_in_decrements_counters(self, mock_increment, mock_forget):
+        """Test that unchecking a ticket takes it off the counters and the admission window."""
+        self._ticket(checked_in=0).on_update_after_submit()
+
+        mock_increment.assert_called_once_with("EVT-1", checked_in={"TT-VIP": -1})
+        mock_forget.assert_called_once_with("EVT-1", "TKT-1")
+
+    @patch('eventive.ticketing.doctype.event_ticket.event_ticket.forget_admission')
+    @patch('eventive.ticketing.doctype.event_ticket.event_ticket.increment')
+    def test_unrelated_edit_leaves_counters(self, mock_increment, mock_forget):
+        """Test that edits not touching checked_in do not move the counters."""
+        self._ticket(checked_in=1, changed=False).on_update_after_submit()
+
+        mock_increment.assert_not_called()
+        mock_forget.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
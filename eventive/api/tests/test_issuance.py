@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch, MagicMock
+
+
+class TestBulkTicketIssuance(unittest.TestCase):
+    """Unit tests for bulk ticket issuance."""
+
+    def _registration(self):
+        registration = MagicMock()
+        registration.name = "REG-00001"
+        registration.event = "EVT-1"
+        registration.attendees = [
+            frappe._dict({"name": "ATT-1", "email": "a@example.com", "full_name": "A",
+                          "ticket_type": "TKT-VIP", "merchandise": "MERCH-1"}),
+            frappe._dict({"name": "ATT-2", "email": "b@example.com", "full_name": "B",
+                          "ticket_type": "TKT-STD", "merchandise": None}),
+        ]
+        return registration
+
+    @patch('eventive.ticketing.issuance.get_ticket_token')
+    @patch('frappe.enqueue')
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_tickets_and_merchandise_bulk_inserted(self, mock_get_all, mock_db, mock_enqueue, mock_token):
+        """Test that tickets and merchandise rows are written with one insert each."""
+        mock_get_all.side_effect = [
+            [],  # Already issued tickets
+            [frappe._dict({"parent": "MERCH-1", "merchandise_item": "MER-1", "price": 10, "quantity": 2})],
+        ]
+
+        from eventive.ticketing.issuance import issue_tickets
+
+        tickets = issue_tickets(self._registration())
+
+        self.assertEqual(len(tickets), 2)
+        self.assertEqual(mock_get_all.call_count, 2)
+        doctypes = [call.args[0] for call in mock_db.bulk_insert.call_args_list]
+        self.assertEqual(doctypes, ["Event Ticket", "Event Ticket Merchandise"])
+        self.assertEqual(len(mock_db.bulk_insert.call_args_list[0].kwargs["values"]), 2)
+        mock_enqueue.assert_not_called()
+        self.assertEqual(mock_token.call_count, 2)
+
+    @patch('frappe.enqueue')
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_attendees_with_tickets_are_skipped(self, mock_get_all, mock_db, mock_enqueue):
+        """Test that re-saving a registration does not issue duplicate tickets."""
+        mock_get_all.return_value = ["ATT-1", "ATT-2"]
+
+        from eventive.ticketing.issuance import issue_tickets
+
+        self.assertEqual(issue_tickets(self._registration()), [])
+        mock_db.bulk_insert.assert_not_called()
+
+
+class TestIssuanceJob(unittest.TestCase):
+    """Unit tests for the ticket issuance job."""
+
+    @patch('eventive.ticketing.issuance.issue_tickets')
+    @patch('frappe.db')
+    @patch('frappe.get_doc')
+    def test_attendees_added_during_job_are_issued(self, mock_get_doc, mock_db, mock_issue_tickets):
+        """Test that the job checks again until every attendee has a ticket."""
+        mock_issue_tickets.side_effect = [["TKT-1", "TKT-2"], ["TKT-3"], []]
+
+        from eventive.ticketing.issuance import issue_registration_tickets
+
+        issue_registration_tickets("REG-00001")
+
+        self.assertEqual(mock_issue_tickets.call_count, 3)
+        self.assertEqual(mock_get_doc.call_count, 3)
+        mock_db.set_value.assert_called_with("Event Registration", "REG-00001", "issuance_status", "Issued", update_modified=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch
+
+
+class TestMatchLSH(unittest.TestCase):
+    """Unit tests for the MinHash LSH match index."""
+
+    def setUp(self):
+        self.features = [
+            {f"interest:{word}": 1.0 for word in ("python", "rust", "go", "ml", "cloud")},
+            {f"interest:{word}": 1.0 for word in ("python", "rust", "go", "ml", "cloud", "security")},
+            {f"interest:{word}": 1.0 for word in ("gardening", "cooking")},
+            {},
+        ]
+
+    def test_signatures(self):
+        """Test that signatures are stable and profiles without features get none."""
+        from eventive.networking.lsh import NUM_PERM, get_signatures
+
+        first = get_signatures(self.features)
+        second = get_signatures(self.features)
+
+        self.assertEqual(len(first[0]), NUM_PERM)
+        self.assertTrue((first[0] == second[0]).all())
+        self.assertIsNone(first[3])
+
+    def test_similar_profiles_share_buckets(self):
+        """Test that near-identical interest sets land in a shared bucket and unrelated ones do not."""
+        from eventive.networking.lsh import get_buckets, get_signatures
+
+        signatures = get_signatures(self.features)
+        buckets = [set(get_buckets("EVT-001", signature)) for signature in signatures[:3]]
+
+        self.assertTrue(buckets[0] & buckets[1])
+        self.assertFalse(buckets[0] & buckets[2])
+
+    def test_candidate_matches(self):
+        """Test that only rows sharing a bucket are scored."""
+        from eventive.networking.lsh import candidate_matches, get_signatures
+        from eventive.networking.matchmaking import build_matrix
+
+        matrix = build_matrix(self.features)
+        matches = {(i, j) for i, j, _ in candidate_matches(matrix, get_signatures(self.features))}
+
+        self.assertEqual(matches, {(0, 1), (1, 0)})
+
+    def test_get_nearest(self):
+        """Test that candidates from the index are ranked by estimated similarity."""
+        from eventive.networking.lsh import encode, get_nearest, get_signatures
+
+        signatures = get_signatures(self.features)
+        candidates = [("AP-3", encode(signatures[2]), 1), ("AP-2", encode(signatures[1]), 4)]
+
+        with patch("frappe.db") as db:
+            db.sql.return_value = candidates
+            nearest = get_nearest("EVT-001", "AP-1", signature=signatures[0])
+
+        self.assertEqual(nearest[0][0], "AP-2")
+        self.assertGreater(nearest[0][1], 50)
+        self.assertNotIn("AP-3", [name for name, _ in nearest])
+
+
+if __name__ == "__main__":
+    unittest.main()
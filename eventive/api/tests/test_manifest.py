@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import gzip
+import json
+import unittest
+from unittest.mock import patch
+
+
+class TestCheckInManifest(unittest.TestCase):
+    """Unit tests for the offline check-in manifest."""
+
+    @patch('eventive.ticketing.manifest.MANIFEST_CHUNK_SIZE', 2)
+    @patch('frappe.db')
+    def test_manifest_is_gzipped_json_built_in_chunks(self, mock_db):
+        """Test that the manifest pages through tickets and decompresses to JSON."""
+        mock_db.sql.side_effect = [
+            [["TKT-1", "TT-VIP", "VIP", "Valid", 0], ["TKT-2", "TT-STD", "Standard", "Valid", 1]],
+            [["TKT-3", "TT-STD", "Standard", "Invalid", 0]],
+        ]
+
+        from eventive.ticketing.manifest import build_manifest
+
+        manifest = build_manifest("EVT-1")
+        data = json.loads(gzip.decompress(manifest["data"]))
+
+        self.assertEqual(data["event"], "EVT-1")
+        self.assertEqual(data["columns"][0], "ticket")
+        self.assertEqual([row[0] for row in data["tickets"]], ["TKT-1", "TKT-2", "TKT-3"])
+        self.assertEqual(mock_db.sql.call_args_list[1].args[1]["after"], "TKT-2")
+
+    @patch('eventive.ticketing.manifest.now_datetime')
+    @patch('frappe.db')
+    def test_etag_only_changes_with_tickets(self, mock_db, mock_now):
+        """Test that rebuilding an unchanged manifest keeps its ETag."""
+        from datetime import datetime
+        from eventive.ticketing.manifest import build_manifest
+
+        rows = [["TKT-1", "TT-VIP", "VIP", "Valid", 0]]
+        mock_db.sql.return_value = rows
+
+        mock_now.return_value = datetime(2026, 11, 2, 9, 0)
+        first = build_manifest("EVT-1")
+        mock_now.return_value = datetime(2026, 11, 2, 9, 1)
+        second = build_manifest("EVT-1")
+
+        mock_db.sql.return_value = [["TKT-1", "TT-VIP", "VIP", "Valid", 1]]
+        checked_in = build_manifest("EVT-1")
+
+        self.assertNotEqual(first["generated_at"], second["generated_at"])
+        self.assertEqual(first["etag"], second["etag"])
+        self.assertNotEqual(first["etag"], checked_in["etag"])
+
+    @patch('eventive.ticketing.manifest.MAX_CHANGES', 1)
+    @patch('frappe.db')
+    def test_large_delta_asks_for_full_sync(self, mock_db):
+        """Test that a device too far behind is told to download the manifest again."""
+        mock_db.sql.return_value = [["TKT-1"], ["TKT-2"]]
+
+        from eventive.ticketing.manifest import get_changes
+
+        self.assertTrue(get_changes("EVT-1", "2026-11-02 09:00:00")["full_sync"])
+
+
+    @patch('frappe.db')
+    def test_changes_overlap_the_last_sync(self, mock_db):
+        """Test that tickets committed late after the last sync are sent again."""
+        from datetime import datetime
+        from eventive.ticketing.manifest import get_changes
+
+        mock_db.sql.return_value = [["TKT-1", "TT-VIP", "VIP", "Cancelled", 0]]
+
+        changes = get_changes("EVT-1", "2026-11-02 09:00:00")
+
+        self.assertEqual(changes["tickets"][0][0], "TKT-1")
+        self.assertEqual(mock_db.sql.call_args.args[1]["since"], datetime(2026, 11, 2, 8, 59))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+def profile(name, interests, company=None, job_title=None):
+    return frappe._dict({
+        "name": name,
+        "interests": interests,
+        "company": company,
+        "job_title": job_title,
+    })
+
+
+class TestMatchmaking(unittest.TestCase):
+    """Unit tests for batch match suggestions."""
+
+    def setUp(self):
+        self.profiles = [
+            profile("AP-1", ["Python", "Machine Learning"], "Acme", "Data Engineer"),
+            profile("AP-2", ["python", "Machine learning", "Rust"], "Acme"),
+            profile("AP-3", ["Gardening"], job_title="Chef"),
+            profile("AP-4", ["Rust"], job_title="Data Scientist"),
+        ]
+
+    def test_features(self):
+        """Test that interests, company and job title words become features."""
+        from eventive.networking.matchmaking import get_features
+
+        features = get_features(self.profiles[0])
+
+        self.assertEqual(features["interest:machine learning"], 1.0)
+        self.assertEqual(features["company:acme"], 0.5)
+        self.assertIn("title:engineer", features)
+
+    def test_top_matches(self):
+        """Test that the most similar attendees are matched and unrelated ones are not."""
+        from eventive.networking.matchmaking import build_matrix, get_features, top_matches
+
+        matrix = build_matrix([get_features(p) for p in self.profiles])
+        matches = {}
+        for i, j, score in top_matches(matrix, k=1):
+            matches[self.profiles[i].name] = (self.profiles[j].name, score)
+
+        self.assertEqual(matches["AP-1"][0], "AP-2")
+        self.assertEqual(matches["AP-2"][0], "AP-1")
+        self.assertNotIn("AP-3", matches)
+        self.assertTrue(0 < matches["AP-1"][1] <= 100)
+
+    def test_decided_pairs_are_not_suggested_again(self):
+        """Test that connected or ignored pairs are left out of new suggestions."""
+        from eventive.networking import matchmaking
+
+        with patch("frappe.db") as db, patch("frappe.cache"), \
+                patch.object(matchmaking, "get_profiles", return_value=self.profiles), \
+                patch.object(matchmaking, "get_decided_pairs", return_value={("AP-1", "AP-2")}), \
+                patch.object(matchmaking, "delete_suggestions"), \
+                patch.object(matchmaking.lsh, "save_index"), \
+                patch.object(matchmaking, "insert_suggestions") as insert_suggestions:
+            db.get_value.return_value = 1
+            result = matchmaking.generate_matches("EVT-001")
+
+        pairs = dict(insert_suggestions.call_args[0][1])
+        self.assertNotIn(("AP-1", "AP-2"), pairs)
+        self.assertIn(("AP-2", "AP-4"), pairs)
+        self.assertEqual(result["suggestions"], len(pairs))
+
+
+    def test_old_suggestions_deleted_after_insert(self):
+        """Test that the previous run's rows stay until every new row is written."""
+        from eventive.networking import matchmaking
+
+        calls = MagicMock()
+        with patch("frappe.db") as db, patch("frappe.cache"), \
+                patch.object(matchmaking, "get_profiles", return_value=self.profiles), \
+                patch.object(matchmaking, "get_decided_pairs", return_value=set()), \
+                patch.object(matchmaking.lsh, "save_index"), \
+                patch.object(matchmaking, "insert_suggestions", calls.insert_suggestions), \
+                patch.object(matchmaking, "delete_suggestions", calls.delete_suggestions):
+            db.get_value.return_value = 1
+            matchmaking.generate_matches("EVT-001")
+
+        self.assertEqual([c[0] for c in calls.method_calls], ["insert_suggestions", "delete_suggestions"])
+        self.assertIn("before", calls.delete_suggestions.call_args[1])
+
+class TestProfileMatchUpdates(unittest.TestCase):
+    """Unit tests for incremental match updates."""
+
+    def profile_doc(self, interests, before_interests, changed=False):
+        doc = MagicMock(doctype="Attendee Profile")
+        doc.name = "AP-1"
+        doc.interests = [frappe._dict(interest=i) for i in interests]
+        doc.has_value_changed.return_value = changed
+        before = MagicMock()
+        before.interests = [frappe._dict(interest=i) for i in before_interests]
+        doc.get_doc_before_save.return_value = before
+        return doc
+
+    def test_unrelated_edit_is_ignored(self):
+        """Test that edits not touching match fields do not queue a recompute."""
+        from eventive.networking.matchmaking import queue_profile_update
+
+        with patch("frappe.enqueue") as enqueue:
+            queue_profile_update(self.profile_doc(["Python", "Rust"], ["Rust", "Python"]))
+
+        enqueue.assert_not_called()
+
+    def test_interest_change_is_queued_per_profile(self):
+        """Test that an interest change queues one deduplicated job for the profile."""
+        from eventive.networking.matchmaking import queue_profile_update
+
+        with patch("frappe.enqueue") as enqueue:
+            queue_profile_update(self.profile_doc(["Python", "Go"], ["Python"]))
+
+        enqueue.assert_called_once()
+        self.assertEqual(enqueue.call_args[1]["job_id"], "eventive::update_profile_matches::AP-1")
+        self.assertTrue(enqueue.call_args[1]["deduplicate"])
+
+    def test_patch_profile_matches(self):
+        """Test that only the changed profile's re-scored pairs are rewritten."""
+        from eventive.networking import matchmaking
+
+        profiles = [
+            profile("AP-1", ["Python", "Machine Learning"]),
+            profile("AP-2", ["Python", "Machine Learning"]),
+            profile("AP-3", ["Python"]),
+            profile("AP-4", ["Python", "Gardening", "Cooking"]),
+        ]
+        idf = matchmaking.get_idf([matchmaking.get_features(p) for p in profiles])
+
+        def get_profiles(event, names=None):
+            return [p for p in profiles if p.name in names]
+
+        with patch("frappe.db") as db, patch("frappe.cache") as cache, \
+                patch.object(matchmaking, "TOP_K", 1), \
+                patch.object(matchmaking, "get_profiles", side_effect=get_profiles), \
+                patch.object(matchmaking, "get_decided_pairs", return_value={("AP-1", "AP-3")}), \
+                patch.object(matchmaking.lsh, "delete_index"), \
+                patch.object(matchmaking.lsh, "insert_signatures"), \
+                patch.object(matchmaking.lsh, "get_nearest", return_value=[("AP-2", 100), ("AP-3", 50)]), \
+                patch.object(matchmaking, "insert_suggestions") as insert_suggestions:
+            # AP-4 has AP-1 in its own top K
+            db.sql_list.return_value = ["AP-4"]
+            cache.return_value.get_value.return_value = idf
+            written = matchmaking.patch_profile_matches("EVT-001", "AP-1")
+
+        deleted = [c[0][1] for c in db.delete.call_args_list]
+        self.assertEqual(len(deleted), 2)
+        self.assertEqual(deleted[0]["attendee_1"], "AP-1")
+        self.assertEqual(deleted[0]["attendee_2"], ["in", ["AP-2", "AP-3", "AP-4"]])
+        self.assertEqual(deleted[1]["attendee_2"], "AP-1")
+
+        pairs = dict(insert_suggestions.call_args[0][1])
+        self.assertEqual(sorted(pairs), [("AP-1", "AP-2"), ("AP-1", "AP-4")])
+        self.assertEqual(pairs[("AP-1", "AP-2")], 100)
+        self.assertEqual(written, 2)
+
+    def test_edits_during_update_run_again(self):
+        """Test that the job runs again when the profile changed while it ran."""
+        from datetime import timedelta
+        from frappe.utils import now_datetime
+        from eventive.networking import matchmaking
+
+        later = now_datetime() + timedelta(minutes=1)
+
+        with patch("frappe.db") as db, \
+                patch.object(matchmaking, "get_profile_events", return_value=["EVT-001"]), \
+                patch.object(matchmaking, "patch_profile_matches") as patch_profile_matches:
+            db.get_value.side_effect = ["a@example.com", later, "a@example.com", None]
+            matchmaking.update_profile_matches("AP-1")
+
+        self.assertEqual(patch_profile_matches.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -85,14 +85,15 @@ class TestNetworking(unittest.TestCase):
             "open_to_networking": 1
         }
         mock_interests = [
-            {"interest": "Python"},
-            {"interest": "Machine Learning"}
+            {"parent": "profile-789", "interest": "Python"},
+            {"parent": "profile-789", "interest": "Machine Learning"}
         ]
         
         mock_get_all.side_effect = [
             [mock_user_profile],  # User profile
-            [mock_match],  # Match suggestions
-            [mock_other_profile],  # Other attendee profile
+            [mock_match],  # Match suggestions as attendee_1
+            [],  # Match suggestions as attendee_2
+            [mock_other_profile],  # Other attendee profiles
             mock_interests  # Interests
         ]
         
@@ -115,7 +116,8 @@ class TestNetworking(unittest.TestCase):
         
         mock_get_all.side_effect = [
             [mock_user_profile],  # User profile
-            [],  # No matches for specific event
+            [],  # No matches for specific event as attendee_1
+            [],  # No matches for specific event as attendee_2
         ]
         
         from eventive.api.networking import get_matches
@@ -126,6 +128,35 @@ class TestNetworking(unittest.TestCase):
         call_args = mock_get_all.call_args_list
         self.assertEqual(call_args[1][1]["filters"]["event"], "event-002")
 
+    @patch('frappe.session')
+    @patch('frappe.get_all')
+    def test_get_matches_paginates(self, mock_get_all, mock_session):
+        """Test that matches from both sides are merged by score and paginated."""
+        mock_session.user = "testuser@example.com"
+        
+        def match(name, score, attendee_1, attendee_2):
+            return {"name": name, "attendee_1": attendee_1, "attendee_2": attendee_2,
+                    "event": "event-001", "match_score": score, "status": "Suggested"}
+        
+        mock_get_all.side_effect = [
+            [{"name": "profile-123", "open_to_networking": 1}],  # User profile
+            [match("match-1", 90, "profile-123", "profile-a"), match("match-3", 50, "profile-123", "profile-c")],
+            [match("match-2", 70, "profile-b", "profile-123")],
+            [{"name": "profile-a", "open_to_networking": 1}, {"name": "profile-b", "open_to_networking": 1}],
+            [],  # Interests
+        ]
+        
+        from eventive.api.networking import get_matches
+        
+        result = get_matches(limit=2)
+        
+        self.assertEqual([row["match_id"] for row in result["data"]], ["match-1", "match-2"])
+        self.assertEqual(result["data"][1]["attendee_2"]["name"], "profile-b")
+        self.assertIsNotNone(result["next_cursor"])
+        self.assertEqual(mock_get_all.call_args_list[1][1]["filters"]["attendee_1"], "profile-123")
+        self.assertEqual(mock_get_all.call_args_list[2][1]["filters"]["attendee_2"], "profile-123")
+        self.assertEqual(mock_get_all.call_args_list[1][1]["limit_page_length"], 3)
+
     @patch('frappe.session')
     @patch('frappe.get_all')
     def test_get_connected_matches(self, mock_get_all, mock_session):
@@ -154,14 +185,15 @@ class TestNetworking(unittest.TestCase):
             "open_to_networking": 1
         }
         mock_interests = [
-            {"interest": "Networking"},
-            {"interest": "Business"}
+            {"parent": "profile-connected", "interest": "Networking"},
+            {"parent": "profile-connected", "interest": "Business"}
         ]
         
         mock_get_all.side_effect = [
             [mock_user_profile],  # User profile
-            [mock_connected_match],  # Connected matches
-            [mock_connected_profile],  # Connected attendee profile
+            [mock_connected_match],  # Connected matches as attendee_1
+            [],  # Connected matches as attendee_2
+            [mock_connected_profile],  # Connected attendee profiles
             mock_interests  # Interests
         ]
         
@@ -206,12 +238,26 @@ class TestSendMessage(unittest.TestCase):
 
     @patch('frappe.session')
     @patch('frappe.get_all')
+    def test_send_message_to_self(self, mock_get_all, mock_session):
+        """Test that users cannot message themselves."""
+        mock_session.user = "testuser@example.com"
+        
+        from eventive.api.networking import send_message
+        
+        with self.assertRaises(frappe.ValidationError):
+            send_message(receiver_id="testuser@example.com", message="Hello!")
+        mock_get_all.assert_not_called()
+
+    @patch('eventive.networking.unread.deliver')
+    @patch('frappe.session')
+    @patch('frappe.get_all')
+    @patch('frappe.get_value')
     @patch('frappe.get_doc')
-    def test_send_message_success(self, mock_get_doc, mock_get_all, mock_session):
+    def test_send_message_success(self, mock_get_doc, mock_get_value, mock_get_all, mock_session, mock_deliver):
         """Test successful message sending."""
         mock_session.user = "testuser@example.com"
         
-        mock_get_all.return_value = [{"name": "profile-123", "full_name": "Test User"}]
+        mock_get_all.return_value = [frappe._dict({"name": "profile-123", "full_name": "Test User"})]
         mock_get_value.return_value = "Receiver Name"
         
         # Mock the created document
@@ -227,6 +273,8 @@ class TestSendMessage(unittest.TestCase):
         self.assertEqual(result["message_id"], "msg-001")
         self.assertEqual(result["event_id"], "event-001")
         self.assertEqual(result["message"], "Hello, World!")
+        self.assertEqual(mock_get_doc.call_args[0][0]["event"], "event-001")
+        mock_deliver.assert_called_once_with(mock_msg)
 
 
 class TestGetMessages(unittest.TestCase):
@@ -299,6 +347,40 @@ class TestGetMessages(unittest.TestCase):
         self.assertEqual(result[0]["is_read"], True)
         self.assertEqual(result[1]["is_read"], False)
 
+    @patch('frappe.session')
+    @patch('frappe.db')
+    @patch('frappe.get_all')
+    def test_get_messages_before_cursor(self, mock_get_all, mock_db, mock_session):
+        """Test that older pages are read by keyset on the conversation key."""
+        from eventive.api.networking import get_messages
+        from eventive.networking.doctype.networking_message.networking_message import get_conversation_key
+
+        mock_session.user = "testuser@example.com"
+        conversation = get_conversation_key("other@example.com", "testuser@example.com")
+        mock_db.get_value.return_value = frappe._dict(conversation=conversation, creation="2024-01-15 10:00:00")
+        mock_get_all.return_value = []
+
+        get_messages(other_user_id="other@example.com", before="msg-050", limit=30)
+
+        kwargs = mock_get_all.call_args[1]
+        self.assertIn(["conversation", "=", conversation], kwargs["filters"])
+        self.assertIn(["creation", "<=", "2024-01-15 10:00:00"], kwargs["filters"])
+        self.assertEqual(kwargs["or_filters"], [["creation", "<", "2024-01-15 10:00:00"], ["name", "<", "msg-050"]])
+        self.assertEqual(kwargs["order_by"], "creation desc, name desc")
+        self.assertEqual(kwargs["limit_page_length"], 30)
+
+    @patch('frappe.session')
+    @patch('frappe.db')
+    def test_get_messages_cursor_from_other_conversation(self, mock_db, mock_session):
+        """Test that a cursor from another conversation is rejected."""
+        from eventive.api.networking import get_messages
+
+        mock_session.user = "testuser@example.com"
+        mock_db.get_value.return_value = frappe._dict(conversation="other", creation="2024-01-15 10:00:00")
+
+        with self.assertRaises(frappe.ValidationError):
+            get_messages(other_user_id="other@example.com", before="msg-050")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,66 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch
+
+
+class TestKeysetPagination(unittest.TestCase):
+    """Unit tests for keyset pagination helpers."""
+
+    def setUp(self):
+        self.rows = [
+            frappe._dict({"name": "EVT-3", "start_date": "2026-03-01", "event_name": "C"}),
+            frappe._dict({"name": "EVT-1", "start_date": "2026-01-01", "event_name": "A"}),
+            frappe._dict({"name": "EVT-2", "start_date": "2026-01-01", "event_name": "B"}),
+        ]
+
+    def _sort_key(self, row):
+        return [row.start_date, row.name]
+
+    def test_paginate_rows_walks_all_pages(self):
+        """Test that following next_cursor returns every row exactly once in order."""
+        from eventive.utils.pagination import paginate_rows
+
+        seen = []
+        cursor = None
+        while True:
+            page = paginate_rows(self.rows, ["name"], self._sort_key, cursor=cursor, limit=2)
+            seen.extend(row.name for row in page["data"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+
+        self.assertEqual(seen, ["EVT-1", "EVT-2", "EVT-3"])
+
+    def test_select_fields_rejects_unknown_fields(self):
+        """Test that fields outside the allowed set are rejected."""
+        from eventive.utils.pagination import select_fields
+
+        with self.assertRaises(frappe.ValidationError):
+            select_fields(["name", "budget"], ["name", "event_name"])
+
+    def test_select_fields_always_includes_name(self):
+        """Test that projections always carry the name used by the cursor."""
+        from eventive.utils.pagination import select_fields
+
+        self.assertEqual(select_fields("event_name", ["name", "event_name"]), ["name", "event_name"])
+
+    @patch('frappe.get_all')
+    def test_paginate_query_applies_keyset_filters(self, mock_get_all):
+        """Test that the cursor is turned into a keyset condition on the query."""
+        from eventive.utils.pagination import encode_cursor, paginate_query
+
+        mock_get_all.return_value = []
+
+        paginate_query("Speaker", ["name"], "full_name", cursor=encode_cursor(["Ada", "SPK-00001"]), limit=10)
+
+        kwargs = mock_get_all.call_args.kwargs
+        self.assertIn(["full_name", ">=", "Ada"], kwargs["filters"])
+        self.assertEqual(kwargs["or_filters"], [["full_name", ">", "Ada"], ["name", ">", "SPK-00001"]])
+        self.assertEqual(kwargs["limit_page_length"], 11)
+
+
+if __name__ == "__main__":
+    unittest.main()
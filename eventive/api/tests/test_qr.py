@@ -0,0 +1,80 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+@patch('eventive.ticketing.qr.get_encryption_key', return_value="secret")
+class TestTicketQR(unittest.TestCase):
+    """Unit tests for on-demand ticket QR rendering."""
+
+    def setUp(self):
+        from eventive.ticketing.qr import _get_image
+
+        _get_image.cache_clear()
+
+    def test_token_round_trip(self, mock_key):
+        """Test that a signed token resolves back to its ticket."""
+        from eventive.ticketing.qr import get_qr_token, verify_qr_token
+
+        self.assertEqual(verify_qr_token(get_qr_token("TKT-0001")), "TKT-0001")
+
+    def test_tampered_token_is_rejected(self, mock_key):
+        """Test that a token signed for one ticket cannot name another."""
+        from eventive.ticketing.qr import get_qr_token, verify_qr_token
+
+        signature = get_qr_token("TKT-0001").rpartition(".")[2]
+
+        with self.assertRaises(frappe.PermissionError):
+            verify_qr_token(f"TKT-0002.{signature}")
+        with self.assertRaises(frappe.PermissionError):
+            verify_qr_token("TKT-0001")
+
+    @patch('eventive.ticketing.qr.render_qr')
+    @patch('frappe.db')
+    @patch('frappe.cache')
+    def test_rendered_image_is_cached(self, mock_cache, mock_db, mock_render, mock_key):
+        """Test that a ticket's token is rendered once and then served from Redis."""
+        mock_db.get_value.return_value = "signed.token"
+        cache = MagicMock()
+        cache.get_value.return_value = None
+        mock_cache.return_value = cache
+        mock_render.return_value = b"<svg/>"
+
+        from eventive.ticketing.qr import _get_image, get_qr_image, get_qr_token
+
+        image, content_type, etag = get_qr_image(get_qr_token("TKT-0001"), "svg")
+
+        self.assertEqual(image, b"<svg/>")
+        self.assertEqual(content_type, "image/svg+xml")
+        mock_render.assert_called_once_with("signed.token", "svg")
+        cache.set_value.assert_called_once()
+
+        # Another process finds the image in Redis
+        _get_image.cache_clear()
+        cache.get_value.return_value = cache.set_value.call_args.args[1]
+        mock_render.reset_mock()
+
+        self.assertEqual(get_qr_image(get_qr_token("TKT-0001"), "svg")[2], etag)
+        mock_render.assert_not_called()
+
+    @patch('eventive.ticketing.qr.render_qr', return_value=b"<svg/>")
+    @patch('frappe.db')
+    @patch('frappe.cache')
+    def test_process_cache_is_checked_before_redis(self, mock_cache, mock_db, mock_render, mock_key):
+        """Test that an image this process has served skips the Redis round trip."""
+        mock_cache.return_value.get_value.return_value = None
+
+        from eventive.ticketing.qr import get_qr_image, get_qr_token
+
+        first = get_qr_image(get_qr_token("TKT-0001"), "svg")
+        mock_cache.return_value.get_value.reset_mock()
+
+        self.assertEqual(get_qr_image(get_qr_token("TKT-0001"), "svg"), first)
+        mock_cache.return_value.get_value.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from datetime import date, datetime
+from unittest.mock import patch
+
+
+def row(session, start, end):
+    return frappe._dict({
+        "event_session": session,
+        "session_title": session,
+        "start_time": datetime(2026, 11, 2, *start),
+        "end_time": datetime(2026, 11, 2, *end),
+    })
+
+
+class TestScheduleConflicts(unittest.TestCase):
+    """Unit tests for schedule conflict detection and free slots."""
+
+    def _schedule(self, rows):
+        from eventive.personalized.doctype.attendee_schedule.attendee_schedule import AttendeeSchedule
+
+        schedule = AttendeeSchedule()
+        schedule.booked_sessions = rows
+        schedule.sort_sessions()
+        return schedule
+
+    def test_find_conflict(self):
+        """Test that overlaps are found and back to back sessions are allowed."""
+        schedule = self._schedule([
+            row("SES-3", (14, 0), (15, 0)),
+            row("SES-1", (9, 0), (10, 0)),
+            row("SES-2", (11, 0), (12, 0)),
+        ])
+
+        self.assertEqual([r.event_session for r in schedule.booked_sessions], ["SES-1", "SES-2", "SES-3"])
+        self.assertEqual(schedule.find_conflict("2026-11-02 11:30:00", "2026-11-02 13:00:00").event_session, "SES-2")
+        self.assertIsNone(schedule.find_conflict("2026-11-02 10:00:00", "2026-11-02 11:00:00"))
+        self.assertIsNone(schedule.find_conflict("2026-11-02 15:00:00", "2026-11-02 16:00:00"))
+
+    def test_overlapping_rows_are_flagged(self):
+        """Test that rows overlapping an earlier row are marked on save."""
+        schedule = self._schedule([
+            row("SES-1", (9, 0), (12, 0)),
+            row("SES-2", (10, 0), (11, 0)),
+            row("SES-3", (11, 30), (13, 0)),
+        ])
+        schedule.flag_conflicts()
+
+        self.assertEqual([r.conflicts_with for r in schedule.booked_sessions], [None, "SES-1", "SES-1"])
+
+    def test_find_conflict_behind_overlapping_rows(self):
+        """Test that a long session is found even when shorter rows start after it."""
+        schedule = self._schedule([
+            row("SES-1", (9, 0), (13, 0)),
+            row("SES-2", (10, 0), (10, 30)),
+            row("SES-3", (11, 0), (11, 30)),
+        ])
+        schedule.flag_conflicts()
+
+        self.assertEqual(schedule.find_conflict("2026-11-02 12:00:00", "2026-11-02 14:00:00").event_session, "SES-1")
+        self.assertIsNone(schedule.find_conflict("2026-11-02 13:00:00", "2026-11-02 14:00:00"))
+
+    @patch('frappe.get_all')
+    @patch('frappe.db')
+    def test_free_slots_are_gaps_between_bookings(self, mock_db, mock_get_all):
+        """Test that free slots cover the day minus booked sessions."""
+        mock_db.get_value.side_effect = [date(2026, 11, 2), "SCH-1"]
+        mock_get_all.side_effect = [
+            [
+                frappe._dict(row("SES-1", (9, 0), (10, 0)), name="SES-1", allow_booking=1, is_booked=0),
+                frappe._dict(row("SES-2", (10, 0), (11, 0)), name="SES-2", allow_booking=1, is_booked=0),
+                frappe._dict(row("SES-3", (16, 0), (17, 0)), name="SES-3", allow_booking=1, is_booked=1),
+            ],
+            [row("SES-2", (10, 0), (11, 0))],
+        ]
+
+        from eventive.personalized.session_booking import get_free_slots
+
+        slots = get_free_slots("a@example.com", "EVT-1", 1)
+
+        self.assertEqual([(s["start"], s["end"]) for s in slots], [
+            ("2026-11-02 09:00:00", "2026-11-02 10:00:00"),
+            ("2026-11-02 11:00:00", "2026-11-02 17:00:00"),
+        ])
+        self.assertEqual([s["name"] for s in slots[1]["sessions"]], ["SES-3"])
+        self.assertFalse(slots[1]["sessions"][0]["bookable"])
+
+
+if __name__ == "__main__":
+    unittest.main()
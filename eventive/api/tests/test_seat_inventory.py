@@ -0,0 +1,78 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch
+
+
+class TestSeatInventory(unittest.TestCase):
+    """Unit tests for the seat inventory ledger."""
+
+    @patch('eventive.ticketing.doctype.seat_inventory.seat_inventory._adjust')
+    @patch('eventive.ticketing.doctype.seat_inventory.seat_inventory._try_claim')
+    def test_reserve_claims_event_and_ticket_types(self, mock_try_claim, mock_adjust):
+        """Test that a reservation claims the event row and each ticket type row."""
+        mock_try_claim.return_value = True
+
+        from eventive.ticketing.doctype.seat_inventory.seat_inventory import reserve_seats
+
+        reserve_seats("EVT-1", {"TKT-VIP": 2, "TKT-STD": 1})
+
+        claimed = [call.args for call in mock_try_claim.call_args_list]
+        self.assertEqual(claimed, [("EVT-1", 3), ("TKT-VIP", 2), ("TKT-STD", 1)])
+        mock_adjust.assert_not_called()
+
+    @patch('frappe.db')
+    @patch('eventive.ticketing.doctype.seat_inventory.seat_inventory._adjust')
+    @patch('eventive.ticketing.doctype.seat_inventory.seat_inventory._try_claim')
+    def test_failed_claim_releases_earlier_claims(self, mock_try_claim, mock_adjust, mock_db):
+        """Test that a sold-out ticket type hands back the seats already claimed."""
+        mock_try_claim.side_effect = [True, False]
+        mock_db.exists.return_value = True
+
+        from eventive.ticketing.doctype.seat_inventory.seat_inventory import reserve_seats
+
+        with self.assertRaises(frappe.ValidationError):
+            reserve_seats("EVT-1", {"TKT-VIP": 2})
+
+        mock_adjust.assert_called_once_with("EVT-1", reserved=-2)
+
+    @patch('eventive.ticketing.doctype.seat_inventory.seat_inventory._adjust')
+    def test_commit_moves_reserved_to_sold(self, mock_adjust):
+        """Test that committing moves seats from reserved to sold on every row."""
+        from eventive.ticketing.doctype.seat_inventory.seat_inventory import commit_seats
+
+        commit_seats("EVT-1", {"TKT-VIP": 1, None: 1})
+
+        mock_adjust.assert_any_call("EVT-1", reserved=-2, sold=2)
+        mock_adjust.assert_any_call("TKT-VIP", reserved=-1, sold=1)
+        self.assertEqual(mock_adjust.call_count, 2)
+
+
+    @patch('frappe.db')
+    def test_event_rename_moves_inventory_row(self, mock_db):
+        """Test that renaming an event carries its inventory row over instead of orphaning it."""
+        from eventive.ticketing.doctype.seat_inventory.seat_inventory import rename_inventory
+
+        rename_inventory(frappe._dict(name="EVT-NEW"), "after_rename", "EVT-OLD", "EVT-NEW", False)
+
+        query, values = mock_db.sql.call_args.args
+        self.assertIn("SET name = %(new)s", query)
+        self.assertEqual(values, {"old": "EVT-OLD", "new": "EVT-NEW", "event": "EVT-NEW"})
+
+    @patch('frappe.db')
+    def test_event_merge_adds_seats_to_existing_row(self, mock_db):
+        """Test that merging into an event with an inventory adds the seats and drops the old row."""
+        mock_db.exists.return_value = True
+
+        from eventive.ticketing.doctype.seat_inventory.seat_inventory import rename_inventory
+
+        rename_inventory(frappe._dict(name="EVT-NEW"), "after_rename", "EVT-OLD", "EVT-NEW", True)
+
+        self.assertIn("target.sold + source.sold", mock_db.sql.call_args.args[0])
+        mock_db.delete.assert_called_once_with("Seat Inventory", {"name": "EVT-OLD"})
+
+
+if __name__ == "__main__":
+    unittest.main()
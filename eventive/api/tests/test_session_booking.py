@@ -0,0 +1,90 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestSessionBooking(unittest.TestCase):
+    """Unit tests for session booking."""
+
+    def _session(self, **kwargs):
+        session = {"name": "SES-1", "event": "EVT-1", "session_title": "Keynote", "allow_booking": 1, "capacity": 100}
+        session.update(kwargs)
+        return frappe._dict(session)
+
+    @patch('eventive.personalized.session_booking.claim_seat')
+    @patch('eventive.personalized.session_booking.get_schedule')
+    @patch('eventive.personalized.session_booking.check_ticket')
+    @patch('eventive.personalized.session_booking.get_session')
+    @patch('frappe.db')
+    def test_seat_is_claimed_after_schedule_is_saved(self, mock_db, mock_session, mock_ticket, mock_schedule, mock_claim):
+        """Test that the hot session row is only locked at the end of the booking."""
+        mock_session.return_value = self._session()
+        schedule = MagicMock()
+        schedule.booked_sessions = []
+        schedule.find_conflict.return_value = None
+        mock_schedule.return_value = schedule
+
+        calls = []
+        schedule.save.side_effect = lambda **kwargs: calls.append("save")
+        mock_claim.side_effect = lambda session: calls.append("claim")
+
+        from eventive.personalized.session_booking import book_session
+
+        book_session("SES-1", "a@example.com")
+
+        self.assertEqual(calls, ["save", "claim"])
+        mock_schedule.assert_called_once_with("a@example.com", "EVT-1", for_update=True)
+
+    @patch('eventive.personalized.session_booking.claim_seat')
+    @patch('eventive.personalized.session_booking.get_schedule')
+    @patch('eventive.personalized.session_booking.check_ticket')
+    @patch('eventive.personalized.session_booking.get_session')
+    def test_booking_twice_does_not_take_another_seat(self, mock_session, mock_ticket, mock_schedule, mock_claim):
+        """Test that re-booking a booked session is a no-op."""
+        mock_session.return_value = self._session()
+        schedule = MagicMock()
+        schedule.booked_sessions = [frappe._dict({"event_session": "SES-1"})]
+        mock_schedule.return_value = schedule
+
+        from eventive.personalized.session_booking import book_session
+
+        book_session("SES-1", "a@example.com")
+
+        mock_claim.assert_not_called()
+        schedule.save.assert_not_called()
+
+    @patch('eventive.personalized.session_booking.claim_seat')
+    @patch('eventive.personalized.session_booking.get_schedule')
+    @patch('eventive.personalized.session_booking.check_ticket')
+    @patch('eventive.personalized.session_booking.get_session')
+    def test_overlapping_session_is_rejected(self, mock_session, mock_ticket, mock_schedule, mock_claim):
+        """Test that a session clashing with a booked one is not booked."""
+        mock_session.return_value = self._session()
+        schedule = MagicMock()
+        schedule.booked_sessions = []
+        schedule.find_conflict.return_value = frappe._dict({"event_session": "SES-0", "session_title": "Panel"})
+        mock_schedule.return_value = schedule
+
+        from eventive.personalized.doctype.attendee_schedule.attendee_schedule import ScheduleConflictError
+        from eventive.personalized.session_booking import book_session
+
+        with self.assertRaises(ScheduleConflictError):
+            book_session("SES-1", "a@example.com")
+        mock_claim.assert_not_called()
+
+    @patch('frappe.db')
+    def test_full_session_raises(self, mock_db):
+        """Test that a claim matching no row means the session is full."""
+        mock_db._cursor.rowcount = 0
+
+        from eventive.personalized.session_booking import claim_seat
+
+        with self.assertRaises(frappe.ValidationError):
+            claim_seat("SES-1")
+
+
+if __name__ == "__main__":
+    unittest.main()
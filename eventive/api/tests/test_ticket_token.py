@@ -0,0 +1,83 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import base64
+import frappe
+import unittest
+from datetime import date
+from unittest.mock import patch
+
+SIGNING_KEY = base64.urlsafe_b64encode(bytes(range(32))).rstrip(b"=").decode()
+
+
+def cached_value(doctype, name, fieldname, as_dict=False):
+    if doctype == "Ticket Type":
+        return "VIP"
+    return {"start_date": date(2026, 11, 2), "end_date": date(2026, 11, 3)}
+
+
+@patch('frappe.get_cached_value', side_effect=cached_value)
+@patch('frappe.conf', frappe._dict({"eventive_ticket_signing_key": SIGNING_KEY}))
+class TestTicketToken(unittest.TestCase):
+    """Unit tests for offline-verifiable ticket tokens."""
+
+    def test_token_verifies_with_ticket_claims(self, mock_cached_value):
+        """Test that a signed token carries the ticket, event, type and access level."""
+        from eventive.ticketing.ticket_token import get_ticket_token, verify_ticket_token
+
+        token = get_ticket_token("TKT-0001", "EVT-1", "TKT-VIP")
+        payload = verify_ticket_token(token, at=payload_time(token, "nbf"))
+
+        self.assertEqual(payload["tid"], "TKT-0001")
+        self.assertEqual(payload["evt"], "EVT-1")
+        self.assertEqual(payload["tt"], "TKT-VIP")
+        self.assertEqual(payload["acc"], "VIP")
+        self.assertEqual(payload["exp"] - payload["nbf"], 2 * 24 * 60 * 60)
+
+    def test_tampered_token_is_rejected(self, mock_cached_value):
+        """Test that changing the payload invalidates the signature."""
+        from eventive.ticketing.ticket_token import (
+            InvalidTicketTokenError, _b64encode, get_ticket_token, verify_ticket_token
+        )
+
+        token = get_ticket_token("TKT-0001", "EVT-1", "TKT-VIP")
+        _, signature = token.split(".")
+        forged = _b64encode(b'{"acc":"VVIP","tid":"TKT-0001"}')
+
+        with self.assertRaises(InvalidTicketTokenError):
+            verify_ticket_token(f"{forged}.{signature}")
+        with self.assertRaises(InvalidTicketTokenError):
+            verify_ticket_token("not-a-token")
+
+    def test_token_outside_event_dates_is_rejected(self, mock_cached_value):
+        """Test that a token is only valid during the event."""
+        from eventive.ticketing.ticket_token import InvalidTicketTokenError, get_ticket_token, verify_ticket_token
+
+        token = get_ticket_token("TKT-0001", "EVT-1", "TKT-VIP")
+
+        with self.assertRaises(InvalidTicketTokenError):
+            verify_ticket_token(token, at=payload_time(token, "nbf") - 1)
+        with self.assertRaises(InvalidTicketTokenError):
+            verify_ticket_token(token, at=payload_time(token, "exp"))
+
+
+    @patch('frappe.get_all')
+    def test_revocations_overlap_the_last_sync(self, mock_get_all, mock_cached_value):
+        """Test that revocations committed late after the last sync are fetched again."""
+        from datetime import datetime
+        from eventive.ticketing.ticket_token import get_revoked_tickets
+
+        get_revoked_tickets("EVT-1", "2026-11-02 09:00:00")
+
+        self.assertEqual(mock_get_all.call_args[1]["filters"]["modified"], [">=", datetime(2026, 11, 2, 8, 59)])
+
+
+def payload_time(token, claim):
+    import json
+    from eventive.ticketing.ticket_token import _b64decode
+
+    return json.loads(_b64decode(token.split(".")[0]))[claim]
+
+
+if __name__ == "__main__":
+    unittest.main()
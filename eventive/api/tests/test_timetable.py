@@ -0,0 +1,117 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from datetime import datetime, timedelta
+
+
+def track(name, capacity=0, day_start=9, day_end=12):
+    return frappe._dict({
+        "name": name,
+        "day": 1,
+        "capacity": capacity,
+        "day_start": datetime(2026, 11, 2, day_start),
+        "day_end": datetime(2026, 11, 2, day_end),
+    })
+
+
+def session(name, track=None, start=None, minutes=60, speakers=(), capacity=0):
+    start_time = datetime(2026, 11, 2, start) if start is not None else None
+    return frappe._dict({
+        "name": name,
+        "session_title": name,
+        "track": track,
+        "start_time": start_time,
+        "end_time": start_time + timedelta(minutes=minutes) if start_time else None,
+        "duration": timedelta(minutes=minutes),
+        "capacity": capacity,
+        "speakers": list(speakers),
+    })
+
+
+class TestTimetableSolver(unittest.TestCase):
+    """Unit tests for the timetable solver."""
+
+    def setUp(self):
+        self.tracks = {"TRACK-1": track("TRACK-1"), "TRACK-2": track("TRACK-2", capacity=50)}
+
+    def plan(self, sessions, availability=None):
+        from eventive.events.timetable import plan_timetable
+
+        proposal = plan_timetable(sessions, self.tracks, availability or {})
+        return {row["session"]: row for row in proposal["sessions"]}, proposal["unplaced"]
+
+    def test_keeps_sessions_that_fit(self):
+        """Test that sessions without conflicts keep their slot and track."""
+        placed, unplaced = self.plan([
+            session("SES-1", "TRACK-1", 9),
+            session("SES-2", "TRACK-1", 10),
+        ])
+
+        self.assertEqual(unplaced, [])
+        self.assertFalse(placed["SES-1"]["moved"])
+        self.assertFalse(placed["SES-2"]["moved"])
+
+    def test_track_overlap_is_moved(self):
+        """Test that a session overlapping another on its track gets the next free slot."""
+        placed, _ = self.plan([
+            session("SES-1", "TRACK-1", 9, speakers=["SPK-1"]),
+            session("SES-2", "TRACK-1", 9),
+        ])
+
+        self.assertEqual(placed["SES-1"]["start_time"], "2026-11-02 09:00:00")
+        self.assertEqual(placed["SES-2"]["track"], "TRACK-1")
+        self.assertEqual(placed["SES-2"]["start_time"], "2026-11-02 10:00:00")
+        self.assertTrue(placed["SES-2"]["moved"])
+
+    def test_speaker_is_not_double_booked(self):
+        """Test that a speaker's sessions on different tracks do not overlap."""
+        placed, _ = self.plan([
+            session("SES-1", "TRACK-1", 9, speakers=["SPK-1"]),
+            session("SES-2", "TRACK-2", 9, speakers=["SPK-1"]),
+        ])
+
+        starts = {placed["SES-1"]["start_time"], placed["SES-2"]["start_time"]}
+        self.assertEqual(len(starts), 2)
+
+    def test_speaker_availability(self):
+        """Test that sessions are only placed inside their speakers' availability."""
+        availability = {"SPK-1": [(datetime(2026, 11, 2, 11), datetime(2026, 11, 2, 12))]}
+
+        placed, _ = self.plan([session("SES-1", "TRACK-1", 9, speakers=["SPK-1"])], availability)
+
+        self.assertEqual(placed["SES-1"]["start_time"], "2026-11-02 11:00:00")
+
+    def test_track_capacity(self):
+        """Test that sessions are kept out of tracks with too few seats."""
+        placed, _ = self.plan([session("SES-1", "TRACK-2", 9, capacity=80)])
+
+        self.assertEqual(placed["SES-1"]["track"], "TRACK-1")
+
+    def test_unplaced_sessions_are_reported(self):
+        """Test that sessions without any valid slot are reported with reasons."""
+        availability = {"SPK-1": [(datetime(2026, 11, 2, 13), datetime(2026, 11, 2, 14))]}
+
+        placed, unplaced = self.plan([session("SES-1", "TRACK-1", 9, speakers=["SPK-1"])], availability)
+
+        self.assertEqual(placed, {})
+        self.assertEqual(unplaced[0]["session"], "SES-1")
+        self.assertEqual(unplaced[0]["reasons"], ["Speaker SPK-1 is unavailable"])
+
+    def test_conflict_report(self):
+        """Test that the current timetable's overlaps and double-bookings are reported."""
+        from eventive.events.timetable import find_conflicts
+
+        conflicts = find_conflicts([
+            session("SES-1", "TRACK-1", 9, minutes=90, speakers=["SPK-1"]),
+            session("SES-2", "TRACK-1", 10),
+            session("SES-3", "TRACK-2", 9, speakers=["SPK-1"], capacity=80),
+        ], self.tracks, {})
+
+        types = sorted(conflict["type"] for conflict in conflicts)
+        self.assertEqual(types, ["Speaker Double-Booked", "Track Overlap", "Track Too Small"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestUnreadMessages(unittest.TestCase):
+    """Unit tests for realtime delivery and unread message counters."""
+
+    def test_deliver_publishes_to_receiver(self):
+        """Test that a new message is pushed to the receiver's room after commit."""
+        from eventive.networking import unread
+
+        msg = MagicMock(sender="a@example.com", receiver="b@example.com", event="event-001", message="Hi")
+        msg.name = "msg-001"
+
+        with patch("frappe.db") as db, patch("frappe.publish_realtime") as publish_realtime:
+            unread.deliver(msg)
+
+        db.after_commit.add.assert_called_once()
+        args, kwargs = publish_realtime.call_args
+        self.assertEqual(args[0], "eventive_message")
+        self.assertEqual(args[1]["id"], "msg-001")
+        self.assertEqual(args[1]["event_id"], "event-001")
+        self.assertEqual(kwargs["user"], "b@example.com")
+        self.assertTrue(kwargs["after_commit"])
+
+    def test_counts_seeded_from_database(self):
+        """Test that an unseeded user is counted from the database and cached."""
+        from eventive.networking import unread
+
+        with patch("frappe.db") as db, patch("frappe.cache") as cache:
+            cache.return_value.execute_command.return_value = {}
+            cache.return_value.hsetnx.return_value = 1
+            db.sql.return_value = [("a@example.com", 2), ("c@example.com", 1)]
+            counts = unread.get_unread_counts("b@example.com")
+
+        self.assertEqual(counts, {"total": 3, "conversations": {"a@example.com": 2, "c@example.com": 1}})
+        pipeline = cache.return_value.pipeline.return_value
+        # Added to increments made while counting, then marked complete
+        pipeline.hincrby.assert_any_call(cache.return_value.make_key.return_value, "a@example.com", 2)
+        pipeline.hset.assert_called_once_with(cache.return_value.make_key.return_value, unread.SEEDED_FIELD, 1)
+        pipeline.execute.assert_called_once()
+        # A placeholder left by a failed seed expires quickly, a complete hash lasts a day
+        key = cache.return_value.make_key.return_value
+        cache.return_value.expire.assert_called_once_with(key, unread.SEEDING_TTL)
+        pipeline.expire.assert_called_once_with(key, unread.UNREAD_TTL)
+
+    def test_concurrent_seed_counts_from_database(self):
+        """Test that only one request seeds and others count from the database meanwhile."""
+        from eventive.networking import unread
+
+        with patch("frappe.db") as db, patch("frappe.cache") as cache:
+            cache.return_value.execute_command.return_value = {b"_seeded": b"0", b"a@example.com": b"1"}
+            db.sql.return_value = [("a@example.com", 2)]
+            counts = unread.get_unread_counts("b@example.com")
+
+        self.assertEqual(counts, {"total": 2, "conversations": {"a@example.com": 2}})
+        cache.return_value.hsetnx.assert_not_called()
+        cache.return_value.pipeline.assert_not_called()
+
+    def test_counts_read_from_cache(self):
+        """Test that seeded counts are served from Redis without querying."""
+        from eventive.networking import unread
+
+        with patch("frappe.db") as db, patch("frappe.cache") as cache:
+            cache.return_value.execute_command.return_value = {
+                b"_seeded": b"1",
+                b"a@example.com": b"4",
+                b"c@example.com": b"0",
+            }
+            counts = unread.get_unread_counts("b@example.com")
+
+        self.assertEqual(counts, {"total": 4, "conversations": {"a@example.com": 4}})
+        db.sql.assert_not_called()
+
+    def test_mark_conversation_read(self):
+        """Test that a conversation is marked read in one statement and its counter cleared."""
+        from eventive.networking import unread
+        from eventive.networking.doctype.networking_message.networking_message import get_conversation_key
+
+        with patch("frappe.db") as db:
+            db._cursor.rowcount = 3
+            updated = unread.mark_conversation_read("b@example.com", "a@example.com")
+
+        self.assertEqual(updated, 3)
+        db.sql.assert_called_once()
+        params = db.sql.call_args[0][1]
+        self.assertEqual(params["conversation"], get_conversation_key("a@example.com", "b@example.com"))
+        self.assertEqual(params["user"], "b@example.com")
+        db.after_commit.add.assert_called_once()
+
+    @patch("frappe.session")
+    def test_mark_conversation_read_requires_user(self, mock_session):
+        """Test that the other participant is required."""
+        mock_session.user = "b@example.com"
+
+        from eventive.api.networking import mark_conversation_read
+
+        with self.assertRaises(frappe.ValidationError):
+            mark_conversation_read(other_user_id=None)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+# Copyright (c) 2024 Your Company Name
+# License: MIT
+
+import frappe
+import unittest
+from unittest.mock import patch, MagicMock
+
+
+class TestWaitingRoom(unittest.TestCase):
+    """Unit tests for waiting room admission control."""
+
+    @patch('frappe.get_cached_value')
+    def test_booking_allowed_when_waiting_room_off(self, mock_get_cached_value):
+        """Test that events without an admission rate skip the queue."""
+        mock_get_cached_value.return_value = 0
+
+        from eventive.ticketing.waiting_room import check_admission
+
+        check_admission("EVT-1")
+
+    @patch('frappe.cache')
+    @patch('frappe.get_cached_value')
+    def test_booking_rejected_without_admission(self, mock_get_cached_value, mock_cache):
+        """Test that buyers without an admission pass are turned away."""
+        mock_get_cached_value.return_value = 50
+        mock_cache.return_value.get_value.return_value = None
+
+        from eventive.ticketing.waiting_room import NotAdmittedError, check_admission
+
+        with self.assertRaises(NotAdmittedError):
+            check_admission("EVT-1", "queue-1")
+
+    @patch('frappe.cache')
+    def test_status_behind_frontier_waits(self, mock_cache):
+        """Test that a position past the frontier reports the buyers ahead."""
+        from eventive.ticketing.waiting_room import _get_status
+
+        status = _get_status("EVT-1", "queue-1", position=120, frontier=100.4, rate=10)
+
+        self.assertFalse(status["admitted"])
+        self.assertEqual(status["ahead"], 19)
+        self.assertEqual(status["estimated_wait"], 2)
+        mock_cache.return_value.set_value.assert_not_called()
+
+    @patch('frappe.cache')
+    def test_status_within_frontier_grants_pass(self, mock_cache):
+        """Test that an admitted position is given a booking pass."""
+        mock_cache.return_value.get_value.return_value = None
+
+        from eventive.ticketing.waiting_room import _get_status
+
+        status = _get_status("EVT-1", "queue-1", position=90, frontier=100.0, rate=10)
+
+        self.assertTrue(status["admitted"])
+        mock_cache.return_value.set_value.assert_any_call(
+            "eventive:waiting_room:EVT-1:pass:queue-1", 1, expires_in_sec=15 * 60
+        )
+
+    @patch('eventive.ticketing.waiting_room._advance')
+    @patch('frappe.get_cached_value')
+    @patch('frappe.cache')
+    def test_expired_pass_returns_buyer_to_queue(self, mock_cache, mock_get_cached_value, mock_advance):
+        """Test that a poll after the pass ran out takes a new position instead of a new pass."""
+        mock_get_cached_value.return_value = 10
+        mock_cache.return_value.get_value.side_effect = lambda key: {
+            "eventive:waiting_room:EVT-1:entry:queue-1": 90,
+            "eventive:waiting_room:EVT-1:admitted:queue-1": 1,
+        }.get(key)
+        mock_advance.return_value = (250, 100.0)
+
+        from eventive.ticketing.waiting_room import get_status
+
+        status = get_status("EVT-1", "queue-1")
+
+        mock_advance.assert_called_once_with("EVT-1", 10, join=True)
+        self.assertEqual(status["position"], 250)
+        self.assertFalse(status["admitted"])
+        mock_cache.return_value.set_value.assert_called_once_with(
+            "eventive:waiting_room:EVT-1:entry:queue-1", 250, expires_in_sec=6 * 60 * 60
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,9 @@
 import frappe
+from frappe.utils import now_datetime
+from werkzeug.wrappers import Response
+
+from eventive.ticketing import qr, ticket_token
+from eventive.ticketing.doctype.seat_inventory import seat_inventory
 
 
 @frappe.whitelist(allow_guest=True)
@@ -91,7 +96,7 @@ def get_registration(email, event_id):
 			"event_id": ticket.event,
 			"ticket_type": ticket.ticket_type,
 			"email": ticket.email,
-			"qr_code": ticket.qr_code,
+			"qr_code": qr.get_qr_url(ticket.name),
 			"issue_date": str(ticket.issue_date) if ticket.issue_date else None,
 			"status": ticket.status,
 			"checked_in": ticket.checked_in,
@@ -177,7 +182,8 @@ def get_ticket(email, event_id):
 		"ticket_category_name": ticket_type.ticket_category_name,
 		"access_level": ticket_type.access_level,
 		"ticket_price": ticket_type.ticket_price,
-		"qr_code": ticket.qr_code,
+		"qr_code": qr.get_qr_url(ticket.name),
+		"ticket_token": ticket.ticket_token,
 		"issue_date": str(ticket.issue_date) if ticket.issue_date else None,
 		"status": ticket.status,
 		"checked_in": ticket.checked_in
@@ -251,6 +257,78 @@ def get_ticket_types(event_id):
 	return ticket_types
 
 
+@frappe.whitelist(allow_guest=True)
+def get_availability(event_id):
+	"""
+	Fetch remaining seats for an event and each of its ticket types.
+	
+	Args:
+	    event_id (str): The event ID
+	
+	Returns:
+	    dict: Event availability and availability per ticket type
+	"""
+	ticket_types = frappe.get_all(
+		"Ticket Type",
+		filters={
+			"event": event_id
+		},
+		pluck="name",
+		ignore_permissions=True
+	)
+	
+	return {
+		"event": seat_inventory.get_availability(event_id),
+		"ticket_types": {
+			ticket_type: seat_inventory.get_availability(event_id, ticket_type)
+			for ticket_type in ticket_types
+		}
+	}
+
+
+@frappe.whitelist(allow_guest=True)
+def get_issuance_status(registration_id, email):
+	"""
+	Poll whether the tickets for a registration have been issued.
+	
+	Args:
+	    registration_id (str): The registration ID returned by create_booking
+	    email (str): The booker's email
+	
+	Returns:
+	    dict: Issuance status, and the tickets once they are issued
+	"""
+	registration = frappe.db.get_value(
+		"Event Registration",
+		registration_id,
+		["email", "issuance_status"],
+		as_dict=True
+	)
+	
+	if not registration or registration.email != email:
+		frappe.throw("Registration not found", frappe.DoesNotExistError)
+	
+	response = {
+		"registration_id": registration_id,
+		"issuance_status": registration.issuance_status,
+		"tickets": []
+	}
+	
+	if registration.issuance_status == "Issued":
+		response["tickets"] = frappe.get_all(
+			"Event Ticket",
+			filters={
+				"registration": registration_id
+			},
+			fields=["name", "email", "ticket_type"],
+			ignore_permissions=True
+		)
+		for ticket in response["tickets"]:
+			ticket.qr_code = qr.get_qr_url(ticket.name)
+	
+	return response
+
+
 @frappe.whitelist(allow_guest=True)
 def has_ticket(email, event_id):
 	"""
@@ -316,7 +394,7 @@ def get_my_tickets(email=None):
 			"ticket_type",
 			"event",
 			"registration",
-			"qr_code",
+			"ticket_token",
 			"issue_date",
 			"status",
 			"merchandise"
@@ -327,6 +405,7 @@ def get_my_tickets(email=None):
 	
 	# Get event names for each ticket
 	for ticket in tickets:
+		ticket.qr_code = qr.get_qr_url(ticket.name)
 		event = frappe.get_doc("Main Event", ticket.event, ignore_permissions=True)
 		ticket.event_name = event.event_name
 		ticket.start_date = event.start_date
@@ -364,7 +443,68 @@ def download_ticket(ticket_id):
 		"event_start_date": event.start_date,
 		"event_end_date": event.end_date,
 		"event_venue": event.venue,
-		"qr_code": ticket.qr_code,
+		"qr_code": qr.get_qr_url(ticket.name),
+		"qr_code_png": qr.get_qr_url(ticket.name, "png"),
+		"ticket_token": ticket.ticket_token,
 		"issue_date": ticket.issue_date,
 		"status": ticket.status
 	}
+
+
+@frappe.whitelist(allow_guest=True)
+def get_qr_code(token, format="svg"):
+	"""
+	Render a ticket's QR code as an image.
+	
+	Args:
+	    token (str): Signed ticket token from a ticket's `qr_code` URL
+	    format (str): svg or png
+	
+	Returns:
+	    Response: The image, with caching headers
+	"""
+	image, content_type, etag = qr.get_qr_image(token, format)
+	
+	response = Response(mimetype=content_type)
+	response.set_etag(etag)
+	response.headers["Cache-Control"] = f"private, max-age={qr.QR_MAX_AGE}"
+	
+	if etag in frappe.request.if_none_match:
+		response.status_code = 304
+		return response
+	
+	response.data = image
+	return response
+
+
+@frappe.whitelist(allow_guest=True)
+def get_ticket_signing_keys():
+	"""
+	Public keys gate scanners verify ticket tokens with.
+	
+	Returns:
+	    dict: JSON Web Key Set with the site's Ed25519 key
+	"""
+	return ticket_token.get_public_keys()
+
+
+@frappe.whitelist()
+def get_revocation_list(event_id, since=None):
+	"""
+	Fetch tickets that have been invalidated or cancelled since they were issued.
+	
+	Args:
+	    event_id (str): The event ID
+	    since (str): Optional `generated_at` of a previous call, to only fetch new revocations
+	
+	Returns:
+	    dict: Revoked ticket IDs and the time to pass as `since` next. Tickets
+	        revoked shortly before `since` are repeated, so dedupe by ticket ID.
+	"""
+	generated_at = now_datetime()
+	
+	return {
+		"event_id": event_id,
+		"generated_at": str(generated_at),
+		"revoked": ticket_token.get_revoked_tickets(event_id, since)
+	}
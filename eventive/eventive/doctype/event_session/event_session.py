@@ -3,20 +3,23 @@
 
 import frappe
 from frappe.model.document import Document
-from frappe.utils import getdate
+from frappe.utils import get_datetime, getdate
 
 
 class EventSession(Document):
 	def validate(self):
-		if not self.event or not self.start_date:
+		if self.start_time and self.end_time and get_datetime(self.end_time) <= get_datetime(self.start_time):
+			frappe.throw("Session must end after it starts")
+
+		if not self.event or not self.start_time:
 			return
 		
 		event = frappe.get_doc("Main Event", self.event)
 
 		event_start = getdate(event.start_date)
 		event_end = getdate(event.end_date)
-		session_start = getdate(self.start_date)
-		session_end = getdate(self.end_date)
+		session_start = getdate(self.start_time)
+		session_end = getdate(self.end_time or self.start_time)
 
 		if session_start < event_start or session_end > event_end:
 			frappe.throw("Session dates must be within the event dates")
@@ -0,0 +1,109 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+
+from eventive.utils.pagination import parse_list
+
+BUNDLE_KEY = "eventive:event_bundle:{0}"
+
+# Bundle section -> endpoint that builds it
+BUNDLE_SECTIONS = {
+	"event": "eventive.api.events.get_by_id",
+	"sessions": "eventive.api.sessions.get_by_event",
+	"ticket_types": "eventive.api.ticket.get_ticket_types",
+	"merchandise": "eventive.api.merchandise.get_by_event",
+	"sponsor_tiers": "eventive.api.events.get_sponsor_tiers",
+	"booth_packages": "eventive.api.events.get_booth_packages",
+	"content": "eventive.api.content.get_by_event",
+}
+
+# Doctype -> bundle section it feeds
+SECTION_DOCTYPES = {
+	"Main Event": "event",
+	"Event Session": "sessions",
+	"Ticket Type": "ticket_types",
+	"Merchandise": "merchandise",
+	"Sponsor Tier": "sponsor_tiers",
+	"Booth Package": "booth_packages",
+	"Digital Content": "content",
+}
+
+
+def get_event_bundle(event_id, include=None):
+	"""
+	Assemble the requested sections of an event's detail bundle.
+
+	Each section is cached in a Redis hash per event, so only sections that
+	were invalidated since the last request are rebuilt.
+
+	Args:
+	    event_id (str): The event ID
+	    include (list): Sections to return, defaults to all of BUNDLE_SECTIONS
+
+	Returns:
+	    dict: Section name -> section data
+	"""
+	sections = parse_list(include) or list(BUNDLE_SECTIONS)
+	invalid = [section for section in sections if section not in BUNDLE_SECTIONS]
+	if invalid:
+		frappe.throw(f"Invalid bundle sections: {', '.join(invalid)}", frappe.ValidationError)
+
+	cache = frappe.cache()
+	key = BUNDLE_KEY.format(event_id)
+	bundle = {}
+	checked_event = False
+
+	for section in sections:
+		data = cache.hget(key, section)
+		if data is None:
+			if not checked_event and not frappe.db.exists("Main Event", event_id):
+				frappe.throw(f"Event {event_id} not found", frappe.DoesNotExistError)
+			checked_event = True
+
+			data = frappe.get_attr(BUNDLE_SECTIONS[section])(event_id)
+			cache.hset(key, section, data)
+
+		bundle[section] = data
+
+	return bundle
+
+
+def clear_event_bundle(event_id, section=None):
+	if not event_id:
+		return
+
+	key = BUNDLE_KEY.format(event_id)
+	if section:
+		frappe.cache().hdel(key, section)
+	else:
+		frappe.cache().delete_value(key)
+
+
+def invalidate_event_bundle(doc, method=None, *args, **kwargs):
+	"""
+	doc_events handler for the doctypes that make up an event bundle.
+
+	Clears the section the document feeds for its event, and for the event it
+	was moved from when its `event` link changed.
+	"""
+	section = SECTION_DOCTYPES.get(doc.doctype)
+
+	if doc.doctype == "Main Event":
+		# Child rows carry fetched event fields (e.g. event_name), drop the whole bundle
+		section = None
+		event_ids = {doc.name}
+		if method == "after_rename" and args:
+			event_ids.add(args[0])
+	else:
+		event_ids = {doc.get("event")}
+		before = doc.get_doc_before_save() if method == "on_update" else None
+		if before:
+			event_ids.add(before.get("event"))
+
+	def clear():
+		for event_id in event_ids:
+			clear_event_bundle(event_id, section)
+
+	clear()
+	frappe.db.after_commit.add(clear)
@@ -0,0 +1,242 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import base64
+import hashlib
+import hmac
+import time
+from datetime import timezone
+from zoneinfo import ZoneInfo
+
+import frappe
+from frappe.utils import get_datetime, get_system_timezone, get_url, strip_html
+from frappe.utils.password import get_encryption_key
+
+# Feed ID -> built feed, per event. Feed IDs are `event`, `track:<track>` and `user:<user>`
+FEEDS_KEY = "eventive:ics_feeds:{0}"
+
+# Calendar apps are asked to poll no more often than this
+REFRESH_INTERVAL = 15 * 60
+
+FEED_PATH = "/api/method/eventive.api.calendar.{0}"
+
+
+def get_feed(event, feed="event"):
+	"""
+	An event's iCalendar feed, built on first request and then served from Redis
+	until a session, the event or, for attendee feeds, the schedule changes.
+
+	Args:
+	    event (str): The event ID
+	    feed (str): `event`, `track:<track ID>` or `user:<user ID>`
+
+	Returns:
+	    dict: `ics` text, its `etag` and `last_modified` as a UNIX timestamp
+	"""
+	cache = frappe.cache()
+	key = FEEDS_KEY.format(event)
+
+	cached = cache.hget(key, feed)
+	if cached is None:
+		ics = build_feed(event, feed)
+		cached = {
+			"ics": ics,
+			"etag": hashlib.sha1(ics.encode()).hexdigest(),
+			"last_modified": int(time.time()),
+		}
+		cache.hset(key, feed, cached)
+
+	return cached
+
+
+def build_feed(event, feed):
+	kind, _, value = feed.partition(":")
+	details = frappe.db.get_value("Main Event", event, ["event_name", "venue_name"], as_dict=True)
+	if not details:
+		frappe.throw("Event not found", frappe.DoesNotExistError)
+
+	if kind == "event":
+		sessions = get_sessions({"event": event})
+		name = details.event_name
+	elif kind == "track":
+		sessions = get_sessions({"event": event, "track": value})
+		name = f"{details.event_name} ({value})"
+	elif kind == "user":
+		sessions = get_sessions({"event": event, "name": ["in", get_booked_sessions(value, event) or [""]]})
+		name = f"{details.event_name}: My Agenda"
+	else:
+		frappe.throw(f"Unknown feed {feed}")
+
+	return render_calendar(name, sessions, details.venue_name)
+
+
+def render_calendar(name, sessions, location=None):
+	"""iCalendar (RFC 5545) text for sessions, with CRLF line endings and folded lines."""
+	host = frappe.local.site or "eventive"
+	lines = [
+		"BEGIN:VCALENDAR",
+		"VERSION:2.0",
+		"PRODID:-//Eventive//Agenda//EN",
+		"CALSCALE:GREGORIAN",
+		"METHOD:PUBLISH",
+		f"X-WR-CALNAME:{escape(name)}",
+		f"REFRESH-INTERVAL;VALUE=DURATION:PT{REFRESH_INTERVAL // 60}M",
+		f"X-PUBLISHED-TTL:PT{REFRESH_INTERVAL // 60}M",
+	]
+
+	for session in sessions:
+		lines += [
+			"BEGIN:VEVENT",
+			f"UID:{session.name}@{host}",
+			# The session's own timestamp keeps unchanged feeds byte for byte equal
+			f"DTSTAMP:{format_time(session.modified)}",
+			f"LAST-MODIFIED:{format_time(session.modified)}",
+			f"DTSTART:{format_time(session.start_time)}",
+			f"DTEND:{format_time(session.end_time)}",
+			f"SUMMARY:{escape(session.session_title or session.talk_name or session.name)}",
+		]
+		if session.description:
+			lines.append(f"DESCRIPTION:{escape(strip_html(session.description).strip())}")
+		if location:
+			lines.append(f"LOCATION:{escape(location)}")
+		if session.session_type:
+			lines.append(f"CATEGORIES:{escape(session.session_type)}")
+		lines.append("END:VEVENT")
+
+	lines.append("END:VCALENDAR")
+	return "\r\n".join(fold(line) for line in lines) + "\r\n"
+
+
+def get_sessions(filters):
+	return frappe.get_all(
+		"Event Session",
+		filters=dict(filters, start_time=["is", "set"], end_time=["is", "set"]),
+		fields=["name", "session_title", "talk_name", "description", "session_type", "start_time", "end_time", "modified"],
+		order_by="start_time asc",
+		ignore_permissions=True
+	)
+
+
+def get_booked_sessions(user, event):
+	return frappe.db.sql_list(
+		"""
+		SELECT b.event_session
+		FROM `tabBooked Session Item` b
+		JOIN `tabAttendee Schedule` s ON s.name = b.parent AND b.parenttype = 'Attendee Schedule'
+		WHERE s.user = %(user)s AND s.event = %(event)s
+		""",
+		{"user": user, "event": event},
+	)
+
+
+def get_feed_urls(event, user=None):
+	"""Absolute URLs calendar apps can subscribe to for an event, its tracks and a user's agenda."""
+	tracks = frappe.get_all("Event Day Track", filters={"event": event}, pluck="name", order_by="day asc, name asc")
+
+	urls = {
+		"event": get_url(FEED_PATH.format("get_event_feed") + f"?event_id={event}"),
+		"tracks": {track: get_url(FEED_PATH.format("get_track_feed") + f"?track_id={track}") for track in tracks},
+	}
+	if user and user != "Guest":
+		urls["attendee"] = get_url(FEED_PATH.format("get_attendee_feed") + f"?token={get_feed_token(user, event)}")
+
+	return urls
+
+
+def get_feed_token(user, event):
+	"""Signed token for a user's agenda feed, since calendar apps cannot log in."""
+	payload = base64.urlsafe_b64encode(f"{event}\n{user}".encode()).decode().rstrip("=")
+	return f"{payload}.{_sign(payload)}"
+
+
+def verify_feed_token(token):
+	"""
+	Return the (user, event) an agenda feed token was signed for.
+
+	Raises PermissionError for tampered or malformed tokens.
+	"""
+	payload, _, signature = (token or "").rpartition(".")
+	if not payload or not hmac.compare_digest(signature, _sign(payload)):
+		frappe.throw("Invalid calendar feed token", frappe.PermissionError)
+
+	event, _, user = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)).decode().partition("\n")
+	return user, event
+
+
+def clear_feeds(event, feed=None):
+	if not event:
+		return
+
+	key = FEEDS_KEY.format(event)
+	if feed:
+		frappe.cache().hdel(key, feed)
+	else:
+		frappe.cache().delete_value(key)
+
+
+def invalidate_feeds(doc, method=None, *args, **kwargs):
+	"""
+	doc_events handler for Main Event, Event Session and Attendee Schedule.
+
+	Session and event changes drop every feed of the event, a schedule change
+	only its attendee's feed. The event the document was moved from, or a
+	renamed event's old name, is cleared too.
+	"""
+	if doc.doctype == "Main Event":
+		feeds = {(doc.name, None)}
+		if method == "after_rename" and args:
+			feeds.add((args[0], None))
+	elif doc.doctype == "Attendee Schedule":
+		feeds = {(doc.event, f"user:{doc.user}")}
+	else:
+		feeds = {(doc.get("event"), None)}
+
+	before = doc.get_doc_before_save() if method == "on_update" else None
+	if before and doc.doctype == "Attendee Schedule":
+		feeds.add((before.event, f"user:{before.user}"))
+	elif before and doc.doctype == "Event Session":
+		feeds.add((before.get("event"), None))
+
+	def clear():
+		for event, feed in feeds:
+			clear_feeds(event, feed)
+
+	clear()
+	frappe.db.after_commit.add(clear)
+
+
+def format_time(value):
+	"""Datetime in the system timezone -> iCalendar UTC time."""
+	value = get_datetime(value).replace(tzinfo=ZoneInfo(get_system_timezone()))
+	return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def escape(text):
+	return (
+		str(text)
+		.replace("\\", "\\\\")
+		.replace(";", "\\;")
+		.replace(",", "\\,")
+		.replace("\r\n", "\\n")
+		.replace("\n", "\\n")
+	)
+
+
+def fold(line):
+	"""Split a content line into 75 octet lines without breaking UTF-8 characters."""
+	data = line.encode()
+	parts = []
+	while len(data) > 75:
+		# Continuation lines start with a space, which counts towards the limit
+		cut = 74 if parts else 75
+		while data[cut] & 0xC0 == 0x80:
+			cut -= 1
+		parts.append(data[:cut].decode())
+		data = data[cut:]
+	parts.append(data.decode())
+	return "\r\n ".join(parts)
+
+
+def _sign(payload):
+	digest = hmac.new(get_encryption_key().encode(), f"ics:{payload}".encode(), hashlib.sha256).digest()
+	return base64.urlsafe_b64encode(digest[:18]).decode()
@@ -0,0 +1,143 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import getdate
+
+from eventive.utils.pagination import paginate_rows
+
+CATALOG_VERSION_KEY = "eventive:catalog_version"
+CATALOG_KEY = "eventive:published_events"
+
+# Superset of the fields any listing endpoint serves from the catalog
+CATALOG_FIELDS = (
+	"name",
+	"event_name",
+	"banner_image",
+	"start_date",
+	"end_date",
+	"status",
+	"capacity",
+	"venue",
+	"venue_name",
+	"currency",
+	"is_paid_event",
+	"description",
+	"organizer",
+	"host_name",
+	"allow_networking",
+	"allow_digital_content",
+)
+
+# In-process copy of the catalog per site: {site: (version, events)}
+_local_catalog = {}
+
+
+def get_published_events(fields=None, filters=None, cursor=None, limit=None):
+	"""
+	Return published events, served from the in-process or Redis catalog.
+
+	The catalog is tagged with a version token held in Redis. A worker only
+	rebuilds it from the database when neither its local copy nor Redis holds
+	the current version. Filtering and keyset pagination on (start_date, name)
+	run over the cached rows.
+
+	Args:
+	    fields (list): Optional subset of CATALOG_FIELDS to return
+	    filters (dict): Optional from_date, to_date, venue, organizer and status
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length; pagination is only applied when given
+
+	Returns:
+	    list | dict: List of events, or {"data", "next_cursor"} when paginated
+	"""
+	events = filter_events(_get_catalog(), **(filters or {}))
+	fields = fields or CATALOG_FIELDS
+
+	if cursor or limit:
+		return paginate_rows(events, fields, event_sort_key, cursor=cursor, limit=limit)
+
+	return [frappe._dict({field: event.get(field) for field in fields}) for event in events]
+
+
+def filter_events(events, from_date=None, to_date=None, venue=None, organizer=None, status=None):
+	"""Return the events overlapping the date range and matching the given links."""
+	from_date = getdate(from_date) if from_date else None
+	to_date = getdate(to_date) if to_date else None
+
+	def matches(event):
+		if venue and event.venue != venue:
+			return False
+		if organizer and event.organizer != organizer:
+			return False
+		if status and event.status != status:
+			return False
+		if from_date and getdate(event.end_date or event.start_date) < from_date:
+			return False
+		if to_date and getdate(event.start_date) > to_date:
+			return False
+		return True
+
+	return [event for event in events if matches(event)]
+
+
+def event_sort_key(event):
+	return [str(event.get("start_date") or ""), event.get("name")]
+
+
+def _get_catalog():
+	cache = frappe.cache()
+	site = frappe.local.site
+
+	version = cache.get_value(CATALOG_VERSION_KEY)
+	if not version:
+		version = _bump_version()
+
+	local = _local_catalog.get(site)
+	if local and local[0] == version:
+		return local[1]
+
+	cached = cache.get_value(CATALOG_KEY)
+	if cached and cached.get("version") == version:
+		events = cached["events"]
+	else:
+		events = _build_catalog()
+		cache.set_value(CATALOG_KEY, {"version": version, "events": events})
+
+	_local_catalog[site] = (version, events)
+	return events
+
+
+def _build_catalog():
+	return frappe.get_all(
+		"Main Event",
+		filters={
+			"is_published": 1,
+		},
+		fields=list(CATALOG_FIELDS),
+		order_by="start_date asc",
+		ignore_permissions=True
+	)
+
+
+def _bump_version():
+	version = frappe.generate_hash(length=12)
+	frappe.cache().set_value(CATALOG_VERSION_KEY, version)
+	return version
+
+
+def invalidate_catalog(doc=None, method=None, *args, **kwargs):
+	"""
+	doc_events handler for Main Event: drop the cached catalog.
+
+	The version is bumped immediately and again after commit, so a reader that
+	rebuilt the catalog from pre-commit data does not keep serving it.
+	"""
+	clear_catalog()
+	frappe.db.after_commit.add(clear_catalog)
+
+
+def clear_catalog():
+	_bump_version()
+	frappe.cache().delete_value(CATALOG_KEY)
+	_local_catalog.pop(frappe.local.site, None)
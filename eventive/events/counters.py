@@ -0,0 +1,177 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import time
+
+import frappe
+from frappe.utils import cint
+
+COUNTERS_KEY = "eventive:event_counters:{0}"
+THROTTLE_KEY = "eventive:event_counters:{0}:throttle"
+PENDING_KEY = "eventive:event_counters:pending"
+
+# Counters are rebuilt from the database once a day, which bounds any drift
+COUNTERS_TTL = 24 * 60 * 60
+
+# At most one push per event in this many seconds, the rest are coalesced
+PUSH_INTERVAL = 2
+
+REALTIME_EVENT = "eventive_event_counters"
+
+# Only increments counters that have been seeded, so a later seed from the
+# database cannot count the same change twice
+INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+	return 0
+end
+for i = 1, #ARGV, 2 do
+	redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+end
+return 1
+"""
+
+
+def get_counters(event):
+	"""
+	Registration, ticket and check-in counts for an event's organizer dashboard.
+
+	Returns:
+	    dict: Totals plus issued and checked in counts per ticket type
+	"""
+	counts = _read(event) or _seed(event)
+
+	ticket_types = {}
+	for field, value in counts.items():
+		kind, _, ticket_type = field.partition(":")
+		if ticket_type:
+			ticket_types.setdefault(ticket_type, {"issued": 0, "checked_in": 0})[kind] = value
+
+	return {
+		"event": event,
+		"registrations": counts.get("registrations", 0),
+		"tickets_issued": counts.get("tickets_issued", 0),
+		"checked_in": counts.get("checked_in", 0),
+		"ticket_types": ticket_types,
+	}
+
+
+def increment(event, registrations=0, issued=None, checked_in=None):
+	"""
+	Move an event's counters once the current transaction commits, and push them.
+
+	Args:
+	    event (str): The event ID
+	    registrations (int): Change in registrations
+	    issued (dict): Ticket Type ID -> change in tickets issued
+	    checked_in (dict): Ticket Type ID -> change in tickets checked in
+	"""
+	changes = {}
+	if registrations:
+		changes["registrations"] = registrations
+
+	for kind, total, per_type in (("issued", "tickets_issued", issued), ("checked_in", "checked_in", checked_in)):
+		for ticket_type, qty in (per_type or {}).items():
+			if not qty:
+				continue
+			changes[total] = changes.get(total, 0) + qty
+			changes[f"{kind}:{ticket_type}"] = qty
+
+	if changes:
+		frappe.db.after_commit.add(lambda: _apply(event, changes))
+
+
+def push_counters(event):
+	"""
+	Publish an event's counters unless they were pushed in the last
+	PUSH_INTERVAL seconds. Throttled pushes are sent once the window ends.
+	"""
+	cache = frappe.cache()
+
+	if cache.set(cache.make_key(THROTTLE_KEY.format(event)), 1, nx=True, ex=PUSH_INTERVAL):
+		cache.execute_command("SREM", cache.make_key(PENDING_KEY), event)
+		frappe.publish_realtime(REALTIME_EVENT, get_counters(event), doctype="Main Event", docname=event)
+	elif cache.execute_command("SADD", cache.make_key(PENDING_KEY), event):
+		frappe.enqueue(
+			"eventive.events.counters.push_trailing_counters",
+			queue="short",
+			job_id=f"eventive_counters_push::{event}",
+			deduplicate=True,
+			event=event,
+		)
+
+
+def push_trailing_counters(event):
+	"""
+	Background job: push an event's deferred counters when its throttle window
+	ends. Pushes deferred while the job runs are deduplicated against it, so
+	it keeps going until none are left.
+	"""
+	cache = frappe.cache()
+
+	while True:
+		wait = cint(cache.execute_command("PTTL", cache.make_key(THROTTLE_KEY.format(event))))
+		if wait > 0:
+			time.sleep(wait / 1000)
+
+		if not cache.execute_command("SREM", cache.make_key(PENDING_KEY), event):
+			return
+		push_counters(event)
+
+
+def push_pending_counters():
+	"""Scheduled job: push deferred counters whose trailing push job was lost."""
+	cache = frappe.cache()
+	events = cache.execute_command("SPOP", cache.make_key(PENDING_KEY), 1000) or []
+
+	for event in events:
+		push_counters(frappe.safe_decode(event))
+
+
+def _apply(event, changes):
+	cache = frappe.cache()
+	args = []
+	for field, qty in changes.items():
+		args.extend((field, qty))
+
+	cache.eval(INCREMENT_SCRIPT, 1, cache.make_key(COUNTERS_KEY.format(event)), *args)
+	push_counters(event)
+
+
+def _read(event):
+	cache = frappe.cache()
+	counts = cache.execute_command("HGETALL", cache.make_key(COUNTERS_KEY.format(event)))
+	if not counts:
+		return {}
+	return {frappe.safe_decode(field): cint(value) for field, value in counts.items()}
+
+
+def _seed(event):
+	counts = {
+		"registrations": frappe.db.count("Event Registration", {"event": event, "docstatus": ["!=", 2]}),
+		"tickets_issued": 0,
+		"checked_in": 0,
+	}
+
+	rows = frappe.db.sql(
+		"""
+		SELECT ticket_type, COUNT(*), SUM(checked_in)
+		FROM `tabEvent Ticket`
+		WHERE event = %(event)s AND docstatus = 1
+		GROUP BY ticket_type
+		""",
+		{"event": event},
+	)
+	for ticket_type, issued, checked_in in rows:
+		counts["tickets_issued"] += cint(issued)
+		counts["checked_in"] += cint(checked_in)
+		counts[f"issued:{ticket_type}"] = cint(issued)
+		counts[f"checked_in:{ticket_type}"] = cint(checked_in)
+
+	cache = frappe.cache()
+	key = cache.make_key(COUNTERS_KEY.format(event))
+	pipeline = cache.pipeline()
+	pipeline.hset(key, mapping=counts)
+	pipeline.expire(key, COUNTERS_TTL)
+	pipeline.execute()
+
+	return counts
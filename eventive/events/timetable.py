@@ -0,0 +1,358 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+from bisect import bisect_left
+from datetime import timedelta
+
+import frappe
+from frappe.utils import add_days, cint, get_datetime, now_datetime
+
+TIMETABLE_KEY = "eventive:timetable:{0}"
+TIMETABLE_TTL = 7 * 24 * 60 * 60
+
+REALTIME_EVENT = "eventive_timetable"
+
+# Sessions start on this grid
+SLOT_MINUTES = 15
+
+# Length of sessions that have no start and end time yet, in minutes
+SESSION_DURATIONS = {"Talk": 45, "Panel": 60, "Workshop": 90}
+DEFAULT_DURATION = 45
+
+DAY_START = "09:00:00"
+DAY_END = "18:00:00"
+
+
+class Calendar:
+	"""Non-overlapping busy intervals of a track or speaker, kept sorted for bisect lookups."""
+
+	def __init__(self):
+		self.starts = []
+		self.ends = []
+
+	def is_free(self, start, end):
+		# Only the last interval starting before `end` can overlap, as ends are sorted too
+		i = bisect_left(self.starts, end)
+		return i == 0 or self.ends[i - 1] <= start
+
+	def add(self, start, end):
+		i = bisect_left(self.starts, start)
+		self.starts.insert(i, start)
+		self.ends.insert(i, end)
+
+
+def enqueue_timetable(event):
+	return frappe.enqueue(
+		"eventive.events.timetable.solve_timetable",
+		queue="long",
+		timeout=3600,
+		job_id=f"eventive::solve_timetable::{event}",
+		deduplicate=True,
+		event=event,
+		user=frappe.session.user,
+	)
+
+
+def solve_timetable(event, user=None):
+	"""
+	Background job: propose a timetable for an event and keep it for the organizer.
+
+	The proposal is cached for TIMETABLE_TTL and the user who asked for it is
+	notified over realtime. Nothing is written to the sessions themselves.
+
+	Returns:
+	    dict: Counts of placed and unplaced sessions and current conflicts
+	"""
+	proposal = build_timetable(event)
+	frappe.cache().set_value(TIMETABLE_KEY.format(event), proposal, expires_in_sec=TIMETABLE_TTL)
+
+	summary = {
+		"event": event,
+		"placed": len(proposal["sessions"]),
+		"unplaced": len(proposal["unplaced"]),
+		"conflicts": len(proposal["conflicts"]),
+	}
+	if user:
+		frappe.publish_realtime(REALTIME_EVENT, summary, user=user)
+
+	return summary
+
+
+def get_proposal(event):
+	return frappe.cache().get_value(TIMETABLE_KEY.format(event))
+
+
+def build_timetable(event):
+	"""
+	Propose a time slot and track for every session of an event.
+
+	Returns:
+	    dict: The proposed `sessions`, the `unplaced` ones with the reasons they
+	        could not be placed, and the `conflicts` in the current timetable
+	"""
+	start_date = frappe.db.get_value("Main Event", event, "start_date")
+	if not start_date:
+		frappe.throw("Event not found", frappe.DoesNotExistError)
+
+	tracks = get_tracks(event, start_date)
+	sessions = get_sessions(event)
+	availability = get_availability({speaker for session in sessions for speaker in session.speakers})
+
+	proposal = plan_timetable(sessions, tracks, availability)
+	proposal.update(
+		event=event,
+		generated_at=str(now_datetime()),
+		conflicts=find_conflicts(sessions, tracks, availability),
+	)
+	return proposal
+
+
+def plan_timetable(sessions, tracks, availability):
+	"""
+	Place sessions one at a time, most constrained first, in the earliest slot
+	that keeps every constraint.
+
+	A track holds one session at a time and only sessions whose capacity fits
+	its seats. Speakers present one session at a time, inside their
+	availability windows when they have any. A session keeps its current slot
+	and track when those still work, then tries other slots on its track,
+	then other tracks with enough seats.
+
+	Args:
+	    sessions (list): Sessions from `get_sessions`
+	    tracks (dict): Track ID -> track from `get_tracks`
+	    availability (dict): Speaker ID -> list of (from, to) windows
+
+	Returns:
+	    dict: `sessions` placed and `unplaced` sessions with reasons
+	"""
+	track_busy = {name: Calendar() for name in tracks}
+	speaker_busy = {}
+	placed = []
+	unplaced = []
+
+	def candidate_tracks(session):
+		fitting = [
+			track for track in tracks.values()
+			if not cint(track.capacity) or cint(session.capacity) <= cint(track.capacity)
+		]
+		# Smallest room that fits first, leaving the big rooms for big sessions
+		fitting.sort(key=lambda track: (track.name != session.track, cint(track.capacity) or float("inf"), track.day_start))
+		return fitting
+
+	options = {session.name: candidate_tracks(session) for session in sessions}
+	order = sorted(sessions, key=lambda session: (
+		len(options[session.name]),
+		-len(session.speakers),
+		-session.duration,
+		session.name,
+	))
+
+	for session in order:
+		reasons = set()
+		slot = None
+
+		if not options[session.name]:
+			reasons.add("No track has enough seats")
+
+		for track in options[session.name]:
+			for start in candidate_starts(session, track):
+				end = start + session.duration
+				reason = check_slot(session, track, start, end, track_busy, speaker_busy, availability)
+				if not reason:
+					slot = (track, start, end)
+					break
+				reasons.add(reason)
+			if slot:
+				break
+
+		if not slot:
+			unplaced.append({
+				"session": session.name,
+				"session_title": session.session_title,
+				"reasons": sorted(reasons or {"Longer than any track day"}),
+			})
+			continue
+
+		track, start, end = slot
+		track_busy[track.name].add(start, end)
+		for speaker in session.speakers:
+			speaker_busy.setdefault(speaker, Calendar()).add(start, end)
+
+		placed.append({
+			"session": session.name,
+			"session_title": session.session_title,
+			"track": track.name,
+			"day": track.day,
+			"start_time": str(start),
+			"end_time": str(end),
+			"moved": track.name != session.track or start != session.start_time,
+		})
+
+	placed.sort(key=lambda row: (row["start_time"], row["track"]))
+	return {"sessions": placed, "unplaced": unplaced}
+
+
+def candidate_starts(session, track):
+	"""Slot starts on a track's day, the session's current start first."""
+	latest = track.day_end - session.duration
+	if session.start_time and track.day_start <= session.start_time <= latest:
+		yield session.start_time
+
+	start = track.day_start
+	step = timedelta(minutes=SLOT_MINUTES)
+	while start <= latest:
+		if start != session.start_time:
+			yield start
+		start += step
+
+
+def check_slot(session, track, start, end, track_busy, speaker_busy, availability):
+	"""The first constraint a slot breaks, or None when the session fits."""
+	if not track_busy[track.name].is_free(start, end):
+		return "Track is full"
+
+	for speaker in session.speakers:
+		if not is_available(availability.get(speaker), start, end):
+			return f"Speaker {speaker} is unavailable"
+		if speaker in speaker_busy and not speaker_busy[speaker].is_free(start, end):
+			return f"Speaker {speaker} is presenting elsewhere"
+
+
+def is_available(windows, start, end):
+	"""Speakers without availability windows can present at any time."""
+	return not windows or any(available_from <= start and end <= available_to for available_from, available_to in windows)
+
+
+def find_conflicts(sessions, tracks, availability):
+	"""
+	Conflicts in the timetable as organizers have set it up.
+
+	Returns:
+	    list: Track overlaps, speaker double-bookings, sessions outside speaker
+	        availability or their track's day, and sessions too big for their track
+	"""
+	conflicts = []
+	by_track = {}
+	by_speaker = {}
+
+	for session in sessions:
+		if not (session.start_time and session.end_time):
+			continue
+
+		track = tracks.get(session.track)
+		if track:
+			by_track.setdefault(track.name, []).append(session)
+			if session.start_time < track.day_start or session.end_time > track.day_end:
+				conflicts.append({
+					"type": "Outside Track Day",
+					"sessions": [session.name],
+					"track": track.name,
+				})
+			if cint(track.capacity) and cint(session.capacity) > cint(track.capacity):
+				conflicts.append({
+					"type": "Track Too Small",
+					"sessions": [session.name],
+					"track": track.name,
+				})
+
+		for speaker in session.speakers:
+			by_speaker.setdefault(speaker, []).append(session)
+			if not is_available(availability.get(speaker), session.start_time, session.end_time):
+				conflicts.append({
+					"type": "Speaker Unavailable",
+					"sessions": [session.name],
+					"speaker": speaker,
+				})
+
+	for track, rows in by_track.items():
+		for first, second in find_overlaps(rows):
+			conflicts.append({"type": "Track Overlap", "sessions": [first, second], "track": track})
+
+	for speaker, rows in by_speaker.items():
+		for first, second in find_overlaps(rows):
+			conflicts.append({"type": "Speaker Double-Booked", "sessions": [first, second], "speaker": speaker})
+
+	return conflicts
+
+
+def find_overlaps(sessions):
+	"""Pairs of overlapping sessions, each against the latest ending one before it."""
+	overlaps = []
+	latest = None
+	for session in sorted(sessions, key=lambda session: session.start_time):
+		if latest and session.start_time < latest.end_time:
+			overlaps.append((latest.name, session.name))
+		if not latest or session.end_time > latest.end_time:
+			latest = session
+	return overlaps
+
+
+def get_tracks(event, start_date):
+	tracks = frappe.get_all(
+		"Event Day Track",
+		filters={"event": event},
+		fields=["name", "day", "capacity", "day_start", "day_end"],
+		order_by="day asc, name asc",
+		ignore_permissions=True
+	)
+
+	for track in tracks:
+		date = add_days(start_date, cint(track.day or 1) - 1)
+		track.day_start = get_datetime(f"{date} {track.day_start or DAY_START}")
+		track.day_end = get_datetime(f"{date} {track.day_end or DAY_END}")
+
+	return {track.name: track for track in tracks}
+
+
+def get_sessions(event):
+	sessions = frappe.get_all(
+		"Event Session",
+		filters={"event": event},
+		fields=["name", "session_title", "session_type", "track", "start_time", "end_time", "capacity"],
+		ignore_permissions=True
+	)
+	if not sessions:
+		return []
+
+	speakers = frappe.db.sql(
+		"""
+		SELECT parent, speaker
+		FROM `tabTalk Speaker`
+		WHERE parenttype = 'Event Session' AND parent IN %(sessions)s AND IFNULL(speaker, '') != ''
+		""",
+		{"sessions": tuple(session.name for session in sessions)},
+	)
+	by_session = {}
+	for parent, speaker in speakers:
+		by_session.setdefault(parent, set()).add(speaker)
+
+	for session in sessions:
+		session.speakers = sorted(by_session.get(session.name, ()))
+		session.start_time = get_datetime(session.start_time) if session.start_time else None
+		session.end_time = get_datetime(session.end_time) if session.end_time else None
+
+		if session.start_time and session.end_time and session.end_time > session.start_time:
+			session.duration = session.end_time - session.start_time
+		else:
+			session.duration = timedelta(minutes=SESSION_DURATIONS.get(session.session_type, DEFAULT_DURATION))
+
+	return sessions
+
+
+def get_availability(speakers):
+	"""Speaker ID -> (from, to) windows, for speakers with any."""
+	if not speakers:
+		return {}
+
+	rows = frappe.get_all(
+		"Speaker Availability",
+		filters={"parenttype": "Speaker", "parent": ["in", list(speakers)]},
+		fields=["parent", "available_from", "available_to"],
+		ignore_permissions=True
+	)
+
+	availability = {}
+	for row in rows:
+		availability.setdefault(row.parent, []).append((get_datetime(row.available_from), get_datetime(row.available_to)))
+	return availability
@@ -139,17 +139,80 @@ fixtures = ["Custom Field", "Property Setter", "Print Format", "Role", "Workflow
 # ---------------
 # Hook on document methods and events
 
-# doc_events = {
-# 	"*": {
-# 		"on_update": "method",
-# 		"on_cancel": "method",
-# 		"on_trash": "method"
-# 	}
-# }
+doc_events = {
+	"Main Event": {
+		"on_update": [
+			"eventive.events.catalog.invalidate_catalog",
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.events.calendar_feed.invalidate_feeds",
+			"eventive.ticketing.doctype.seat_inventory.seat_inventory.sync_capacity"
+		],
+		"on_trash": [
+			"eventive.events.catalog.invalidate_catalog",
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.events.calendar_feed.invalidate_feeds"
+		],
+		"after_rename": [
+			"eventive.events.catalog.invalidate_catalog",
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.events.calendar_feed.invalidate_feeds",
+			"eventive.ticketing.doctype.seat_inventory.seat_inventory.rename_inventory"
+		]
+	},
+	"Event Session": {
+		"on_update": [
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.events.calendar_feed.invalidate_feeds"
+		],
+		"on_trash": [
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.events.calendar_feed.invalidate_feeds"
+		]
+	},
+	"Attendee Profile": {
+		"on_update": "eventive.networking.matchmaking.queue_profile_update"
+	},
+	"Attendee Schedule": {
+		"on_update": "eventive.events.calendar_feed.invalidate_feeds",
+		"on_trash": "eventive.events.calendar_feed.invalidate_feeds"
+	},
+	"Ticket Type": {
+		"on_update": [
+			"eventive.events.bundle.invalidate_event_bundle",
+			"eventive.ticketing.doctype.seat_inventory.seat_inventory.sync_capacity"
+		],
+		"on_trash": "eventive.events.bundle.invalidate_event_bundle"
+	},
+	"Merchandise": {
+		"on_update": "eventive.events.bundle.invalidate_event_bundle",
+		"on_trash": "eventive.events.bundle.invalidate_event_bundle"
+	},
+	"Sponsor Tier": {
+		"on_update": "eventive.events.bundle.invalidate_event_bundle",
+		"on_trash": "eventive.events.bundle.invalidate_event_bundle"
+	},
+	"Booth Package": {
+		"on_update": "eventive.events.bundle.invalidate_event_bundle",
+		"on_trash": "eventive.events.bundle.invalidate_event_bundle"
+	},
+	"Digital Content": {
+		"on_update": "eventive.events.bundle.invalidate_event_bundle",
+		"on_trash": "eventive.events.bundle.invalidate_event_bundle"
+	}
+}
 
 # Scheduled Tasks
 # ---------------
 
+scheduler_events = {
+	"cron": {
+		"* * * * *": [
+			"eventive.ticketing.doctype.checkout_hold.checkout_hold.expire_holds",
+			"eventive.events.counters.push_pending_counters"
+		]
+	}
+}
+
 # scheduler_events = {
 # 	"all": [
 # 		"eventive.tasks.all"
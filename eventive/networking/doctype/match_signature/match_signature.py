@@ -0,0 +1,13 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+
+
+class MatchSignature(Document):
+	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Match Signature", ["event", "attendee_profile"])
@@ -1,9 +1,15 @@
 # Copyright (c) 2026, Munene Morris and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
 
 
 class MatchSuggestion(Document):
 	pass
+
+
+def on_doctype_update():
+	frappe.db.add_index("Match Suggestion", ["event", "status"])
+	frappe.db.add_index("Match Suggestion", ["attendee_1", "status", "match_score"])
+	frappe.db.add_index("Match Suggestion", ["attendee_2", "status", "match_score"])
@@ -1,9 +1,22 @@
 # Copyright (c) 2026, Munene Morris and contributors
 # For license information, please see license.txt
 
-# import frappe
+import hashlib
+
+import frappe
 from frappe.model.document import Document
 
 
 class NetworkingMessage(Document):
-	pass
+	def validate(self):
+		self.conversation = get_conversation_key(self.sender, self.receiver)
+
+
+def get_conversation_key(user, other_user):
+	"""Same key for both directions of a conversation, short enough for a Data field index."""
+	return hashlib.sha1("\n".join(sorted((user, other_user))).encode()).hexdigest()
+
+
+def on_doctype_update():
+	frappe.db.add_index("Networking Message", ["conversation", "creation"])
+	frappe.db.add_index("Networking Message", ["receiver", "is_read"])
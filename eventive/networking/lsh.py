@@ -0,0 +1,223 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import base64
+import hashlib
+from functools import lru_cache
+
+import frappe
+from frappe.utils import now_datetime
+
+# 16 bands of 4 rows put pairs above roughly 0.5 Jaccard similarity in a
+# shared bucket most of the time, and pairs below 0.2 rarely
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+
+PRIME = (1 << 31) - 1
+
+# Candidates scored per attendee, most shared buckets first
+MAX_CANDIDATES = 2000
+
+INDEX_CHUNK_SIZE = 1000
+
+
+def get_signatures(features):
+	"""
+	MinHash signatures for feature dicts, one uint32 array per row or None
+	for rows without features.
+	"""
+	import numpy as np
+
+	a, b = _permutations()
+	signatures = []
+	for row in features:
+		if not row:
+			signatures.append(None)
+			continue
+
+		values = np.array([_hash(feature) for feature in row], dtype=np.uint64)
+		signatures.append(((a[:, None] * values[None, :] + b[:, None]) % PRIME).min(axis=1).astype(np.uint32))
+
+	return signatures
+
+
+def get_buckets(event, signature):
+	"""(band, bucket) pairs of a signature. Buckets hash in the event, so one indexed column finds them."""
+	prefix = event.encode() + b"\0"
+	return [
+		(band, hashlib.blake2b(prefix + bytes([band]) + signature[band * ROWS:(band + 1) * ROWS].tobytes(), digest_size=8).hexdigest())
+		for band in range(BANDS)
+	]
+
+
+def save_index(event, names, signatures):
+	"""Replace an event's persisted index with signatures of Attendee Profiles, in chunks."""
+	delete_index(event)
+
+	rows = [(name, signature) for name, signature in zip(names, signatures) if signature is not None]
+	for start in range(0, len(rows), INDEX_CHUNK_SIZE):
+		insert_signatures(event, rows[start:start + INDEX_CHUNK_SIZE])
+		frappe.db.commit()
+
+
+def delete_index(event, profiles=None):
+	filters = {"event": event}
+	if profiles:
+		filters["attendee_profile"] = ["in", list(profiles)]
+
+	while True:
+		names = frappe.get_all("Match Signature", filters=filters, pluck="name", limit=INDEX_CHUNK_SIZE, ignore_permissions=True)
+		if not names:
+			break
+
+		frappe.db.delete("Match Bucket", {"parenttype": "Match Signature", "parent": ["in", names]})
+		frappe.db.delete("Match Signature", {"name": ["in", names]})
+		if len(names) < INDEX_CHUNK_SIZE:
+			break
+
+
+def insert_signatures(event, rows):
+	now = now_datetime()
+	owner = frappe.session.user
+	parents = []
+	children = []
+
+	for profile, signature in rows:
+		parent = frappe.generate_hash(length=10)
+		parents.append((parent, now, now, owner, owner, 0, event, profile, encode(signature)))
+
+		for idx, (band, bucket) in enumerate(get_buckets(event, signature), start=1):
+			children.append((
+				frappe.generate_hash(length=10), now, now, owner, owner, 0,
+				parent, "Match Signature", "buckets", idx, band, bucket,
+			))
+
+	frappe.db.bulk_insert(
+		"Match Signature",
+		fields=["name", "creation", "modified", "owner", "modified_by", "docstatus", "event", "attendee_profile", "signature"],
+		values=parents,
+	)
+	frappe.db.bulk_insert(
+		"Match Bucket",
+		fields=[
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"parent", "parenttype", "parentfield", "idx", "band", "bucket",
+		],
+		values=children,
+	)
+
+
+def get_nearest(event, profile, signature=None, k=20):
+	"""
+	Who an Attendee Profile should meet at an event, from the persisted index.
+
+	Only profiles sharing at least one bucket are fetched, in one indexed
+	query, and ranked by the share of equal MinHash values, which estimates
+	the Jaccard similarity of their features.
+
+	Args:
+	    event (str): The event ID
+	    profile (str): The Attendee Profile ID
+	    signature: The profile's signature, read from the index when omitted
+	    k (int): Matches to return
+
+	Returns:
+	    list: (Attendee Profile ID, score 0-100) pairs, best first
+	"""
+	import numpy as np
+
+	if signature is None:
+		stored = frappe.db.get_value("Match Signature", {"event": event, "attendee_profile": profile}, "signature")
+		if not stored:
+			return []
+		signature = decode(stored)
+
+	candidates = frappe.db.sql(
+		"""
+		SELECT s.attendee_profile, s.signature, COUNT(*) AS shared
+		FROM `tabMatch Bucket` b
+		JOIN `tabMatch Signature` s ON s.name = b.parent AND b.parenttype = 'Match Signature'
+		WHERE b.bucket IN %(buckets)s AND s.event = %(event)s AND s.attendee_profile != %(profile)s
+		GROUP BY s.attendee_profile, s.signature
+		ORDER BY shared DESC
+		LIMIT %(limit)s
+		""",
+		{
+			"buckets": tuple(bucket for _, bucket in get_buckets(event, signature)),
+			"event": event,
+			"profile": profile,
+			"limit": MAX_CANDIDATES,
+		},
+	)
+	if not candidates:
+		return []
+
+	others = np.stack([decode(row[1]) for row in candidates])
+	scores = np.rint((others == signature).mean(axis=1) * 100).astype(int)
+
+	order = np.argsort(-scores, kind="stable")[:k]
+	return [(candidates[i][0], int(scores[i])) for i in order if scores[i] > 0]
+
+
+def candidate_matches(matrix, signatures, k=20):
+	"""
+	Yield (row, other row, match score) for each row's k best candidates.
+
+	Like `matchmaking.top_matches`, but rows are scored exactly only against
+	rows sharing an LSH bucket, at most MAX_CANDIDATES each, instead of the
+	whole population.
+	"""
+	import numpy as np
+
+	buckets = {}
+	keys = []
+	for i, signature in enumerate(signatures):
+		row_keys = get_buckets("", signature) if signature is not None else []
+		keys.append(row_keys)
+		for key in row_keys:
+			buckets.setdefault(key, []).append(i)
+
+	for i, row_keys in enumerate(keys):
+		candidates = {}
+		for key in row_keys:
+			for j in buckets[key]:
+				if len(candidates) >= MAX_CANDIDATES:
+					break
+				if j != i:
+					candidates[j] = None
+		if not candidates:
+			continue
+
+		columns = np.fromiter(candidates, dtype=np.int64)
+		scores = (matrix[columns] @ matrix[i].T).toarray().ravel()
+
+		top = np.argsort(-scores, kind="stable")[:k]
+		for idx in top:
+			score = int(round(float(scores[idx]) * 100))
+			if score > 0:
+				yield i, int(columns[idx]), score
+
+
+def encode(signature):
+	return base64.b64encode(signature.tobytes()).decode()
+
+
+def decode(value):
+	import numpy as np
+
+	return np.frombuffer(base64.b64decode(value), dtype=np.uint32)
+
+
+@lru_cache(maxsize=1)
+def _permutations():
+	"""Hash coefficients derived from fixed seeds, so stored signatures stay comparable."""
+	import numpy as np
+
+	a = [_hash(f"a{i}") % (PRIME - 1) + 1 for i in range(NUM_PERM)]
+	b = [_hash(f"b{i}") for i in range(NUM_PERM)]
+	return np.array(a, dtype=np.uint64), np.array(b, dtype=np.uint64)
+
+
+def _hash(value):
+	return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big") % PRIME
@@ -0,0 +1,456 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import re
+
+import frappe
+from frappe.utils import get_datetime, now_datetime
+
+from eventive.networking import lsh
+
+# Suggestions kept per attendee
+TOP_K = 20
+
+# Attendees scored per sparse product, bounding the dense score block to
+# SCORE_CHUNK_SIZE x attendees float32s
+SCORE_CHUNK_SIZE = 500
+
+MATCH_CHUNK_SIZE = 5000
+
+# Above this many attendees only pairs sharing an LSH bucket are scored
+EXACT_LIMIT = 50000
+
+# LSH candidates scored when a single profile changes
+PROFILE_CANDIDATES = 200
+
+# Feature -> IDF weight of an event's last batch run, so single profiles are scored on the same scale
+IDF_KEY = "eventive:match_idf:{0}"
+
+# Profile fields that feed the features
+MATCH_FIELDS = ("open_to_networking", "company", "job_title")
+
+# Shared interests say the most about a pair, shared employers and job titles less
+INTEREST_WEIGHT = 1.0
+COMPANY_WEIGHT = 0.5
+JOB_TITLE_WEIGHT = 0.5
+
+WORD_RE = re.compile(r"[a-z0-9]{2,}")
+
+
+def enqueue_match_generation(event):
+	return frappe.enqueue(
+		"eventive.networking.matchmaking.generate_matches",
+		queue="long",
+		timeout=3600,
+		job_id=f"eventive::generate_matches::{event}",
+		deduplicate=True,
+		event=event,
+	)
+
+
+def generate_matches(event):
+	"""
+	Background job: suggest the TOP_K best matches for every networking attendee of an event.
+
+	Interest Tags, company and job title become IDF weighted, L2 normalised
+	sparse vectors, so a sparse product gives the cosine similarity of every
+	pair. Products run SCORE_CHUNK_SIZE attendees at a time. A pair is
+	suggested when either attendee has the other in their top K. Suggested
+	rows are replaced; Connected and Ignored pairs are left alone and never
+	suggested again. Rows are written with bulk inserts, committing every
+	MATCH_CHUNK_SIZE rows, and the previous run's rows are only deleted once
+	every new row is in, so attendees never see an empty list.
+
+	Above EXACT_LIMIT attendees each one is only scored against the
+	attendees sharing a MinHash LSH bucket. The LSH index is saved either
+	way, for single profile lookups.
+
+	Returns:
+	    dict: Attendees scored and suggestions written
+	"""
+	if not frappe.db.get_value("Main Event", event, "allow_networking"):
+		return {"attendees": 0, "suggestions": 0}
+
+	started = now_datetime()
+	profiles = get_profiles(event)
+	names = [profile.name for profile in profiles]
+	features = [get_features(profile) for profile in profiles]
+	signatures = lsh.get_signatures(features)
+
+	idf = get_idf(features)
+	frappe.cache().set_value(IDF_KEY.format(event), idf)
+
+	pairs = {}
+	if len(profiles) > 1:
+		matrix = build_matrix(features, idf)
+		if len(profiles) > EXACT_LIMIT:
+			matches = lsh.candidate_matches(matrix, signatures, TOP_K)
+		else:
+			matches = top_matches(matrix)
+
+		for i, j, score in matches:
+			pair = (names[i], names[j]) if names[i] < names[j] else (names[j], names[i])
+			pairs[pair] = max(pairs.get(pair, 0), score)
+
+	for pair in get_decided_pairs(event):
+		pairs.pop(pair, None)
+
+	pairs = list(pairs.items())
+	for start in range(0, len(pairs), MATCH_CHUNK_SIZE):
+		insert_suggestions(event, pairs[start:start + MATCH_CHUNK_SIZE])
+		frappe.db.commit()
+	delete_suggestions(event, before=started)
+
+	lsh.save_index(event, names, signatures)
+
+	return {"attendees": len(profiles), "suggestions": len(pairs)}
+
+
+def queue_profile_update(doc, method=None):
+	"""
+	doc_events handler for Attendee Profile: queue `update_profile_matches` when
+	anything matches are computed from has changed.
+
+	The job ID is per profile, so a burst of edits runs the job once. Edits
+	saved while the job runs are deduplicated against it, so the job itself
+	runs again until the profile stops changing.
+	"""
+	before = doc.get_doc_before_save()
+	if before:
+		interests = sorted(row.interest or "" for row in doc.interests)
+		if not any(doc.has_value_changed(field) for field in MATCH_FIELDS) \
+				and interests == sorted(row.interest or "" for row in before.interests):
+			return
+
+	frappe.enqueue(
+		"eventive.networking.matchmaking.update_profile_matches",
+		job_id=f"eventive::update_profile_matches::{doc.name}",
+		deduplicate=True,
+		enqueue_after_commit=True,
+		profile=doc.name,
+	)
+
+
+def update_profile_matches(profile):
+	"""
+	Background job: recompute one Attendee Profile's suggestions in every
+	upcoming event it holds a ticket for and that has a match index, again
+	for as long as the profile is modified while it runs.
+	"""
+	while True:
+		started = now_datetime()
+		user = frappe.db.get_value("Attendee Profile", profile, "user")
+		if not user:
+			return
+
+		for event in get_profile_events(user):
+			patch_profile_matches(event, profile)
+			frappe.db.commit()
+
+		# Start a new transaction, so edits committed meanwhile are seen
+		frappe.db.rollback()
+		modified = frappe.db.get_value("Attendee Profile", profile, "modified")
+		if not modified or get_datetime(modified) <= started:
+			return
+
+
+def patch_profile_matches(event, profile):
+	"""
+	Re-score a profile's Suggested matches and replace its LSH entry in one event.
+
+	Candidates come from the profile's LSH buckets, together with the
+	profiles it is already suggested with, and are scored exactly with the
+	IDF weights of the event's last batch run. Only those pairs are
+	rewritten: the profile's TOP_K best candidates are suggested, and pairs
+	that came from the other attendee's top K keep their place with the new
+	score unless it dropped to 0.
+
+	Returns:
+	    int: Suggestions written
+	"""
+	import numpy as np
+
+	existing = get_suggested_partners(event, profile)
+	lsh.delete_index(event, [profile])
+
+	rows = get_profiles(event, [profile])
+	features = get_features(rows[0]) if rows else None
+	if not features:
+		delete_pairs(event, profile, existing)
+		return 0
+
+	signature = lsh.get_signatures([features])[0]
+	lsh.insert_signatures(event, [(profile, signature)])
+
+	candidates = [name for name, _ in lsh.get_nearest(event, profile, signature, k=PROFILE_CANDIDATES)]
+	rescored = list(dict.fromkeys(candidates + existing))
+	delete_pairs(event, profile, rescored)
+
+	others = get_profiles(event, rescored) if rescored else []
+	if not others:
+		return 0
+
+	idf = frappe.cache().get_value(IDF_KEY.format(event))
+	matrix = build_matrix([features] + [get_features(other) for other in others], idf)
+
+	scores = (matrix[1:] @ matrix[0].T).toarray().ravel()
+	decided = get_decided_pairs(event, profile)
+	top = set(np.argsort(-scores, kind="stable")[:TOP_K].tolist())
+	kept = set(existing)
+
+	pairs = []
+	for idx, other in enumerate(others):
+		score = int(round(float(scores[idx]) * 100))
+		pair = (profile, other.name) if profile < other.name else (other.name, profile)
+		if score > 0 and pair not in decided and (idx in top or other.name in kept):
+			pairs.append((pair, score))
+
+	insert_suggestions(event, pairs)
+	return len(pairs)
+
+
+def get_suggested_partners(event, profile):
+	"""Profiles an Attendee Profile is currently suggested with in an event."""
+	return frappe.db.sql_list(
+		"""
+		SELECT attendee_2 FROM `tabMatch Suggestion`
+		WHERE attendee_1 = %(profile)s AND status = 'Suggested' AND event = %(event)s
+		UNION
+		SELECT attendee_1 FROM `tabMatch Suggestion`
+		WHERE attendee_2 = %(profile)s AND status = 'Suggested' AND event = %(event)s
+		""",
+		{"event": event, "profile": profile},
+	)
+
+
+def delete_pairs(event, profile, others):
+	"""Delete the Suggested rows pairing a profile with others, in either order."""
+	if not others:
+		return
+
+	for field, other_field in (("attendee_1", "attendee_2"), ("attendee_2", "attendee_1")):
+		frappe.db.delete("Match Suggestion", {
+			"event": event,
+			"status": "Suggested",
+			field: profile,
+			other_field: ["in", others],
+		})
+
+
+def get_profile_events(user):
+	"""Upcoming networking events a user holds a valid ticket for, where matches have been generated."""
+	events = frappe.db.sql_list(
+		"""
+		SELECT DISTINCT t.event
+		FROM `tabEvent Ticket` t
+		JOIN `tabMain Event` e ON e.name = t.event
+		WHERE t.email = %(user)s AND t.docstatus = 1 AND t.status = 'Valid'
+			AND e.allow_networking = 1 AND IFNULL(e.end_date, CURDATE()) >= CURDATE()
+		""",
+		{"user": user},
+	)
+	return [event for event in events if frappe.db.exists("Match Signature", {"event": event})]
+
+
+def get_profiles(event, names=None):
+	"""
+	Attendee Profiles open to networking whose user holds a valid ticket for the event.
+
+	Args:
+	    event (str): The event ID
+	    names (list): Only these Attendee Profiles
+
+	Returns:
+	    list: Profiles with `name`, `company`, `job_title` and `interests`
+	"""
+	condition = "AND p.name IN %(names)s" if names else ""
+	profiles = frappe.db.sql(
+		f"""
+		SELECT p.name, p.company, p.job_title
+		FROM `tabAttendee Profile` p
+		WHERE p.open_to_networking = 1 {condition}
+			AND EXISTS (
+				SELECT 1 FROM `tabEvent Ticket` t
+				WHERE t.event = %(event)s AND t.email = p.user AND t.docstatus = 1 AND t.status = 'Valid'
+			)
+		ORDER BY p.name ASC
+		""",
+		{"event": event, "names": tuple(names or ())},
+		as_dict=True,
+	)
+
+	by_name = {profile.name: profile for profile in profiles}
+	for profile in profiles:
+		profile.interests = []
+
+	names = list(by_name)
+	for start in range(0, len(names), MATCH_CHUNK_SIZE):
+		rows = frappe.get_all(
+			"Interest Tags",
+			filters={
+				"parenttype": "Attendee Profile",
+				"parent": ["in", names[start:start + MATCH_CHUNK_SIZE]]
+			},
+			fields=["parent", "interest"],
+			ignore_permissions=True
+		)
+		for row in rows:
+			by_name[row.parent].interests.append(row.interest)
+
+	return profiles
+
+
+def get_features(profile):
+	"""Feature -> weight for a profile's interests, company and job title words."""
+	features = {}
+	for interest in profile.interests:
+		interest = normalize(interest)
+		if interest:
+			features[f"interest:{interest}"] = INTEREST_WEIGHT
+
+	company = normalize(profile.company)
+	if company:
+		features[f"company:{company}"] = COMPANY_WEIGHT
+
+	for word in WORD_RE.findall((profile.job_title or "").lower()):
+		features[f"title:{word}"] = JOB_TITLE_WEIGHT
+
+	return features
+
+
+def get_idf(features):
+	"""
+	Feature -> inverse document frequency across feature dicts.
+
+	Features everyone shares say little about a pair. `None` holds the
+	weight of features nobody had yet.
+	"""
+	import numpy as np
+
+	frequency = {}
+	for row in features:
+		for feature in row:
+			frequency[feature] = frequency.get(feature, 0) + 1
+
+	count = len(features)
+	idf = {feature: float(np.log((1 + count) / (1 + df)) + 1) for feature, df in frequency.items()}
+	idf[None] = float(np.log(1 + count) + 1)
+	return idf
+
+
+def build_matrix(features, idf=None):
+	"""
+	CSR matrix with a row per feature dict, IDF weighted and L2 normalised.
+
+	With unit rows, `matrix @ matrix.T` is the cosine similarity of every pair.
+
+	Args:
+	    features (list): Feature dicts from `get_features`
+	    idf (dict): Weights from `get_idf`, computed from `features` when omitted
+	"""
+	import numpy as np
+	from scipy import sparse
+
+	if idf is None:
+		idf = get_idf(features)
+
+	vocabulary = {}
+	rows, cols, data = [], [], []
+	for i, row in enumerate(features):
+		for feature, weight in row.items():
+			rows.append(i)
+			cols.append(vocabulary.setdefault(feature, len(vocabulary)))
+			data.append(weight)
+
+	matrix = sparse.csr_matrix(
+		(np.array(data, dtype=np.float32), (rows, cols)),
+		shape=(len(features), len(vocabulary)),
+	)
+
+	weights = np.array([idf.get(feature, idf[None]) for feature in vocabulary], dtype=np.float32)
+	matrix = matrix @ sparse.diags(weights)
+
+	norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+	norms[norms == 0] = 1
+	return (sparse.diags((1 / norms).astype(np.float32)) @ matrix).tocsr()
+
+
+def top_matches(matrix, k=TOP_K, chunk_size=SCORE_CHUNK_SIZE):
+	"""
+	Yield (row, other row, match score) for each row's k most similar rows.
+
+	Scores are cosine similarities scaled to 0-100. Pairs sharing no feature
+	are skipped.
+	"""
+	import numpy as np
+
+	count = matrix.shape[0]
+	k = min(k, count - 1)
+	if k < 1:
+		return
+
+	transposed = matrix.T.tocsc()
+	for start in range(0, count, chunk_size):
+		stop = min(start + chunk_size, count)
+		scores = (matrix[start:stop] @ transposed).toarray()
+		# Nobody is their own match
+		scores[np.arange(stop - start), np.arange(start, stop)] = 0
+
+		top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+		for offset, columns in enumerate(top):
+			for column in columns:
+				score = int(round(float(scores[offset, column]) * 100))
+				if score > 0:
+					yield start + offset, int(column), score
+
+
+def get_decided_pairs(event, profile=None):
+	"""Pairs, ordered by name, that attendees have already connected or ignored."""
+	condition = "AND (attendee_1 = %(profile)s OR attendee_2 = %(profile)s)" if profile else ""
+	rows = frappe.db.sql(
+		f"""
+		SELECT attendee_1, attendee_2
+		FROM `tabMatch Suggestion`
+		WHERE event = %(event)s AND status IN ('Connected', 'Ignored') {condition}
+		""",
+		{"event": event, "profile": profile},
+	)
+	return {(a, b) if a < b else (b, a) for a, b in rows}
+
+
+def delete_suggestions(event, before):
+	"""Delete an event's Suggested rows created before a time, in chunks."""
+	while True:
+		names = frappe.get_all(
+			"Match Suggestion",
+			filters={"event": event, "status": "Suggested", "creation": ["<", before]},
+			pluck="name",
+			limit=MATCH_CHUNK_SIZE,
+			ignore_permissions=True
+		)
+		if not names:
+			break
+
+		frappe.db.delete("Match Suggestion", {"name": ["in", names]})
+		frappe.db.commit()
+
+
+def insert_suggestions(event, pairs):
+	now = now_datetime()
+	owner = frappe.session.user
+
+	frappe.db.bulk_insert(
+		"Match Suggestion",
+		fields=[
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"event", "attendee_1", "attendee_2", "match_score", "status",
+		],
+		values=[
+			(frappe.generate_hash(length=10), now, now, owner, owner, 0, event, attendee_1, attendee_2, score, "Suggested")
+			for (attendee_1, attendee_2), score in pairs
+		],
+	)
+
+
+def normalize(text):
+	return " ".join(WORD_RE.findall((text or "").lower()))
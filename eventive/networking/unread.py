@@ -0,0 +1,152 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import cint
+
+from eventive.networking.doctype.networking_message.networking_message import get_conversation_key
+
+# Other user -> unread messages from them, per user
+UNREAD_KEY = "eventive:unread_messages:{0}"
+
+# Counts are rebuilt from the database once a day, which bounds any drift
+UNREAD_TTL = 24 * 60 * 60
+
+# Lifetime of a hash while it is being seeded, so one left behind by a failed
+# seed is soon rebuilt instead of making every read count from the database
+SEEDING_TTL = 30
+
+# Present in every hash, so users without unread messages are not seeded on
+# every read. 0 while the counts are being seeded, 1 once they are complete.
+SEEDED_FIELD = "_seeded"
+
+REALTIME_EVENT = "eventive_message"
+
+# Only increments existing hashes. Seeding creates the hash before counting, so
+# messages delivered while the database is counted are kept, and messages
+# delivered earlier are left to the count
+INCREMENT_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+	return 0
+end
+redis.call('HINCRBY', KEYS[1], ARGV[1], 1)
+return 1
+"""
+
+
+def deliver(message):
+	"""
+	Once the message is committed, count it as unread for its receiver and push
+	it to the receiver's socket.io room.
+	"""
+	frappe.db.after_commit.add(lambda: _increment(message.receiver, message.sender))
+	frappe.publish_realtime(
+		REALTIME_EVENT,
+		{
+			"id": message.name,
+			"event_id": message.event,
+			"sender_id": message.sender,
+			"receiver_id": message.receiver,
+			"sender_name": message.sender_name,
+			"receiver_name": message.receiver_name,
+			"message": message.message,
+			"is_read": False,
+			"created_at": str(message.creation),
+		},
+		user=message.receiver,
+		after_commit=True,
+	)
+
+
+def get_unread_counts(user):
+	"""
+	Unread messages of a user, per conversation.
+
+	Returns:
+	    dict: `total` and `conversations`, other user ID -> unread count
+	"""
+	counts = _read(user)
+	if counts is None:
+		counts = _seed(user)
+
+	return {"total": sum(counts.values()), "conversations": counts}
+
+
+def mark_conversation_read(user, other_user):
+	"""
+	Mark every message another user sent to a user as read, in one UPDATE
+	through the conversation index.
+
+	Returns:
+	    int: Messages marked as read
+	"""
+	frappe.db.sql(
+		"""
+		UPDATE `tabNetworking Message`
+		SET is_read = 1
+		WHERE conversation = %(conversation)s AND receiver = %(user)s AND is_read = 0
+		""",
+		{"conversation": get_conversation_key(user, other_user), "user": user},
+	)
+	updated = frappe.db._cursor.rowcount
+
+	frappe.db.after_commit.add(lambda: frappe.cache().hdel(UNREAD_KEY.format(user), other_user))
+	return updated
+
+
+def _increment(user, other_user):
+	cache = frappe.cache()
+	cache.eval(INCREMENT_SCRIPT, 1, cache.make_key(UNREAD_KEY.format(user)), other_user)
+
+
+def _read(user):
+	cache = frappe.cache()
+	counts = cache.execute_command("HGETALL", cache.make_key(UNREAD_KEY.format(user)))
+	if not counts:
+		return None
+
+	counts = {frappe.safe_decode(field): cint(value) for field, value in counts.items()}
+	if not counts.pop(SEEDED_FIELD, 0):
+		# Another request is seeding the counts
+		return _count(user)
+
+	return {other_user: count for other_user, count in counts.items() if count > 0}
+
+
+def _seed(user):
+	"""
+	Seed a user's counters from the database.
+
+	The hash is created before counting, so messages delivered while the
+	query runs are incremented rather than lost, and the database counts are
+	added on top. Only the request that creates the hash seeds it.
+	"""
+	cache = frappe.cache()
+	key = cache.make_key(UNREAD_KEY.format(user))
+	if not cache.hsetnx(key, SEEDED_FIELD, 0):
+		return _count(user)
+	cache.expire(key, SEEDING_TTL)
+
+	counts = _count(user)
+
+	pipeline = cache.pipeline()
+	for other_user, count in counts.items():
+		pipeline.hincrby(key, other_user, count)
+	pipeline.hset(key, SEEDED_FIELD, 1)
+	pipeline.expire(key, UNREAD_TTL)
+	pipeline.execute()
+
+	return counts
+
+
+def _count(user):
+	counts = frappe.db.sql(
+		"""
+		SELECT sender, COUNT(*)
+		FROM `tabNetworking Message`
+		WHERE receiver = %(user)s AND is_read = 0
+		GROUP BY sender
+		""",
+		{"user": user},
+	)
+	return {other_user: cint(count) for other_user, count in counts}
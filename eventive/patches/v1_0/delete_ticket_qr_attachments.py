@@ -0,0 +1,10 @@
+import frappe
+
+from eventive.ticketing.qr import delete_qr_attachments
+
+
+def execute():
+	delete_qr_attachments()
+
+	if frappe.db.has_column("Event Ticket", "qr_code"):
+		frappe.db.sql("UPDATE `tabEvent Ticket` SET qr_code = NULL WHERE qr_code IS NOT NULL")
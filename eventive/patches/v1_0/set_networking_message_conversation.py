@@ -0,0 +1,23 @@
+import frappe
+
+from eventive.networking.doctype.networking_message.networking_message import get_conversation_key
+
+
+def execute():
+	pairs = frappe.db.sql(
+		"""
+		SELECT DISTINCT sender, receiver
+		FROM `tabNetworking Message`
+		WHERE IFNULL(conversation, '') = ''
+		"""
+	)
+
+	for sender, receiver in pairs:
+		frappe.db.sql(
+			"""
+			UPDATE `tabNetworking Message`
+			SET conversation = %(conversation)s
+			WHERE sender = %(sender)s AND receiver = %(receiver)s
+			""",
+			{"conversation": get_conversation_key(sender, receiver), "sender": sender, "receiver": receiver},
+		)
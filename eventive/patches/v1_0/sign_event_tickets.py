@@ -0,0 +1,29 @@
+import frappe
+
+from eventive.ticketing.ticket_token import get_ticket_token
+
+
+def execute():
+	while True:
+		tickets = frappe.get_all(
+			"Event Ticket",
+			filters={"ticket_token": ["is", "not set"]},
+			fields=["name", "event", "ticket_type"],
+			limit=1000
+		)
+		if not tickets:
+			break
+
+		for ticket in tickets:
+			frappe.db.set_value(
+				"Event Ticket",
+				ticket.name,
+				"ticket_token",
+				get_ticket_token(ticket.name, ticket.event, ticket.ticket_type),
+				update_modified=False
+			)
+
+		frappe.db.commit()
+
+	# QR images rendered from bare ticket IDs are cached under the same keys
+	frappe.cache().delete_keys("eventive:ticket_qr:")
@@ -0,0 +1,372 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import re
+from bisect import bisect_right
+
+import frappe
+from frappe.utils import cint, now_datetime
+
+from eventive.events.bundle import clear_event_bundle
+from eventive.events.calendar_feed import clear_feeds
+from eventive.personalized.session_booking import release_seat, try_claim_seats
+
+AGENDA_CHUNK_SIZE = 1000
+
+# Interest matches in what a session is about count more than matches on who gives it
+TITLE_WEIGHT = 2
+SPEAKER_WEIGHT = 1
+
+WORD_RE = re.compile(r"[a-z0-9]{3,}")
+
+
+def enqueue_agenda_generation(event):
+	return frappe.enqueue(
+		"eventive.personalized.agenda.generate_agendas",
+		queue="long",
+		timeout=3600,
+		job_id=f"eventive::generate_agendas::{event}",
+		deduplicate=True,
+		event=event,
+	)
+
+
+def generate_agendas(event):
+	"""
+	Background job: build an Auto Attendee Schedule for every ticket holder of an event.
+
+	Sessions are scored against each attendee's Interest Tags through an
+	inverted index, and the best non-overlapping set of sessions that still
+	have seats is picked with weighted interval scheduling. Seats go to
+	earlier ticket holders first. Attendees who booked sessions themselves
+	keep their schedule.
+
+	Schedules are swapped every AGENDA_CHUNK_SIZE attendees in one
+	transaction: their previous Auto schedules are deleted and their seats
+	released, the new seats are claimed with the same conditional UPDATE as
+	manual bookings, and the schedules are bulk inserted. Sessions filled by
+	concurrent bookings in the meantime are left out of the agenda.
+
+	Returns:
+	    dict: Attendees scheduled and sessions booked
+	"""
+	started = now_datetime()
+	previous = get_auto_bookings(event)
+	sessions = get_sessions(event, previous)
+	if not sessions:
+		return {"attendees": 0, "bookings": 0}
+
+	index = build_index(sessions)
+
+	remaining = {}
+	for session in sessions.values():
+		if cint(session.capacity):
+			remaining[session.name] = get_free_seats(session, previous)
+
+	schedules = []
+	for user, interests in get_attendees(event):
+		agenda = plan_agenda(interests, sessions, index, remaining)
+		if not agenda:
+			continue
+
+		for name in agenda:
+			if name in remaining:
+				remaining[name] -= 1
+		schedules.append((user, agenda))
+
+	scheduled = 0
+	bookings = 0
+	for start in range(0, len(schedules), AGENDA_CHUNK_SIZE):
+		chunk = schedules[start:start + AGENDA_CHUNK_SIZE]
+		delete_auto_schedules(event, users=[user for user, _ in chunk])
+
+		chunk = claim_seats(chunk)
+		insert_schedules(event, chunk, sessions)
+		frappe.db.commit()
+
+		scheduled += len(chunk)
+		bookings += sum(len(agenda) for _, agenda in chunk)
+
+	# Attendees who no longer get an agenda
+	delete_auto_schedules(event, before=started)
+	frappe.db.commit()
+
+	clear_event_bundle(event, "sessions")
+	# Schedules were written without hooks, so attendee feeds are dropped here
+	clear_feeds(event)
+
+	return {"attendees": scheduled, "bookings": bookings}
+
+
+def plan_agenda(interests, sessions, index, remaining):
+	"""
+	Pick the highest scoring set of non-overlapping sessions with seats left.
+
+	Weighted interval scheduling: candidates sorted by end time, each either
+	skipped or taken together with the best plan ending before it starts.
+
+	Returns:
+	    list: Event Session IDs in start time order
+	"""
+	scores = {}
+	for word in interests:
+		for name, weight in index.get(word, ()):
+			if remaining.get(name, 1) > 0:
+				scores[name] = scores.get(name, 0) + weight
+
+	if not scores:
+		return []
+
+	candidates = sorted(scores, key=lambda name: sessions[name].end_time)
+	ends = [sessions[name].end_time for name in candidates]
+
+	best = [0] * (len(candidates) + 1)
+	taken = [False] * (len(candidates) + 1)
+	previous = [0] * (len(candidates) + 1)
+
+	for i, name in enumerate(candidates, start=1):
+		previous[i] = bisect_right(ends, sessions[name].start_time, hi=i - 1)
+		with_session = best[previous[i]] + scores[name]
+		taken[i] = with_session > best[i - 1]
+		best[i] = with_session if taken[i] else best[i - 1]
+
+	agenda = []
+	i = len(candidates)
+	while i:
+		if taken[i]:
+			agenda.append(candidates[i - 1])
+			i = previous[i]
+		else:
+			i -= 1
+
+	return agenda[::-1]
+
+
+def get_sessions(event, previous):
+	"""
+	Bookable sessions of an event with seats left, counting seats held by the
+	Auto schedules being replaced as free.
+
+	Args:
+	    event (str): The event ID
+	    previous (dict): Event Session ID -> seats held by Auto schedules
+
+	Returns:
+	    dict: Event Session ID -> session
+	"""
+	sessions = frappe.get_all(
+		"Event Session",
+		filters={"event": event, "allow_booking": 1},
+		fields=["name", "session_title", "talk_name", "track", "start_time", "end_time", "capacity", "booked_spots"],
+		ignore_permissions=True
+	)
+	sessions = {
+		session.name: session
+		for session in sessions
+		if session.start_time and session.end_time
+		and (not cint(session.capacity) or get_free_seats(session, previous) > 0)
+	}
+	if not sessions:
+		return {}
+
+	speakers = frappe.db.sql(
+		"""
+		SELECT ts.parent, sp.full_name, sp.role, sp.company
+		FROM `tabTalk Speaker` ts
+		JOIN `tabSpeaker` sp ON sp.name = ts.speaker
+		WHERE ts.parenttype = 'Event Session' AND ts.parent IN %(sessions)s
+		""",
+		{"sessions": tuple(sessions)},
+		as_dict=True,
+	)
+
+	for session in sessions.values():
+		session.speaker_text = ""
+	for speaker in speakers:
+		sessions[speaker.parent].speaker_text += " " + " ".join(filter(None, (speaker.full_name, speaker.role, speaker.company)))
+
+	return sessions
+
+
+def get_free_seats(session, previous):
+	return cint(session.capacity) - cint(session.booked_spots) + previous.get(session.name, 0)
+
+
+def build_index(sessions):
+	"""Word -> (session, weight) pairs, from session titles, tracks and speakers."""
+	index = {}
+	for session in sessions.values():
+		weights = {}
+		for word in tokenize(f"{session.session_title} {session.talk_name or ''} {session.track or ''}"):
+			weights[word] = TITLE_WEIGHT
+		for word in tokenize(session.speaker_text):
+			weights.setdefault(word, SPEAKER_WEIGHT)
+
+		for word, weight in weights.items():
+			index.setdefault(word, []).append((session.name, weight))
+
+	return index
+
+
+def get_attendees(event):
+	"""
+	Ticket holders of an event without a schedule of their own, earliest first.
+
+	Returns:
+	    list: (user, interest words) pairs
+	"""
+	users = frappe.db.sql(
+		"""
+		SELECT t.email, MIN(t.issue_date) AS issued
+		FROM `tabEvent Ticket` t
+		WHERE t.event = %(event)s AND t.docstatus = 1 AND t.status = 'Valid'
+			AND NOT EXISTS (
+				SELECT 1 FROM `tabAttendee Schedule` s
+				WHERE s.event = t.event AND s.user = t.email AND s.source = 'User'
+			)
+		GROUP BY t.email
+		ORDER BY issued ASC
+		""",
+		{"event": event},
+	)
+	users = [user for user, _ in users if user]
+
+	interests = {}
+	for start in range(0, len(users), AGENDA_CHUNK_SIZE):
+		rows = frappe.db.sql(
+			"""
+			SELECT p.user, i.interest
+			FROM `tabAttendee Profile` p
+			JOIN `tabInterest Tags` i ON i.parent = p.name AND i.parenttype = 'Attendee Profile'
+			WHERE p.user IN %(users)s
+			""",
+			{"users": tuple(users[start:start + AGENDA_CHUNK_SIZE])},
+		)
+		for user, interest in rows:
+			interests.setdefault(user, set()).update(tokenize(interest))
+
+	return [(user, interests[user]) for user in users if interests.get(user)]
+
+
+def get_auto_bookings(event):
+	"""Event Session ID -> seats currently held by Auto schedules."""
+	return dict(frappe.db.sql(
+		"""
+		SELECT b.event_session, COUNT(*)
+		FROM `tabBooked Session Item` b
+		JOIN `tabAttendee Schedule` s ON s.name = b.parent AND b.parenttype = 'Attendee Schedule'
+		WHERE s.event = %(event)s AND s.source = 'Auto'
+		GROUP BY b.event_session
+		""",
+		{"event": event},
+	))
+
+
+def delete_auto_schedules(event, users=None, before=None):
+	"""Delete Auto schedules of an event, of some users or created before a time, and release their seats."""
+	filters = {"event": event, "source": "Auto"}
+	if users is not None:
+		filters["user"] = ["in", users]
+	if before:
+		filters["creation"] = ["<", before]
+
+	schedules = frappe.get_all("Attendee Schedule", filters=filters, pluck="name", ignore_permissions=True)
+	for start in range(0, len(schedules), AGENDA_CHUNK_SIZE):
+		chunk = schedules[start:start + AGENDA_CHUNK_SIZE]
+		seats = frappe.db.sql(
+			"""
+			SELECT event_session, COUNT(*)
+			FROM `tabBooked Session Item`
+			WHERE parenttype = 'Attendee Schedule' AND parent IN %(schedules)s
+			GROUP BY event_session
+			""",
+			{"schedules": tuple(chunk)},
+		)
+
+		frappe.db.delete("Booked Session Item", {"parenttype": "Attendee Schedule", "parent": ["in", chunk]})
+		frappe.db.delete("Attendee Schedule", {"name": ["in", chunk]})
+		for session, count in seats:
+			release_seat(session, count)
+
+
+def claim_seats(schedules):
+	"""
+	Claim the seats a chunk of agendas needs, one conditional UPDATE per
+	session. When a session no longer has enough seats, the seats left go to
+	the earliest attendees and it is dropped from the others' agendas.
+
+	Returns:
+	    list: (user, agenda) pairs with the seats that were claimed
+	"""
+	wanted = {}
+	for _, agenda in schedules:
+		for name in agenda:
+			wanted[name] = wanted.get(name, 0) + 1
+
+	granted = {}
+	for name, seats in wanted.items():
+		if try_claim_seats(name, seats):
+			granted[name] = seats
+			continue
+
+		free = frappe.db.sql(
+			"""
+			SELECT IFNULL(capacity, 0) - IFNULL(booked_spots, 0)
+			FROM `tabEvent Session`
+			WHERE name = %(name)s AND allow_booking = 1
+			FOR UPDATE
+			""",
+			{"name": name},
+		)
+		free = min(cint(free[0][0]), seats) if free else 0
+		granted[name] = free if free > 0 and try_claim_seats(name, free) else 0
+
+	claimed = []
+	for user, agenda in schedules:
+		kept = []
+		for name in agenda:
+			if granted[name]:
+				granted[name] -= 1
+				kept.append(name)
+		if kept:
+			claimed.append((user, kept))
+
+	return claimed
+
+
+def insert_schedules(event, schedules, sessions):
+	now = now_datetime()
+	owner = frappe.session.user
+	parents = []
+	children = []
+
+	for user, agenda in schedules:
+		parent = frappe.generate_hash(length=10)
+		parents.append((parent, now, now, owner, owner, 0, user, event, "Auto"))
+
+		for idx, name in enumerate(agenda, start=1):
+			session = sessions[name]
+			children.append((
+				frappe.generate_hash(length=10), now, now, owner, owner, 0,
+				parent, "Attendee Schedule", "booked_sessions", idx,
+				name, session.session_title, session.start_time, session.end_time, "Booked",
+			))
+
+	frappe.db.bulk_insert(
+		"Attendee Schedule",
+		fields=["name", "creation", "modified", "owner", "modified_by", "docstatus", "user", "event", "source"],
+		values=parents,
+	)
+	frappe.db.bulk_insert(
+		"Booked Session Item",
+		fields=[
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"parent", "parenttype", "parentfield", "idx",
+			"event_session", "session_title", "start_time", "end_time", "attendance_status",
+		],
+		values=children,
+	)
+
+
+def tokenize(text):
+	return set(WORD_RE.findall((text or "").lower()))
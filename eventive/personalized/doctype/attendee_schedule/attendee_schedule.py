@@ -1,9 +1,57 @@
 # Copyright (c) 2026, Munene Morris and contributors
 # For license information, please see license.txt
 
-# import frappe
+from bisect import bisect_left
+
+import frappe
 from frappe.model.document import Document
+from frappe.utils import get_datetime
 
 
-class AttendeeSchedule(Document):
+class ScheduleConflictError(frappe.ValidationError):
 	pass
+
+
+class AttendeeSchedule(Document):
+	def validate(self):
+		self.sort_sessions()
+		self.flag_conflicts()
+
+	def sort_sessions(self):
+		"""Keep booked sessions ordered by start time, which is what `find_conflict` searches."""
+		self.booked_sessions.sort(key=lambda row: (get_datetime(row.start_time), get_datetime(row.end_time)))
+		for idx, row in enumerate(self.booked_sessions, start=1):
+			row.idx = idx
+
+	def flag_conflicts(self):
+		"""Mark rows that overlap an earlier row, e.g. after edits made in the desk."""
+		latest = None
+		for row in self.booked_sessions:
+			overlaps = latest and get_datetime(row.start_time) < get_datetime(latest.end_time)
+			row.conflicts_with = latest.event_session if overlaps else None
+
+			if not latest or get_datetime(row.end_time) > get_datetime(latest.end_time):
+				latest = row
+
+	def find_conflict(self, start, end):
+		"""
+		Return the booked row overlapping `start` to `end`, if any.
+
+		Sessions are sorted by start time, so only sessions starting before
+		`end` can overlap. They are scanned back from the last one, and the scan
+		stops at a row `flag_conflicts` left unmarked: no row before it ends
+		after it starts. Booking keeps sessions disjoint, so this is O(log n)
+		unless overlapping rows were saved from the desk.
+		"""
+		start, end = get_datetime(start), get_datetime(end)
+		idx = bisect_left(self.booked_sessions, end, key=lambda row: get_datetime(row.start_time))
+
+		for row in reversed(self.booked_sessions[:idx]):
+			if get_datetime(row.end_time) > start:
+				return row
+			if not row.conflicts_with:
+				return None
+
+
+def on_doctype_update():
+	frappe.db.add_index("Attendee Schedule", ["user", "event"])
@@ -0,0 +1,236 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+from datetime import timedelta
+
+import frappe
+from frappe.utils import add_days, cint, get_datetime, getdate
+
+from eventive.events.bundle import clear_event_bundle
+from eventive.personalized.doctype.attendee_schedule.attendee_schedule import ScheduleConflictError
+
+SESSION_FIELDS = ["name", "event", "session_title", "start_time", "end_time", "allow_booking", "capacity"]
+
+
+def book_session(session, user):
+	"""
+	Book a seat in a session and add it to the user's Attendee Schedule.
+
+	The seat is claimed with a conditional UPDATE as the last statement of
+	the transaction, so the session row stays locked only for the commit
+	even when thousands of attendees book the same session at once.
+
+	Args:
+	    session (str): The Event Session ID
+	    user (str): The attendee's user ID
+
+	Returns:
+	    Document: The user's Attendee Schedule for the session's event
+	"""
+	details = get_session(session)
+	if not cint(details.allow_booking):
+		frappe.throw("This session does not take bookings")
+
+	check_ticket(details.event, user)
+
+	schedule = get_schedule(user, details.event, for_update=True)
+	if any(row.event_session == session for row in schedule.booked_sessions):
+		return schedule
+
+	conflict = schedule.find_conflict(details.start_time, details.end_time)
+	if conflict:
+		frappe.throw(
+			f"This session overlaps with {conflict.session_title or conflict.event_session}, which you have already booked",
+			ScheduleConflictError,
+		)
+
+	schedule.append("booked_sessions", {
+		"event_session": session,
+		"session_title": details.session_title,
+		"start_time": details.start_time,
+		"end_time": details.end_time,
+		"attendance_status": "Booked"
+	})
+	# The attendee has taken over their agenda, so regenerating Auto agendas leaves it alone
+	schedule.source = "User"
+	schedule.save(ignore_permissions=True)
+
+	claim_seat(session)
+	frappe.db.after_commit.add(lambda: clear_event_bundle(details.event, "sessions"))
+
+	return schedule
+
+
+def cancel_session(session, user):
+	"""
+	Give up a booked seat and remove the session from the user's schedule.
+
+	Returns:
+	    Document: The user's Attendee Schedule for the session's event
+	"""
+	details = get_session(session)
+
+	schedule = get_schedule(user, details.event, for_update=True)
+	rows = [row for row in schedule.booked_sessions if row.event_session == session]
+	if not rows:
+		frappe.throw("You have not booked this session")
+
+	for row in rows:
+		schedule.remove(row)
+	schedule.save(ignore_permissions=True)
+
+	release_seat(session, len(rows))
+	frappe.db.after_commit.add(lambda: clear_event_bundle(details.event, "sessions"))
+
+	return schedule
+
+
+def get_free_slots(user, event, day):
+	"""
+	Gaps in a user's day, with the sessions from every track that fit in each.
+
+	The day runs from the first session start to the last session end across
+	the event's Event Day Tracks on that date.
+
+	Args:
+	    user (str): The attendee's user ID
+	    event (str): The event ID
+	    day (int): Day of the event, 1 being its start date
+
+	Returns:
+	    list: Dicts with `start`, `end` and the unbooked `sessions` fitting the gap
+	"""
+	start_date = frappe.db.get_value("Main Event", event, "start_date")
+	if not start_date:
+		frappe.throw("Event not found", frappe.DoesNotExistError)
+
+	date = getdate(add_days(start_date, cint(day) - 1))
+	day_start = get_datetime(date)
+	day_end = day_start + timedelta(days=1)
+
+	sessions = frappe.get_all(
+		"Event Session",
+		filters={
+			"event": event,
+			"start_time": [">=", day_start],
+			"end_time": ["<=", day_end]
+		},
+		fields=["name", "session_title", "session_type", "track", "start_time", "end_time", "allow_booking", "is_booked"],
+		order_by="start_time asc",
+		ignore_permissions=True
+	)
+	if not sessions:
+		return []
+
+	booked = frappe.get_all(
+		"Booked Session Item",
+		filters={
+			"parenttype": "Attendee Schedule",
+			"parent": frappe.db.get_value("Attendee Schedule", {"user": user, "event": event}, "name") or "",
+			"start_time": ["<", day_end],
+			"end_time": [">", day_start]
+		},
+		fields=["event_session", "start_time", "end_time"],
+		order_by="start_time asc",
+		ignore_permissions=True
+	)
+	booked_sessions = {row.event_session for row in booked}
+
+	gaps = []
+	cursor = sessions[0].start_time
+	window_end = max(session.end_time for session in sessions)
+
+	for row in booked:
+		if row.start_time > cursor:
+			gaps.append((cursor, min(row.start_time, window_end)))
+		cursor = max(cursor, row.end_time)
+	if cursor < window_end:
+		gaps.append((cursor, window_end))
+
+	slots = []
+	for gap_start, gap_end in gaps:
+		if gap_end <= gap_start:
+			continue
+		slots.append({
+			"start": str(gap_start),
+			"end": str(gap_end),
+			"sessions": [
+				{
+					"name": session.name,
+					"session_title": session.session_title,
+					"session_type": session.session_type,
+					"track": session.track,
+					"start_time": str(session.start_time),
+					"end_time": str(session.end_time),
+					"bookable": bool(session.allow_booking and not session.is_booked)
+				}
+				for session in sessions
+				if session.name not in booked_sessions
+				and session.start_time >= gap_start
+				and session.end_time <= gap_end
+			]
+		})
+
+	return slots
+
+
+def get_session(session):
+	details = frappe.db.get_value("Event Session", session, SESSION_FIELDS, as_dict=True)
+	if not details:
+		frappe.throw("Session not found", frappe.DoesNotExistError)
+	return details
+
+
+def check_ticket(event, user):
+	if not frappe.db.exists("Event Ticket", {"event": event, "email": user, "status": "Valid", "docstatus": 1}):
+		frappe.throw("You need a ticket for this event to book its sessions", frappe.PermissionError)
+
+
+def get_schedule(user, event, for_update=False):
+	"""The user's Attendee Schedule for an event, created on first use."""
+	name = frappe.db.get_value("Attendee Schedule", {"user": user, "event": event}, "name")
+	if name:
+		return frappe.get_doc("Attendee Schedule", name, for_update=for_update)
+
+	schedule = frappe.get_doc({
+		"doctype": "Attendee Schedule",
+		"user": user,
+		"event": event,
+		"source": "User"
+	})
+	schedule.insert(ignore_permissions=True)
+	return schedule
+
+
+def claim_seat(session):
+	"""Take a seat if one is left. `capacity` 0 means unlimited."""
+	if not try_claim_seats(session):
+		frappe.throw("This session is fully booked", frappe.ValidationError)
+
+
+def try_claim_seats(session, seats=1):
+	"""Take `seats` seats if that many are left, in one conditional UPDATE. Returns whether they were taken."""
+	frappe.db.sql(
+		"""
+		UPDATE `tabEvent Session`
+		SET booked_spots = IFNULL(booked_spots, 0) + %(seats)s,
+			is_booked = IFNULL(capacity, 0) > 0 AND booked_spots >= capacity
+		WHERE name = %(name)s
+			AND allow_booking = 1
+			AND (IFNULL(capacity, 0) = 0 OR IFNULL(booked_spots, 0) + %(seats)s <= capacity)
+		""",
+		{"name": session, "seats": seats},
+	)
+	return bool(frappe.db._cursor.rowcount)
+
+
+def release_seat(session, seats=1):
+	frappe.db.sql(
+		"""
+		UPDATE `tabEvent Session`
+		SET booked_spots = GREATEST(IFNULL(booked_spots, 0) - %(seats)s, 0),
+			is_booked = IFNULL(capacity, 0) > 0 AND booked_spots >= capacity
+		WHERE name = %(name)s
+		""",
+		{"name": session, "seats": seats},
+	)
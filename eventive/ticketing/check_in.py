@@ -0,0 +1,297 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import json
+from zoneinfo import ZoneInfo
+
+import frappe
+from frappe.utils import get_datetime, get_system_timezone, now_datetime
+
+from eventive.events.counters import increment
+from eventive.ticketing.ticket_token import verify_ticket_token
+
+MAX_BATCH_SIZE = 1000
+
+# Ticket ID -> JSON of the check-in that admitted it, per event
+ADMITTED_KEY = "eventive:check_in_admitted:{0}"
+ADMITTED_TTL = 3 * 24 * 60 * 60
+
+
+def check_in_batch(event, scans):
+	"""
+	Admit a batch of scans uploaded by a gate device.
+
+	Rescans of tickets admitted earlier are answered from the Redis admission
+	window without touching the database. The remaining tickets are loaded and
+	row locked in one query, the earliest scan of each is admitted and the
+	rest are flagged as duplicates. Admitted tickets are flipped with a single
+	UPDATE and every admission or duplicate is written as a submitted Event
+	Check-in row in one bulk insert, duplicates linking to the admission.
+
+	Args:
+	    event (str): The event ID
+	    scans (list): Dicts with `token` (ticket token or legacy ticket ID),
+	        `scanner_id` and `scanned_at`
+
+	Returns:
+	    dict: A result per scan, in the order given, and totals per status
+	"""
+	if len(scans) > MAX_BATCH_SIZE:
+		frappe.throw(f"Send at most {MAX_BATCH_SIZE} scans per batch")
+
+	results = [_resolve_scan(event, idx, scan) for idx, scan in enumerate(scans)]
+	pending = sorted((result for result in results if not result.status), key=lambda result: result.scanned_at)
+
+	admissions = get_admissions(event, {result.ticket for result in pending})
+	tickets = _lock_tickets({result.ticket for result in pending if result.ticket not in admissions})
+
+	missing = {name for name, ticket in tickets.items() if ticket.checked_in and ticket.event == event}
+	if missing:
+		admissions.update(_load_admissions(event, missing))
+
+	admitted = {}
+	for result in pending:
+		admission = admissions.get(result.ticket)
+		ticket = tickets.get(result.ticket)
+
+		if admission:
+			result.update(status="Duplicate", admission=admission)
+		elif not ticket or ticket.event != event:
+			result.update(status="Rejected", message="Ticket not found for this event")
+		elif ticket.docstatus != 1 or ticket.status != "Valid":
+			result.update(status="Rejected", message="This ticket is no longer valid")
+		elif ticket.checked_in:
+			result.update(status="Duplicate", message="This ticket has already been checked in")
+		else:
+			result.update(status="Admitted", check_in=frappe.generate_hash(length=10))
+			admissions[result.ticket] = admitted[result.ticket] = {
+				"check_in": result.check_in,
+				"scanner_id": result.scanner_id,
+				"checkin_time": str(result.scanned_at),
+			}
+
+	now = now_datetime()
+	if admitted:
+		frappe.db.sql(
+			"""
+			UPDATE `tabEvent Ticket`
+			SET checked_in = 1, checked_in_by = %(user)s, modified = %(now)s, modified_by = %(user)s
+			WHERE name IN %(names)s
+			""",
+			{"user": frappe.session.user, "now": now, "names": tuple(admitted)},
+		)
+
+		checked_in = {}
+		for name in admitted:
+			ticket_type = tickets[name].ticket_type
+			checked_in[ticket_type] = checked_in.get(ticket_type, 0) + 1
+		increment(event, checked_in=checked_in)
+
+		frappe.db.after_commit.add(lambda: _remember_admissions(event, admitted))
+
+	_insert_check_ins(event, [result for result in results if result.status in ("Admitted", "Duplicate")], now)
+
+	totals = {"Admitted": 0, "Duplicate": 0, "Rejected": 0}
+	for result in results:
+		totals[result.status] += 1
+
+	return {
+		"results": [_format_result(result) for result in results],
+		"admitted": totals["Admitted"],
+		"duplicate": totals["Duplicate"],
+		"rejected": totals["Rejected"],
+	}
+
+
+def get_admissions(event, tickets):
+	"""
+	Look up which tickets of an event have been admitted, from Redis only.
+
+	Returns:
+	    dict: Ticket ID -> `check_in`, `scanner_id` and `checkin_time` of the
+	        admitting scan, for admitted tickets
+	"""
+	tickets = [ticket for ticket in tickets if ticket]
+	if not tickets:
+		return {}
+
+	cache = frappe.cache()
+	values = cache.execute_command("HMGET", cache.make_key(ADMITTED_KEY.format(event)), *tickets)
+	return {ticket: json.loads(value) for ticket, value in zip(tickets, values) if value}
+
+
+def forget_admission(event, ticket):
+	"""Let a ticket be admitted again, e.g. after staff undo a check-in."""
+	frappe.cache().hdel(ADMITTED_KEY.format(event), ticket)
+
+
+def get_duplicate_scans(event, since=None, limit=500):
+	"""
+	Duplicate scans of an event with the admission each one repeated.
+
+	A duplicate from a different scanner than the admission often means a
+	shared screenshot of the QR code rather than an attendee scanning twice.
+
+	Returns:
+	    list: Duplicate check-ins, oldest first
+	"""
+	conditions = "dup.event = %(event)s AND dup.status = 'Duplicate'"
+	if since:
+		conditions += " AND dup.checkin_time >= %(since)s"
+
+	return frappe.db.sql(
+		f"""
+		SELECT dup.name, dup.event_ticket, dup.scanner_id, dup.checkin_time,
+			adm.name AS admission, adm.scanner_id AS admitted_scanner_id,
+			adm.checkin_time AS admitted_at,
+			IFNULL(dup.scanner_id != adm.scanner_id, 0) AS other_scanner
+		FROM `tabEvent Check-in` dup
+		LEFT JOIN `tabEvent Check-in` adm ON adm.name = dup.duplicate_of
+		WHERE {conditions}
+		ORDER BY dup.checkin_time ASC
+		LIMIT %(limit)s
+		""",
+		{"event": event, "since": get_datetime(since) if since else None, "limit": limit},
+		as_dict=True,
+	)
+
+
+def _resolve_scan(event, idx, scan):
+	result = frappe._dict(
+		idx=idx,
+		ticket=None,
+		scanner_id=scan.get("scanner_id"),
+		scanned_at=_get_scanned_at(scan.get("scanned_at")),
+		status=None,
+		message=None,
+	)
+
+	token = (scan.get("token") or "").strip()
+	if not token:
+		result.update(status="Rejected", message="Missing ticket token")
+		return result
+
+	# Tickets issued before signed tokens encode their bare ID
+	if "." not in token:
+		result.ticket = token
+		return result
+
+	# The validity window is checked against the server clock, not the device's
+	try:
+		payload = verify_ticket_token(token)
+	except frappe.ValidationError as e:
+		result.update(status="Rejected", message=str(e))
+		return result
+
+	result.ticket = payload["tid"]
+	if payload.get("evt") != event:
+		result.update(status="Rejected", message="This ticket is for a different event")
+
+	return result
+
+
+def _get_scanned_at(value):
+	"""
+	A device's scan time as a naive datetime in the system timezone, so scans
+	sent with and without an offset sort together.
+	"""
+	scanned_at = get_datetime(value) if value else None
+	if not scanned_at:
+		return now_datetime()
+
+	if scanned_at.tzinfo:
+		scanned_at = scanned_at.astimezone(ZoneInfo(get_system_timezone())).replace(tzinfo=None)
+	return scanned_at
+
+
+def _format_result(result):
+	response = {
+		"idx": result.idx,
+		"ticket": result.ticket,
+		"status": result.status,
+		"message": result.message,
+	}
+
+	if result.admission:
+		response.update(
+			message=f"Already checked in at {result.admission['scanner_id'] or 'a gate'} at {result.admission['checkin_time']}",
+			admitted_scanner_id=result.admission["scanner_id"],
+			admitted_at=result.admission["checkin_time"],
+		)
+
+	return response
+
+
+def _lock_tickets(names):
+	if not names:
+		return {}
+
+	tickets = frappe.get_all(
+		"Event Ticket",
+		filters={"name": ["in", list(names)]},
+		fields=["name", "event", "ticket_type", "status", "docstatus", "checked_in"],
+		order_by="name asc",
+		for_update=True,
+		ignore_permissions=True
+	)
+	return {ticket.name: ticket for ticket in tickets}
+
+
+def _load_admissions(event, tickets):
+	"""Rebuild admissions missing from Redis, e.g. after a flush, from Event Check-in."""
+	rows = frappe.get_all(
+		"Event Check-in",
+		filters={
+			"event": event,
+			"event_ticket": ["in", list(tickets)],
+			"status": "Admitted",
+			"docstatus": 1
+		},
+		fields=["name", "event_ticket", "scanner_id", "checkin_time"],
+		order_by="checkin_time asc",
+		ignore_permissions=True
+	)
+
+	admissions = {}
+	for row in rows:
+		admissions.setdefault(row.event_ticket, {
+			"check_in": row.name,
+			"scanner_id": row.scanner_id,
+			"checkin_time": str(row.checkin_time),
+		})
+
+	if admissions:
+		_remember_admissions(event, admissions)
+	return admissions
+
+
+def _remember_admissions(event, admissions):
+	cache = frappe.cache()
+	key = cache.make_key(ADMITTED_KEY.format(event))
+
+	pipeline = cache.pipeline()
+	pipeline.hset(key, mapping={ticket: json.dumps(admission) for ticket, admission in admissions.items()})
+	pipeline.expire(key, ADMITTED_TTL)
+	pipeline.execute()
+
+
+def _insert_check_ins(event, results, now):
+	if not results:
+		return
+
+	user = frappe.session.user
+	frappe.db.bulk_insert(
+		"Event Check-in",
+		fields=[
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"event", "event_ticket", "checkin_time", "method", "scanner_id", "status", "duplicate_of",
+		],
+		values=[
+			(
+				result.check_in or frappe.generate_hash(length=10), now, now, user, user, 1,
+				event, result.ticket, result.scanned_at, "QR Code", result.scanner_id, result.status,
+				(result.admission or {}).get("check_in"),
+			)
+			for result in results
+		],
+	)
@@ -0,0 +1,250 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import hashlib
+import hmac
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import add_to_date, cint, get_datetime, now_datetime
+
+from eventive.events.bundle import clear_event_bundle
+from eventive.ticketing.doctype.seat_inventory.seat_inventory import release_seats, reserve_seats
+
+DEFAULT_HOLD_MINUTES = 10
+
+# Items a single hold may reserve, tickets and merchandise together
+DEFAULT_MAX_QUANTITY = 10
+
+# Active holds a single client or email may have on an event at once
+DEFAULT_MAX_ACTIVE_HOLDS = 2
+
+
+class CheckoutHold(Document):
+	def validate(self):
+		for item in self.items:
+			if bool(item.ticket_type) == bool(item.merchandise):
+				frappe.throw(f"Row {item.idx}: set either a Ticket Type or a Merchandise item")
+			if cint(item.quantity) < 1:
+				frappe.throw(f"Row {item.idx}: quantity must be at least 1")
+
+		max_quantity = get_max_quantity()
+		if sum(cint(item.quantity) for item in self.items) > max_quantity:
+			frappe.throw(f"You can hold at most {max_quantity} items per checkout")
+
+	def before_insert(self):
+		self.status = "Active"
+		self.hold_token = frappe.generate_hash(length=20)
+		self.client_key = get_client_key()
+		self.expires_at = add_to_date(now_datetime(), minutes=get_hold_minutes())
+		self.check_active_holds()
+
+	def after_insert(self):
+		reserve_seats(self.event, self.get_seat_counts())
+		claimed = []
+		try:
+			for merchandise, qty in self.get_merchandise_counts().items():
+				claim_stock(merchandise, qty)
+				claimed.append((merchandise, qty))
+		except frappe.ValidationError:
+			release_seats(self.event, self.get_seat_counts())
+			for merchandise, qty in claimed:
+				restore_stock(merchandise, qty)
+			raise
+		finally:
+			clear_event_bundle(self.event, "merchandise")
+
+	def get_seat_counts(self):
+		seats = {}
+		for item in self.items:
+			if item.ticket_type:
+				seats[item.ticket_type] = seats.get(item.ticket_type, 0) + cint(item.quantity)
+		return seats
+
+	def get_merchandise_counts(self):
+		counts = {}
+		for item in self.items:
+			if item.merchandise:
+				counts[item.merchandise] = counts.get(item.merchandise, 0) + cint(item.quantity)
+		return counts
+
+	def check_active_holds(self):
+		"""Stop one client from holding an event's inventory through many checkouts."""
+		conditions = ["client_key = %(client_key)s"]
+		if self.email:
+			conditions.append("email = %(email)s")
+
+		active = frappe.db.sql(
+			f"""
+			SELECT COUNT(*)
+			FROM `tabCheckout Hold`
+			WHERE event = %(event)s AND status = 'Active' AND expires_at > %(now)s
+				AND ({" OR ".join(conditions)})
+			""",
+			{
+				"event": self.event,
+				"client_key": self.client_key,
+				"email": self.email,
+				"now": now_datetime(),
+			},
+		)[0][0]
+
+		if cint(active) >= get_max_active_holds():
+			frappe.throw(
+				"You already have a checkout in progress for this event, please complete or cancel it first",
+				frappe.ValidationError,
+			)
+
+	def is_expired(self):
+		return get_datetime(self.expires_at) < now_datetime()
+
+	def release(self, status="Released"):
+		"""Hand the held seats and stock back. Callers must hold a row lock on the hold."""
+		if self.status != "Active":
+			return
+
+		release_seats(self.event, self.get_seat_counts())
+		for merchandise, qty in self.get_merchandise_counts().items():
+			restore_stock(merchandise, qty)
+		clear_event_bundle(self.event, "merchandise")
+
+		self.db_set("status", status)
+
+
+def get_hold_minutes():
+	return cint(frappe.conf.get("eventive_checkout_hold_minutes")) or DEFAULT_HOLD_MINUTES
+
+
+def get_max_quantity():
+	return cint(frappe.conf.get("eventive_checkout_max_quantity")) or DEFAULT_MAX_QUANTITY
+
+
+def get_max_active_holds():
+	return cint(frappe.conf.get("eventive_checkout_max_active_holds")) or DEFAULT_MAX_ACTIVE_HOLDS
+
+
+def get_client_key():
+	"""
+	Identify who is checking out: the signed in user, or the client IP for
+	guests, who all share one session user. Only a digest is stored.
+	"""
+	if frappe.session.user != "Guest":
+		client = frappe.session.user
+	else:
+		request_ip = getattr(frappe.local, "request_ip", None)
+		client = f"ip:{request_ip}"
+	return hashlib.sha1(client.encode()).hexdigest()
+
+
+def create_hold(event, items, email=None):
+	"""
+	Reserve ticket seats and merchandise stock for a checkout.
+
+	Args:
+	    event (str): The event ID
+	    items (list): Dicts with `ticket_type` or `merchandise` and `quantity`
+	    email (str): Optional booker email
+
+	Returns:
+	    CheckoutHold: The active hold
+	"""
+	hold = frappe.get_doc({
+		"doctype": "Checkout Hold",
+		"event": event,
+		"email": email,
+	})
+
+	for item in items:
+		hold.append("items", {
+			"ticket_type": item.get("ticket_type"),
+			"merchandise": item.get("merchandise"),
+			"quantity": item.get("quantity", 1)
+		})
+
+	hold.insert(ignore_permissions=True)
+	return hold
+
+
+def convert_hold(hold_name, event):
+	"""
+	Mark an active hold as converted into a registration.
+
+	Returns:
+	    dict: Ticket Type ID -> seats the hold had reserved, which now belong
+	        to the registration
+	"""
+	hold = frappe.get_doc("Checkout Hold", hold_name, for_update=True)
+
+	if hold.event != event:
+		frappe.throw("This checkout hold belongs to a different event")
+	if hold.status != "Active" or hold.is_expired():
+		frappe.throw("Your checkout hold has expired, please select your tickets again")
+
+	hold.db_set("status", "Converted")
+	return hold.get_seat_counts()
+
+
+def get_hold(hold_name, hold_token=None, for_update=False):
+	"""
+	Fetch a hold for the user who started the checkout.
+
+	Signed in users own the holds they created. Guests all share one session
+	user, so they prove ownership with the token returned by start_checkout.
+	"""
+	hold = frappe.get_doc("Checkout Hold", hold_name, for_update=for_update)
+
+	if frappe.session.user != "Guest" and hold.owner == frappe.session.user:
+		return hold
+	if hold_token and hold.hold_token and hmac.compare_digest(hold.hold_token, hold_token):
+		return hold
+
+	frappe.throw("You do not have access to this checkout hold", frappe.PermissionError)
+
+
+def release_hold(hold_name, hold_token=None):
+	hold = get_hold(hold_name, hold_token, for_update=True)
+	hold.release()
+	return hold
+
+
+def expire_holds():
+	"""Scheduled job: release every active hold past its expiry time."""
+	holds = frappe.get_all(
+		"Checkout Hold",
+		filters={
+			"status": "Active",
+			"expires_at": ["<", now_datetime()]
+		},
+		pluck="name",
+		order_by="expires_at asc",
+		limit=500
+	)
+
+	for name in holds:
+		hold = frappe.get_doc("Checkout Hold", name, for_update=True)
+		hold.release("Expired")
+		frappe.db.commit()
+
+
+def claim_stock(merchandise, qty):
+	frappe.db.sql(
+		"""
+		UPDATE `tabMerchandise`
+		SET stock_quantity = stock_quantity - %(qty)s
+		WHERE name = %(name)s AND stock_quantity >= %(qty)s
+		""",
+		{"name": merchandise, "qty": qty},
+	)
+	if not frappe.db._cursor.rowcount:
+		frappe.throw(f"Not enough stock left for {merchandise}", frappe.ValidationError)
+
+
+def restore_stock(merchandise, qty):
+	frappe.db.sql(
+		"""
+		UPDATE `tabMerchandise`
+		SET stock_quantity = stock_quantity + %(qty)s
+		WHERE name = %(name)s
+		""",
+		{"name": merchandise, "qty": qty},
+	)
@@ -4,6 +4,15 @@
 import frappe
 from frappe.model.document import Document
 
+from eventive.events.counters import increment
+from eventive.ticketing.doctype.checkout_hold.checkout_hold import convert_hold
+from eventive.ticketing.doctype.seat_inventory.seat_inventory import (
+	commit_seats,
+	release_seats,
+	reserve_seats,
+)
+from eventive.ticketing.issuance import enqueue_issuance
+
 
 class EventRegistration(Document):
 	def validate(self):
@@ -11,10 +20,62 @@ class EventRegistration(Document):
 			frappe.throw("Please add at least one attendee to register.")
 		else:
 			self.set_total()
-			self.create_event_tickets()
+			self.reserve_seats()
+
+	def after_insert(self):
+		increment(self.event, registrations=1)
+
+	def on_update(self):
+		# Tickets are bulk issued by a background job
+		self.create_event_tickets()
 
 	def on_submit(self):
-		pass
+		commit_seats(self.event, self.get_seat_counts())
+
+	def on_cancel(self):
+		release_seats(self.event, self.get_seat_counts(), sold=True)
+		increment(self.event, registrations=-1)
+
+	def on_trash(self):
+		if self.docstatus == 0:
+			release_seats(self.event, self.get_seat_counts())
+			increment(self.event, registrations=-1)
+
+	def get_seat_counts(self):
+		seats = {}
+		for attendee in self.attendees:
+			seats[attendee.ticket_type] = seats.get(attendee.ticket_type, 0) + 1
+		return seats
+
+	def reserve_seats(self):
+		"""Reserve seats for new attendees and release those removed since the last save."""
+		seats = self.get_seat_counts()
+		before = self.get_doc_before_save()
+
+		if before and before.event == self.event:
+			previous = before.get_seat_counts()
+		elif before:
+			release_seats(before.event, before.get_seat_counts())
+			previous = {}
+		elif self.checkout_hold:
+			# Seats held during checkout move over to the registration
+			previous = convert_hold(self.checkout_hold, self.event)
+		else:
+			previous = {}
+
+		added = {
+			ticket_type: qty - previous.get(ticket_type, 0)
+			for ticket_type, qty in seats.items()
+			if qty > previous.get(ticket_type, 0)
+		}
+		removed = {
+			ticket_type: qty - seats.get(ticket_type, 0)
+			for ticket_type, qty in previous.items()
+			if qty > seats.get(ticket_type, 0)
+		}
+
+		release_seats(self.event, removed)
+		reserve_seats(self.event, added)
 
 	def set_total(self):
 		self.total_amount = sum(
@@ -23,36 +84,10 @@ class EventRegistration(Document):
 		)
 
 	def create_event_tickets(self):
-		for attendee in self.attendees:
-			try:
-				ticket = frappe.get_doc({
-					"doctype": "Event Ticket",
-					"registration": self.name,
-					"ticket_type": attendee.ticket_type,
-					"email": attendee.email,
-					"event": self.event,
-				})
-
-				if attendee.merchandise:
-					merchandise_doc = frappe.get_doc(
-						"Event Attendee Ticket Merchandise",
-						attendee.merchandise
-					)
-
-					for item in merchandise_doc.items:
-						ticket.append("merchandise", {
-							"merchandise_item": item.merchandise_item,
-							"price": item.price,
-							"quantity": item.quantity,
-						})
-
-				ticket.insert(ignore_permissions=True)
-				ticket.submit()
-
-			except Exception:
-				frappe.log_error(
-					frappe.get_traceback(),
-					f"Failed creating ticket for {attendee.email}",
-				)
-				raise
+		before = self.get_doc_before_save()
+		if self.issuance_status == "Issued" and before:
+			issued_for = {attendee.name for attendee in before.attendees}
+			if all(attendee.name in issued_for for attendee in self.attendees):
+				return
 
+		enqueue_issuance(self)
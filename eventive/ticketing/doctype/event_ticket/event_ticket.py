@@ -1,35 +1,36 @@
 # Copyright (c) 2026, Munene Morris and contributors
 # For license information, please see license.txt
 
-# import frappe
+import frappe
 from frappe.model.document import Document
 
+from eventive.events.counters import increment
+from eventive.ticketing.check_in import forget_admission
+from eventive.ticketing.ticket_token import get_ticket_token
+
 
 class EventTicket(Document):
-	def after_insert(self):
-		self.generate_qr_code()
-	
-	def generate_qr_code(self):
-		import qrcode
-		from io import BytesIO
-		import frappe
-
-		#QR code
-		img = qrcode.make(self.name)
-		buffer = BytesIO()
-		img.save(buffer, format="PNG")
-		buffer.seek(0)
-
-		#creating file doc
-		qr_file = frappe.get_doc({
-			"doctype": "File",
-			"file_name": f"EventTicket_{self.name}.png",
-			"attached_to_doctype": "Event Ticket",
-			"attached_to_name": self.name,
-			"attached_to_field": "qr_code",
-			"is_private": 1,
-			"content": buffer.read(),
-		})
-		qr_file.insert()
-
-		self.qr_code = qr_file.file_url
+	def validate(self):
+		if not self.ticket_token:
+			self.ticket_token = get_ticket_token(self.name, self.event, self.ticket_type)
+
+	def on_update_after_submit(self):
+		# Batch check-in flips checked_in in SQL and counts it there, so this is a desk edit
+		if not self.has_value_changed("checked_in"):
+			return
+
+		increment(self.event, checked_in={self.ticket_type: 1 if self.checked_in else -1})
+		if not self.checked_in:
+			forget_admission(self.event, self.name)
+
+	def on_cancel(self):
+		increment(
+			self.event,
+			issued={self.ticket_type: -1},
+			checked_in={self.ticket_type: -1 if self.checked_in else 0},
+		)
+
+
+def on_doctype_update():
+	# Check-in manifest deltas read an event's tickets by modified
+	frappe.db.add_index("Event Ticket", ["event", "modified"])
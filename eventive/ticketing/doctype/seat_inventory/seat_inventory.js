@@ -0,0 +1,8 @@
+// Copyright (c) 2026, Munene Morris and contributors
+// For license information, please see license.txt
+
+// frappe.ui.form.on("Seat Inventory", {
+// 	refresh(frm) {
+
+// 	},
+// });
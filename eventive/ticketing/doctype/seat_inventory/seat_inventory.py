@@ -0,0 +1,215 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.model.document import Document
+from frappe.utils import cint
+
+
+class SeatInventory(Document):
+	def autoname(self):
+		self.name = get_inventory_name(self.event, self.ticket_type)
+
+
+def get_inventory_name(event, ticket_type=None):
+	# Ticket Type names already embed the event, so they never collide with event IDs
+	return ticket_type or event
+
+
+def reserve_seats(event, seats):
+	"""
+	Atomically reserve seats for an event and its ticket types.
+
+	Every inventory row is claimed with a single conditional UPDATE, so the
+	cost does not grow with the number of registrations, and concurrent
+	workers serialise on the row lock instead of overselling.
+
+	Args:
+	    event (str): The event ID
+	    seats (dict): Ticket Type ID (or None) -> number of seats
+	"""
+	claimed = []
+	try:
+		for ticket_type, qty in _inventory_rows(event, seats):
+			_claim(event, ticket_type, qty)
+			claimed.append((ticket_type, qty))
+	except frappe.ValidationError:
+		for ticket_type, qty in claimed:
+			_adjust(get_inventory_name(event, ticket_type), reserved=-qty)
+		raise
+
+
+def commit_seats(event, seats):
+	"""Turn reserved seats into sold seats."""
+	for ticket_type, qty in _inventory_rows(event, seats):
+		_adjust(get_inventory_name(event, ticket_type), reserved=-qty, sold=qty)
+
+
+def release_seats(event, seats, sold=False):
+	"""Give reserved seats, or sold seats when `sold` is set, back to the inventory."""
+	for ticket_type, qty in _inventory_rows(event, seats):
+		if sold:
+			_adjust(get_inventory_name(event, ticket_type), sold=-qty)
+		else:
+			_adjust(get_inventory_name(event, ticket_type), reserved=-qty)
+
+
+def get_availability(event, ticket_type=None):
+	"""
+	Return capacity, reserved, sold and available seats for an inventory.
+
+	`available` is None when the capacity is unlimited.
+	"""
+	inventory = frappe.db.get_value(
+		"Seat Inventory",
+		get_inventory_name(event, ticket_type),
+		["capacity", "reserved", "sold"],
+		as_dict=True
+	) or _get_initial_inventory(event, ticket_type)
+
+	inventory.available = None
+	if inventory.capacity:
+		inventory.available = max(inventory.capacity - inventory.reserved - inventory.sold, 0)
+
+	return inventory
+
+
+def create_inventory(event, ticket_type=None):
+	"""Create the inventory row for an event or ticket type."""
+	frappe.get_doc({
+		"doctype": "Seat Inventory",
+		"event": event,
+		"ticket_type": ticket_type,
+		**_get_initial_inventory(event, ticket_type),
+	}).insert(ignore_permissions=True, ignore_if_duplicate=True)
+
+
+def _get_initial_inventory(event, ticket_type=None):
+	# Seats held by registrations made before the inventory existed are counted
+	# once here: draft registrations as reserved, submitted ones as sold.
+	if ticket_type:
+		capacity = frappe.db.get_value("Ticket Type", ticket_type, "capacity")
+	else:
+		capacity = frappe.db.get_value("Main Event", event, "capacity")
+
+	counts = _count_registered_seats(event, ticket_type)
+
+	return frappe._dict({
+		"capacity": cint(capacity),
+		"reserved": counts.get(0, 0),
+		"sold": counts.get(1, 0),
+	})
+
+
+def sync_capacity(doc, method=None):
+	"""doc_events handler for Main Event and Ticket Type: mirror capacity changes."""
+	if doc.doctype == "Ticket Type":
+		name = get_inventory_name(doc.event, doc.name)
+	else:
+		name = get_inventory_name(doc.name)
+
+	frappe.db.set_value("Seat Inventory", name, "capacity", cint(doc.capacity), update_modified=False)
+
+
+def rename_inventory(doc, method=None, old=None, new=None, merge=False):
+	"""
+	doc_events handler for Main Event after_rename: move the event's inventory
+	row to its new name, so reserved and sold seats are not left behind.
+	"""
+	old_name, new_name = get_inventory_name(old), get_inventory_name(new)
+	if not old_name or old_name == new_name:
+		return
+
+	if merge and frappe.db.exists("Seat Inventory", new_name):
+		frappe.db.sql(
+			"""
+			UPDATE `tabSeat Inventory` target, `tabSeat Inventory` source
+			SET target.reserved = target.reserved + source.reserved,
+				target.sold = target.sold + source.sold
+			WHERE target.name = %(new)s AND source.name = %(old)s
+			""",
+			{"old": old_name, "new": new_name},
+		)
+		frappe.db.delete("Seat Inventory", {"name": old_name})
+		return
+
+	frappe.db.sql(
+		"""
+		UPDATE `tabSeat Inventory`
+		SET name = %(new)s, event = %(event)s
+		WHERE name = %(old)s
+		""",
+		{"old": old_name, "new": new_name, "event": new},
+	)
+
+
+def _inventory_rows(event, seats):
+	total = sum(seats.values())
+	if total > 0:
+		yield None, total
+
+	for ticket_type, qty in seats.items():
+		if ticket_type and qty > 0:
+			yield ticket_type, qty
+
+
+def _claim(event, ticket_type, qty):
+	name = get_inventory_name(event, ticket_type)
+
+	if _try_claim(name, qty):
+		return
+
+	if not frappe.db.exists("Seat Inventory", name):
+		create_inventory(event, ticket_type)
+		if _try_claim(name, qty):
+			return
+
+	if ticket_type:
+		frappe.throw(f"Not enough {ticket_type} tickets left", frappe.ValidationError)
+	frappe.throw("This event is fully booked", frappe.ValidationError)
+
+
+def _try_claim(name, qty):
+	frappe.db.sql(
+		"""
+		UPDATE `tabSeat Inventory`
+		SET reserved = reserved + %(qty)s
+		WHERE name = %(name)s
+			AND (capacity = 0 OR reserved + sold + %(qty)s <= capacity)
+		""",
+		{"name": name, "qty": qty},
+	)
+	return frappe.db._cursor.rowcount > 0
+
+
+def _adjust(name, reserved=0, sold=0):
+	frappe.db.sql(
+		"""
+		UPDATE `tabSeat Inventory`
+		SET reserved = GREATEST(reserved + %(reserved)s, 0),
+			sold = GREATEST(sold + %(sold)s, 0)
+		WHERE name = %(name)s
+		""",
+		{"name": name, "reserved": reserved, "sold": sold},
+	)
+
+
+def _count_registered_seats(event, ticket_type=None):
+	conditions = ""
+	if ticket_type:
+		conditions = "AND attendee.ticket_type = %(ticket_type)s"
+
+	rows = frappe.db.sql(
+		f"""
+		SELECT registration.docstatus, COUNT(*)
+		FROM `tabEvent Registration Attendee` attendee
+		INNER JOIN `tabEvent Registration` registration ON registration.name = attendee.parent
+		WHERE attendee.parenttype = 'Event Registration'
+			AND registration.event = %(event)s
+			AND registration.docstatus < 2
+			{conditions}
+		GROUP BY registration.docstatus
+		""",
+		{"event": event, "ticket_type": ticket_type},
+	)
+	return {docstatus: count for docstatus, count in rows}
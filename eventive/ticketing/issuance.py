@@ -0,0 +1,164 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import frappe
+from frappe.utils import now_datetime
+
+from eventive.events.counters import increment
+from eventive.ticketing.ticket_token import get_ticket_token
+
+DEFAULT_ISSUANCE_QUEUE = "default"
+
+
+def get_issuance_queue():
+	"""RQ queue for ticket issuance, e.g. a dedicated `ticketing` worker queue."""
+	return frappe.conf.get("eventive_issuance_queue") or DEFAULT_ISSUANCE_QUEUE
+
+
+def enqueue_issuance(registration):
+	"""Queue ticket issuance for a registration once the current transaction commits."""
+	registration.db_set("issuance_status", "Queued", update_modified=False)
+
+	frappe.enqueue(
+		"eventive.ticketing.issuance.issue_registration_tickets",
+		queue=get_issuance_queue(),
+		job_id=f"eventive::issue_tickets::{registration.name}",
+		deduplicate=True,
+		enqueue_after_commit=True,
+		registration=registration.name,
+	)
+
+
+def issue_registration_tickets(registration):
+	"""
+	Background job: issue a registration's tickets.
+
+	Attendees added while the job runs are deduplicated against it, so after
+	committing it checks the registration again, until a pass finds every
+	attendee ticketed.
+
+	Sets `issuance_status` to Issued, or Failed when anything goes wrong.
+	"""
+	while True:
+		doc = frappe.get_doc("Event Registration", registration)
+
+		try:
+			issued = issue_tickets(doc)
+		except Exception:
+			frappe.db.rollback()
+			frappe.log_error(
+				frappe.get_traceback(),
+				f"Failed issuing tickets for {registration}",
+			)
+			frappe.db.set_value("Event Registration", registration, "issuance_status", "Failed", update_modified=False)
+			frappe.db.commit()
+			raise
+
+		frappe.db.set_value("Event Registration", registration, "issuance_status", "Issued", update_modified=False)
+		frappe.db.commit()
+		if not issued:
+			return
+
+		# Start a new transaction, so attendees committed meanwhile are seen
+		frappe.db.rollback()
+
+
+def issue_tickets(registration):
+	"""
+	Issue an Event Ticket for every attendee of a registration that has none yet.
+
+	Merchandise bundles are loaded in one query and tickets plus their
+	merchandise rows are bulk inserted. Each ticket gets its signed token
+	here; QR codes are rendered on demand from it.
+
+	Args:
+	    registration (Document): The Event Registration
+
+	Returns:
+	    list: Names of the tickets issued
+	"""
+	issued = set(
+		frappe.get_all(
+			"Event Ticket",
+			filters={"registration": registration.name},
+			pluck="registration_attendee",
+			ignore_permissions=True
+		)
+	)
+	attendees = [attendee for attendee in registration.attendees if attendee.name not in issued]
+	if not attendees:
+		return []
+
+	bundles = get_merchandise_bundles([attendee.merchandise for attendee in attendees if attendee.merchandise])
+
+	now = now_datetime()
+	user = frappe.session.user
+	ticket_rows = []
+	merchandise_rows = []
+
+	for attendee in attendees:
+		ticket_name = frappe.generate_hash(length=10)
+		ticket_rows.append((
+			ticket_name, now, now, user, user, 1,
+			registration.name, attendee.name, registration.event, attendee.ticket_type,
+			attendee.email, attendee.full_name, "Valid", now,
+			get_ticket_token(ticket_name, registration.event, attendee.ticket_type),
+		))
+
+		for idx, item in enumerate(bundles.get(attendee.merchandise, []), start=1):
+			merchandise_rows.append((
+				frappe.generate_hash(length=10), now, now, user, user, 1,
+				ticket_name, "Event Ticket", "merchandise", idx,
+				item.merchandise_item, item.price, item.quantity,
+			))
+
+	frappe.db.bulk_insert(
+		"Event Ticket",
+		fields=[
+			"name", "creation", "modified", "owner", "modified_by", "docstatus",
+			"registration", "registration_attendee", "event", "ticket_type",
+			"email", "attendee_name", "status", "issue_date", "ticket_token",
+		],
+		values=ticket_rows,
+	)
+
+	if merchandise_rows:
+		frappe.db.bulk_insert(
+			"Event Ticket Merchandise",
+			fields=[
+				"name", "creation", "modified", "owner", "modified_by", "docstatus",
+				"parent", "parenttype", "parentfield", "idx",
+				"merchandise_item", "price", "quantity",
+			],
+			values=merchandise_rows,
+		)
+
+	issued_per_type = {}
+	for attendee in attendees:
+		issued_per_type[attendee.ticket_type] = issued_per_type.get(attendee.ticket_type, 0) + 1
+	increment(registration.event, issued=issued_per_type)
+
+	return [row[0] for row in ticket_rows]
+
+
+def get_merchandise_bundles(bundle_names):
+	"""Return Event Attendee Ticket Merchandise name -> item rows, in one query."""
+	if not bundle_names:
+		return {}
+
+	items = frappe.get_all(
+		"Event Ticket Merchandise",
+		filters={
+			"parenttype": "Event Attendee Ticket Merchandise",
+			"parent": ["in", list(set(bundle_names))]
+		},
+		fields=["parent", "merchandise_item", "price", "quantity"],
+		order_by="idx asc",
+		ignore_permissions=True
+	)
+
+	bundles = {}
+	for item in items:
+		bundles.setdefault(item.parent, []).append(item)
+	return bundles
+
@@ -0,0 +1,139 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import hashlib
+import json
+import zlib
+
+import frappe
+from frappe.utils import add_to_date, get_datetime, now_datetime
+
+from eventive.ticketing.ticket_token import SYNC_OVERLAP
+
+MANIFEST_KEY = "eventive:check_in_manifest:{0}"
+
+# Devices syncing at doors-open share one build for this long, then catch up
+# through the delta endpoint from its `generated_at`
+MANIFEST_TTL = 30
+
+MANIFEST_COLUMNS = ["ticket", "ticket_type", "access_level", "status", "checked_in"]
+MANIFEST_CHUNK_SIZE = 5000
+
+# Above this many changed tickets a device is better off downloading the manifest again
+MAX_CHANGES = 5000
+
+TICKET_ROW_SQL = """
+	SELECT t.name, t.ticket_type, tt.access_level,
+		IF(t.docstatus = 2, 'Cancelled', t.status), t.checked_in
+	FROM `tabEvent Ticket` t
+	LEFT JOIN `tabTicket Type` tt ON tt.name = t.ticket_type
+	WHERE t.event = %(event)s AND {condition}
+	ORDER BY {order_by}
+	LIMIT %(limit)s
+"""
+
+
+def get_manifest(event):
+	"""
+	Gzipped JSON manifest of every issued ticket of an event.
+
+	The manifest is `{"event", "generated_at", "columns", "tickets"}` with one
+	array per ticket in `MANIFEST_COLUMNS` order. Builds are shared through
+	Redis for a few seconds.
+
+	Returns:
+	    dict: `data` (gzipped bytes), `etag` and `generated_at`
+	"""
+	key = MANIFEST_KEY.format(event)
+	manifest = frappe.cache().get_value(key)
+
+	if manifest is None:
+		manifest = build_manifest(event)
+		frappe.cache().set_value(key, manifest, expires_in_sec=MANIFEST_TTL)
+
+	return manifest
+
+
+def build_manifest(event):
+	"""
+	Compress an event's tickets chunk by chunk, so only the gzipped manifest is held in memory.
+
+	The ETag covers the tickets but not `generated_at`, so rebuilds of an
+	unchanged event still answer devices with 304.
+	"""
+	generated_at = str(now_datetime())
+	compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+	digest = hashlib.sha1(json.dumps([event, MANIFEST_COLUMNS]).encode())
+
+	def write(text, hashed=True):
+		data = text.encode()
+		if hashed:
+			digest.update(data)
+		return compressor.compress(data)
+
+	header = json.dumps({"event": event, "generated_at": generated_at, "columns": MANIFEST_COLUMNS})
+	parts = [write(header[:-1] + ', "tickets": [', hashed=False)]
+
+	after = ""
+	first = True
+	while True:
+		rows = frappe.db.sql(
+			TICKET_ROW_SQL.format(condition="t.docstatus = 1 AND t.name > %(after)s", order_by="t.name asc"),
+			{"event": event, "after": after, "limit": MANIFEST_CHUNK_SIZE},
+			as_list=True,
+		)
+		if not rows:
+			break
+
+		chunk = ", ".join(json.dumps(row, default=str) for row in rows)
+		parts.append(write(chunk if first else ", " + chunk))
+		first = False
+		after = rows[-1][0]
+
+		if len(rows) < MANIFEST_CHUNK_SIZE:
+			break
+
+	parts.append(write("]}"))
+	parts.append(compressor.flush())
+
+	return {
+		"data": b"".join(parts),
+		"etag": digest.hexdigest(),
+		"generated_at": generated_at,
+	}
+
+
+def get_changes(event, since):
+	"""
+	Tickets of an event issued, invalidated, cancelled or checked in since a sync.
+
+	Args:
+	    event (str): The event ID
+	    since (str): `generated_at` of the device's last manifest or delta
+
+	Changes from the last SYNC_OVERLAP seconds before `since` are sent again,
+	so tickets committed late are not missed. Devices upsert rows by ticket
+	ID, which makes the repeats harmless.
+
+	Returns:
+	    dict: Changed tickets in `MANIFEST_COLUMNS` order and the next `since`,
+	        or `full_sync` when the device should download the manifest again
+	"""
+	generated_at = str(now_datetime())
+
+	rows = frappe.db.sql(
+		TICKET_ROW_SQL.format(condition="t.docstatus > 0 AND t.modified >= %(since)s", order_by="t.modified asc"),
+		{"event": event, "since": add_to_date(get_datetime(since), seconds=-SYNC_OVERLAP), "limit": MAX_CHANGES + 1},
+		as_list=True,
+	)
+
+	if len(rows) > MAX_CHANGES:
+		return {"event": event, "generated_at": generated_at, "full_sync": True}
+
+	return {
+		"event": event,
+		"generated_at": generated_at,
+		"full_sync": False,
+		"columns": MANIFEST_COLUMNS,
+		"tickets": rows,
+	}
@@ -0,0 +1,134 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import base64
+import hashlib
+import hmac
+from functools import lru_cache
+from io import BytesIO
+
+import frappe
+from frappe.utils.password import get_encryption_key
+
+QR_KEY = "eventive:ticket_qr:{0}:{1}"
+QR_TTL = 7 * 24 * 60 * 60
+
+# Browsers may reuse an image for a day and revalidate it with its ETag after
+QR_MAX_AGE = 24 * 60 * 60
+
+QR_FORMATS = {
+	"svg": "image/svg+xml",
+	"png": "image/png",
+}
+
+
+def get_qr_token(ticket):
+	"""Signed token naming a ticket, so QR URLs cannot be guessed from ticket IDs."""
+	return f"{ticket}.{_sign(ticket)}"
+
+
+def verify_qr_token(token):
+	"""
+	Return the ticket ID a QR token was signed for.
+
+	Raises PermissionError for tampered or malformed tokens.
+	"""
+	ticket, _, signature = (token or "").rpartition(".")
+	if not ticket or not hmac.compare_digest(signature, _sign(ticket)):
+		frappe.throw("Invalid ticket QR token", frappe.PermissionError)
+	return ticket
+
+
+def get_qr_url(ticket, fmt="svg"):
+	"""URL of a ticket's QR image, rendered on demand by `api.ticket.get_qr_code`."""
+	return f"/api/method/eventive.api.ticket.get_qr_code?token={get_qr_token(ticket)}&format={fmt}"
+
+
+def get_qr_content(ticket):
+	"""
+	What a ticket's QR code encodes for gate scanners: its signed token, or
+	the bare ticket ID for tickets issued before tokens existed.
+	"""
+	return frappe.db.get_value("Event Ticket", ticket, "ticket_token") or ticket
+
+
+def get_qr_image(token, fmt="svg"):
+	"""
+	Render the QR image for a signed ticket token.
+
+	Images are cached per process and in Redis. Redis is only asked when the
+	process has not served the image yet, and only the first request for a
+	ticket pays for the lookup and rendering.
+
+	Returns:
+	    tuple: (image bytes, content type, etag)
+	"""
+	if fmt not in QR_FORMATS:
+		frappe.throw(f"Unsupported QR format {fmt}, use one of {', '.join(QR_FORMATS)}")
+
+	ticket = verify_qr_token(token)
+	image, etag = _get_image(frappe.local.site, ticket, fmt)
+
+	return image, QR_FORMATS[fmt], etag
+
+
+@lru_cache(maxsize=1024)
+def _get_image(site, ticket, fmt):
+	"""(image bytes, etag) of a ticket's QR code on a site, from Redis or freshly rendered."""
+	key = QR_KEY.format(ticket, fmt)
+	cached = frappe.cache().get_value(key)
+	if cached is None:
+		content = get_qr_content(ticket)
+		cached = {
+			"image": render_qr(content, fmt),
+			"etag": hashlib.sha1(f"{fmt}:{content}".encode()).hexdigest(),
+		}
+		frappe.cache().set_value(key, cached, expires_in_sec=QR_TTL)
+
+	return cached["image"], cached["etag"]
+
+
+def render_qr(content, fmt="svg"):
+	import qrcode
+
+	if fmt == "svg":
+		from qrcode.image.svg import SvgPathImage
+
+		img = qrcode.make(content, image_factory=SvgPathImage)
+	else:
+		img = qrcode.make(content)
+
+	buffer = BytesIO()
+	img.save(buffer)
+	return buffer.getvalue()
+
+
+def delete_qr_attachments(batch_size=1000):
+	"""
+	Remove the PNG File documents tickets used to store their QR codes in.
+
+	Tickets now render QR codes on demand, so the files only take up rows
+	and disk space. Deletes in batches and commits after each one.
+	"""
+	while True:
+		files = frappe.get_all(
+			"File",
+			filters={
+				"attached_to_doctype": "Event Ticket",
+				"attached_to_field": "qr_code"
+			},
+			pluck="name",
+			limit=batch_size
+		)
+		if not files:
+			break
+
+		for name in files:
+			frappe.delete_doc("File", name, ignore_permissions=True, force=True)
+
+		frappe.db.commit()
+
+
+def _sign(ticket):
+	digest = hmac.new(get_encryption_key().encode(), ticket.encode(), hashlib.sha256).digest()
+	return base64.urlsafe_b64encode(digest[:18]).decode()
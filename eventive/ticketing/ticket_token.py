@@ -0,0 +1,189 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import base64
+import hashlib
+import json
+import time
+from datetime import datetime, time as dt_time, timedelta
+from zoneinfo import ZoneInfo
+
+import frappe
+from frappe.utils import get_datetime, getdate, get_system_timezone
+
+SIGNING_KEY_CONF = "eventive_ticket_signing_key"
+TOKEN_VERSION = 1
+
+# Sync cursors are moved back this many seconds. A row stamped with `modified`
+# before a sync but committed after it would otherwise be skipped for good.
+SYNC_OVERLAP = 60
+
+
+class InvalidTicketTokenError(frappe.ValidationError):
+	pass
+
+
+def get_ticket_token(ticket, event, ticket_type):
+	"""
+	Sign a compact, offline-verifiable token for a ticket.
+
+	The token is `<payload>.<signature>`, both base64url encoded. The payload
+	is a JSON object with the ticket ID (`tid`), event (`evt`), ticket type
+	(`tt`), access level (`acc`) and the validity window (`nbf`/`exp`, Unix
+	seconds) of the event's dates. It is signed with the site's Ed25519 key
+	so gate scanners can check it against `get_public_keys` with no network.
+
+	Args:
+	    ticket (str): The Event Ticket ID
+	    event (str): The event ID
+	    ticket_type (str): The Ticket Type ID
+
+	Returns:
+	    str: The signed token
+	"""
+	payload = {
+		"v": TOKEN_VERSION,
+		"kid": get_key_id(),
+		"tid": ticket,
+		"evt": event,
+		"tt": ticket_type,
+		"acc": frappe.get_cached_value("Ticket Type", ticket_type, "access_level") if ticket_type else None,
+	}
+	payload.update(get_validity(event))
+
+	body = _b64encode(json.dumps(payload, separators=(",", ":"), sort_keys=True).encode())
+	signature = _b64encode(get_signing_key().sign(body.encode()))
+	return f"{body}.{signature}"
+
+
+def verify_ticket_token(token, at=None):
+	"""
+	Check a ticket token's signature and validity window.
+
+	Raises InvalidTicketTokenError for forged, malformed or expired tokens.
+	Revocation is not checked here, see `get_revoked_tickets`.
+
+	Returns:
+	    dict: The token payload
+	"""
+	from cryptography.exceptions import InvalidSignature
+
+	body, _, signature = (token or "").partition(".")
+	try:
+		get_signing_key().public_key().verify(_b64decode(signature), body.encode())
+		payload = json.loads(_b64decode(body))
+	except (ValueError, InvalidSignature):
+		frappe.throw("Invalid ticket token", InvalidTicketTokenError)
+
+	now = at or time.time()
+	if payload.get("nbf") and now < payload["nbf"]:
+		frappe.throw("This ticket is not valid yet", InvalidTicketTokenError)
+	if payload.get("exp") and now >= payload["exp"]:
+		frappe.throw("This ticket has expired", InvalidTicketTokenError)
+
+	return payload
+
+
+def get_validity(event):
+	"""Unix seconds from the start of an event's first day to the end of its last day."""
+	dates = frappe.get_cached_value("Main Event", event, ["start_date", "end_date"], as_dict=True) or {}
+	validity = {}
+
+	if dates.get("start_date"):
+		validity["nbf"] = get_timestamp(getdate(dates["start_date"]))
+	if dates.get("end_date") or dates.get("start_date"):
+		validity["exp"] = get_timestamp(getdate(dates.get("end_date") or dates["start_date"]) + timedelta(days=1))
+
+	return validity
+
+
+def get_public_keys():
+	"""The site's ticket verification key as a JSON Web Key Set."""
+	return {
+		"keys": [{
+			"kty": "OKP",
+			"crv": "Ed25519",
+			"alg": "EdDSA",
+			"use": "sig",
+			"kid": get_key_id(),
+			"x": _b64encode(_get_public_bytes()),
+		}]
+	}
+
+
+def get_revoked_tickets(event, since=None):
+	"""
+	Tickets of an event that scanners must reject even though their token verifies.
+
+	Args:
+	    event (str): The event ID
+	    since (str): Only return tickets revoked at or after this datetime. The
+	        last SYNC_OVERLAP seconds before it are returned again, so callers
+	        must dedupe by ticket ID.
+
+	Returns:
+	    list: Ticket IDs
+	"""
+	filters = {"event": event}
+	if since:
+		filters["modified"] = [">=", get_datetime(since) - timedelta(seconds=SYNC_OVERLAP)]
+
+	return frappe.get_all(
+		"Event Ticket",
+		filters=filters,
+		or_filters={
+			"status": "Invalid",
+			"docstatus": 2
+		},
+		pluck="name",
+		order_by="modified asc",
+		ignore_permissions=True
+	)
+
+
+def get_signing_key():
+	from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+
+	secret = frappe.conf.get(SIGNING_KEY_CONF) or _create_signing_key()
+	return Ed25519PrivateKey.from_private_bytes(_b64decode(secret))
+
+
+def get_key_id():
+	"""Short fingerprint of the signing key, so scanners can tell rotated keys apart."""
+	return _b64encode(hashlib.sha256(_get_public_bytes()).digest()[:6])
+
+
+def _get_public_bytes():
+	from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+	return get_signing_key().public_key().public_bytes(Encoding.Raw, PublicFormat.Raw)
+
+
+def _create_signing_key():
+	from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
+	from frappe.installer import update_site_config
+	from frappe.utils.synchronization import filelock
+
+	with filelock(SIGNING_KEY_CONF):
+		secret = frappe.get_site_config().get(SIGNING_KEY_CONF)
+		if not secret:
+			secret = _b64encode(Ed25519PrivateKey.generate().private_bytes_raw())
+			update_site_config(SIGNING_KEY_CONF, secret)
+
+	frappe.local.conf[SIGNING_KEY_CONF] = secret
+	return secret
+
+
+def get_timestamp(value):
+	"""Unix seconds of a date (its midnight) or naive datetime in the system timezone."""
+	if not isinstance(value, datetime):
+		value = datetime.combine(value, dt_time.min)
+	return int(value.replace(tzinfo=ZoneInfo(get_system_timezone())).timestamp())
+
+
+def _b64encode(data):
+	return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(data):
+	return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
@@ -0,0 +1,159 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import math
+import time
+
+import frappe
+from frappe.utils import cint
+
+QUEUE_KEY = "eventive:waiting_room:{0}"
+ENTRY_KEY = "eventive:waiting_room:{0}:entry:{1}"
+PASS_KEY = "eventive:waiting_room:{0}:pass:{1}"
+# Set once a queue entry has been given a pass, so an expired pass is not issued again
+ADMITTED_KEY = "eventive:waiting_room:{0}:admitted:{1}"
+
+# How long a queue position is kept, and how long an admitted buyer has to book
+QUEUE_ENTRY_TTL = 6 * 60 * 60
+ADMISSION_TTL = 15 * 60
+
+# Advances the admission frontier by `rate` positions per elapsed second. The
+# frontier never runs ahead of the last issued position, so a quiet period
+# cannot bank admissions that a later burst would then rush through.
+ADVANCE_SCRIPT = """
+local seq = tonumber(redis.call('HGET', KEYS[1], 'seq') or '0')
+local frontier = tonumber(redis.call('HGET', KEYS[1], 'frontier') or '0')
+local now = tonumber(ARGV[1])
+local last = tonumber(redis.call('HGET', KEYS[1], 'ts') or ARGV[1])
+local position = 0
+
+if ARGV[3] == '1' then
+	seq = seq + 1
+	position = seq
+end
+
+frontier = math.min(frontier + math.max(now - last, 0) * tonumber(ARGV[2]), seq)
+
+redis.call('HSET', KEYS[1], 'seq', seq)
+redis.call('HSET', KEYS[1], 'frontier', tostring(frontier))
+redis.call('HSET', KEYS[1], 'ts', ARGV[1])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+
+return {position, tostring(frontier)}
+"""
+
+
+class NotAdmittedError(frappe.ValidationError):
+	http_status_code = 429
+
+
+def get_admission_rate(event):
+	"""Buyers admitted per second for an event, 0 when the waiting room is off."""
+	return cint(frappe.get_cached_value("Main Event", event, "waiting_room_rate"))
+
+
+def join(event):
+	"""
+	Take a position in an event's waiting room.
+
+	Returns:
+	    dict: Queue ID to poll with, position and current status
+	"""
+	rate = get_admission_rate(event)
+	if not rate:
+		return {"queue_id": None, "position": 0, "admitted": True, "ahead": 0, "estimated_wait": 0}
+
+	position, frontier = _advance(event, rate, join=True)
+	queue_id = frappe.generate_hash(length=20)
+	frappe.cache().set_value(ENTRY_KEY.format(event, queue_id), position, expires_in_sec=QUEUE_ENTRY_TTL)
+
+	return _get_status(event, queue_id, position, frontier, rate)
+
+
+def get_status(event, queue_id):
+	"""
+	Poll a waiting room position. Only touches Redis.
+
+	Returns:
+	    dict: Position, buyers ahead, estimated wait in seconds and whether
+	        the buyer has been admitted to the booking endpoints
+	"""
+	rate = get_admission_rate(event)
+	if not rate:
+		return {"queue_id": queue_id, "position": 0, "admitted": True, "ahead": 0, "estimated_wait": 0}
+
+	cache = frappe.cache()
+	position = cache.get_value(ENTRY_KEY.format(event, queue_id))
+	if not position:
+		frappe.throw("Your place in the queue has expired, please join again", frappe.DoesNotExistError)
+
+	if cache.get_value(ADMITTED_KEY.format(event, queue_id)) and not cache.get_value(PASS_KEY.format(event, queue_id)):
+		# The admission ran out unused, so the buyer goes to the back of the queue
+		position, frontier = _advance(event, rate, join=True)
+		cache.set_value(ENTRY_KEY.format(event, queue_id), position, expires_in_sec=QUEUE_ENTRY_TTL)
+		cache.delete_value(ADMITTED_KEY.format(event, queue_id))
+	else:
+		_, frontier = _advance(event, rate)
+
+	return _get_status(event, queue_id, position, frontier, rate)
+
+
+def check_admission(event, queue_id=None):
+	"""
+	Guard for the booking endpoints while an event's waiting room is on.
+
+	Raises NotAdmittedError unless `queue_id` holds an unexpired admission.
+	"""
+	if not get_admission_rate(event):
+		return
+
+	if not queue_id or not frappe.cache().get_value(PASS_KEY.format(event, queue_id)):
+		frappe.throw(
+			"Ticket sales for this event are busy, please wait for your turn in the queue",
+			NotAdmittedError,
+		)
+
+
+def consume_admission(event, queue_id=None):
+	"""Drop an admission once the buyer has completed a booking."""
+	if queue_id:
+		frappe.cache().delete_value([
+			PASS_KEY.format(event, queue_id),
+			ENTRY_KEY.format(event, queue_id),
+			ADMITTED_KEY.format(event, queue_id),
+		])
+
+
+def _get_status(event, queue_id, position, frontier, rate):
+	admitted_upto = math.floor(frontier)
+	admitted = position <= admitted_upto
+
+	if admitted:
+		cache = frappe.cache()
+		pass_key = PASS_KEY.format(event, queue_id)
+		if not cache.get_value(pass_key):
+			cache.set_value(pass_key, 1, expires_in_sec=ADMISSION_TTL)
+			cache.set_value(ADMITTED_KEY.format(event, queue_id), 1, expires_in_sec=QUEUE_ENTRY_TTL)
+
+	ahead = max(position - admitted_upto - 1, 0)
+	return {
+		"queue_id": queue_id,
+		"position": position,
+		"admitted": admitted,
+		"ahead": ahead,
+		"estimated_wait": 0 if admitted else math.ceil((ahead + 1) / rate),
+	}
+
+
+def _advance(event, rate, join=False):
+	cache = frappe.cache()
+	position, frontier = cache.eval(
+		ADVANCE_SCRIPT,
+		1,
+		cache.make_key(QUEUE_KEY.format(event)),
+		repr(time.time()),
+		rate,
+		"1" if join else "0",
+		QUEUE_ENTRY_TTL,
+	)
+	return cint(position), float(frontier)
@@ -0,0 +1,140 @@
+# Copyright (c) 2026, Munene Morris and contributors
+# For license information, please see license.txt
+
+import base64
+import json
+
+import frappe
+from frappe.utils import cint
+
+DEFAULT_PAGE_LENGTH = 20
+MAX_PAGE_LENGTH = 100
+
+
+def parse_list(value):
+	"""Accept a list, a JSON list string or a comma separated string."""
+	if not value:
+		return []
+
+	if isinstance(value, str):
+		value = value.strip()
+		if value.startswith("["):
+			value = frappe.parse_json(value)
+		else:
+			value = value.split(",")
+
+	return [v.strip() if isinstance(v, str) else v for v in value if v]
+
+
+def select_fields(requested, allowed):
+	"""
+	Resolve an opt-in `fields` projection against the fields an endpoint serves.
+
+	Args:
+	    requested: Requested fields, or None for the endpoint's default set
+	    allowed (list): Fields the endpoint is allowed to return
+
+	Returns:
+	    list: Fields to return, always including `name`
+	"""
+	requested = parse_list(requested)
+	if not requested:
+		return list(allowed)
+
+	invalid = [field for field in requested if field not in allowed]
+	if invalid:
+		frappe.throw(f"Invalid fields requested: {', '.join(invalid)}", frappe.ValidationError)
+
+	return list(dict.fromkeys(["name", *requested]))
+
+
+def get_page_length(limit):
+	if not limit:
+		return DEFAULT_PAGE_LENGTH
+
+	return min(max(cint(limit), 1), MAX_PAGE_LENGTH)
+
+
+def encode_cursor(values):
+	return base64.urlsafe_b64encode(json.dumps(values, default=str).encode()).decode()
+
+
+def decode_cursor(cursor):
+	try:
+		values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+	except Exception:
+		values = None
+
+	if not isinstance(values, list) or len(values) != 2:
+		frappe.throw("Invalid pagination cursor", frappe.ValidationError)
+
+	return values
+
+
+def paginate_query(doctype, fields, sort_field, filters=None, cursor=None, limit=None):
+	"""
+	Keyset-paginate a doctype on (sort_field, name).
+
+	The cursor condition `(sort_field, name) > (value, name)` is expressed as
+	`sort_field >= value AND (sort_field > value OR name > name)` so it fits
+	`frappe.get_all` filters and can use an index on the sort field.
+
+	Returns:
+	    dict: {"data": rows, "next_cursor": cursor or None}
+	"""
+	page_length = get_page_length(limit)
+	query_filters = [[field, "=", value] for field, value in (filters or {}).items()]
+	or_filters = None
+
+	if cursor:
+		last_value, last_name = decode_cursor(cursor)
+		query_filters.append([sort_field, ">=", last_value])
+		or_filters = [[sort_field, ">", last_value], ["name", ">", last_name]]
+
+	rows = frappe.get_all(
+		doctype,
+		filters=query_filters,
+		or_filters=or_filters,
+		fields=list(dict.fromkeys([*fields, sort_field])),
+		order_by=f"{sort_field} asc, name asc",
+		limit_page_length=page_length + 1,
+		ignore_permissions=True
+	)
+
+	return make_page(rows, fields, page_length, lambda row: [row.get(sort_field), row.name])
+
+
+def paginate_rows(rows, fields, sort_key, cursor=None, limit=None):
+	"""
+	Keyset-paginate an in-memory list of rows.
+
+	Args:
+	    rows (list): Rows to page through
+	    fields (list): Fields to return for each row
+	    sort_key (callable): Returns a comparable [value, name] pair for a row
+	    cursor (str): Cursor returned by the previous page
+	    limit (int): Page length
+
+	Returns:
+	    dict: {"data": rows, "next_cursor": cursor or None}
+	"""
+	page_length = get_page_length(limit)
+	rows = sorted(rows, key=sort_key)
+
+	if cursor:
+		last_key = decode_cursor(cursor)
+		rows = [row for row in rows if sort_key(row) > last_key]
+
+	return make_page(rows[: page_length + 1], fields, page_length, sort_key)
+
+
+def make_page(rows, fields, page_length, sort_key):
+	next_cursor = None
+	if len(rows) > page_length:
+		rows = rows[:page_length]
+		next_cursor = encode_cursor(sort_key(rows[-1]))
+
+	return {
+		"data": [frappe._dict({field: row.get(field) for field in fields}) for row in rows],
+		"next_cursor": next_cursor
+	}
@@ -1,12 +1,16 @@
-import { useState, useRef, useEffect } from 'react';
+import { useState, useRef, useEffect, useLayoutEffect } from 'react';
 import { Send } from 'lucide-react';
 import { Button } from './ui/button';
 import { Textarea } from './ui/textarea';
 import { Dialog, DialogContent, DialogHeader, DialogTitle } from './ui/dialog';
 import { useAuth } from '../context/AuthContext';
 import { messageAPI, type Message } from '../services/api';
+import { MESSAGE_EVENT, subscribe } from '../services/realtime';
 import { toast } from 'sonner';
 
+// Messages fetched per page of the conversation
+const PAGE_SIZE = 20;
+
 // Get eventId from localStorage (set when user opens an event)
 const getDefaultEventId = () => {
     return localStorage.getItem('currentEventId') || '';
@@ -32,7 +36,12 @@ export function MessageDialog({
     const [messages, setMessages] = useState<Message[]>([]);
     const [isLoading, setIsLoading] = useState(false);
     const [isSending, setIsSending] = useState(false);
+    const [hasOlder, setHasOlder] = useState(false);
+    const [isLoadingOlder, setIsLoadingOlder] = useState(false);
     const messagesEndRef = useRef<HTMLDivElement>(null);
+    const messagesAreaRef = useRef<HTMLDivElement>(null);
+    // Scroll height before older messages were prepended, to keep the view in place
+    const prependedFromHeight = useRef<number | null>(null);
 
     // Use prop eventId or get from localStorage
     const eventId = propEventId || getDefaultEventId();
@@ -44,8 +53,30 @@ export function MessageDialog({
         }
     }, [open, recipientId]);
 
-    // Scroll to bottom when messages change
+    // Show messages from the recipient as they arrive
     useEffect(() => {
+        if (!open || !recipientId) return;
+
+        return subscribe<Message>(MESSAGE_EVENT, (incoming) => {
+            if (incoming.sender_id !== recipientId) return;
+
+            setMessages((prev) =>
+                prev.some((msg) => msg.id === incoming.id) ? prev : [...prev, { ...incoming, is_read: true }]
+            );
+            messageAPI.markConversationRead(recipientId).catch((error) => {
+                console.error('Failed to mark messages as read:', error);
+            });
+        });
+    }, [open, recipientId]);
+
+    // Scroll to bottom when messages change, or stay put when older ones were prepended
+    useLayoutEffect(() => {
+        const area = messagesAreaRef.current;
+        if (prependedFromHeight.current !== null && area) {
+            area.scrollTop += area.scrollHeight - prependedFromHeight.current;
+            prependedFromHeight.current = null;
+            return;
+        }
         messagesEndRef.current?.scrollIntoView({ behavior: 'smooth' });
     }, [messages]);
 
@@ -56,8 +87,12 @@ export function MessageDialog({
             if (!eventId) {
                 throw new Error('Event context not found');
             }
-            const response = await messageAPI.getConversation(recipientId, eventId);
-            setMessages(response.data.message || []);
+            const response = await messageAPI.getConversation(recipientId, undefined, PAGE_SIZE);
+            const page: Message[] = response.data.message || [];
+            // Pages come newest first, the dialog lists oldest first
+            setMessages([...page].reverse());
+            setHasOlder(page.length === PAGE_SIZE);
+            await messageAPI.markConversationRead(recipientId);
         } catch (error) {
             console.error('Failed to load messages:', error);
             // Use mock data for demo
@@ -74,11 +109,32 @@ export function MessageDialog({
                     created_at: new Date(Date.now() - 3600000).toISOString(),
                 },
             ]);
+            setHasOlder(false);
         } finally {
             setIsLoading(false);
         }
     };
 
+    const loadOlderMessages = async () => {
+        const oldest = messages[0];
+        if (!oldest || isLoadingOlder) return;
+
+        setIsLoadingOlder(true);
+        try {
+            const response = await messageAPI.getConversation(recipientId, oldest.id, PAGE_SIZE);
+            const page: Message[] = response.data.message || [];
+
+            prependedFromHeight.current = messagesAreaRef.current?.scrollHeight ?? null;
+            setMessages((prev) => [...[...page].reverse(), ...prev]);
+            setHasOlder(page.length === PAGE_SIZE);
+        } catch (error) {
+            console.error('Failed to load older messages:', error);
+            toast.error('Failed to load older messages. Please try again.');
+        } finally {
+            setIsLoadingOlder(false);
+        }
+    };
+
     const handleSend = async () => {
         if (!message.trim()) return;
 
@@ -93,6 +149,7 @@ export function MessageDialog({
             await messageAPI.sendMessage({
                 receiver_id: recipientId,
                 message: message.trim(),
+                event_id: eventId,
             });
 
             // Add message to local state
@@ -147,7 +204,7 @@ export function MessageDialog({
                 </DialogHeader>
 
                 {/* Messages Area */}
-                <div className="flex-1 overflow-y-auto space-y-4 p-4">
+                <div ref={messagesAreaRef} className="flex-1 overflow-y-auto space-y-4 p-4">
                     {isLoading ? (
                         <div className="flex items-center justify-center h-full">
                             <p className="text-gray-500">Loading messages...</p>
@@ -159,32 +216,46 @@ export function MessageDialog({
                             </p>
                         </div>
                     ) : (
-                        messages.map((msg) => {
-                            const isOwn = msg.sender_id === user?.id;
-                            return (
-                                <div
-                                    key={msg.id}
-                                    className={`flex ${isOwn ? 'justify-end' : 'justify-start'}`}
-                                >
+                        <>
+                            {hasOlder && (
+                                <div className="flex justify-center">
+                                    <Button
+                                        variant="ghost"
+                                        size="sm"
+                                        onClick={loadOlderMessages}
+                                        disabled={isLoadingOlder}
+                                    >
+                                        {isLoadingOlder ? 'Loading...' : 'Load older messages'}
+                                    </Button>
+                                </div>
+                            )}
+                            {messages.map((msg) => {
+                                const isOwn = msg.sender_id === user?.id;
+                                return (
                                     <div
-                                        className={`max-w-[80%] rounded-lg p-3 ${isOwn
-                                            ? 'bg-blue-500 text-white'
-                                            : 'bg-gray-100 dark:bg-gray-800'
-                                            }`}
+                                        key={msg.id}
+                                        className={`flex ${isOwn ? 'justify-end' : 'justify-start'}`}
                                     >
-                                        <p className="text-sm">{msg.message}</p>
-                                        <p
-                                            className={`text-xs mt-1 ${isOwn
-                                                ? 'text-blue-100'
-                                                : 'text-gray-500'
+                                        <div
+                                            className={`max-w-[80%] rounded-lg p-3 ${isOwn
+                                                ? 'bg-blue-500 text-white'
+                                                : 'bg-gray-100 dark:bg-gray-800'
                                                 }`}
                                         >
-                                            {formatTime(msg.created_at)}
-                                        </p>
+                                            <p className="text-sm">{msg.message}</p>
+                                            <p
+                                                className={`text-xs mt-1 ${isOwn
+                                                    ? 'text-blue-100'
+                                                    : 'text-gray-500'
+                                                    }`}
+                                            >
+                                                {formatTime(msg.created_at)}
+                                            </p>
+                                        </div>
                                     </div>
-                                </div>
-                            );
-                        })
+                                );
+                            })}
+                        </>
                     )}
                     <div ref={messagesEndRef} />
                 </div>
@@ -6,6 +6,7 @@ import { Card, CardContent } from './ui/card';
 
 interface NetworkingMatchCardProps {
   match: NetworkingMatch;
+  unreadCount?: number;
   onConnect?: (matchId: string) => void;
   onIgnore?: (matchId: string) => void;
   onMessage?: (matchId: string, matchName: string) => void;
@@ -22,7 +23,7 @@ interface NetworkingMatch {
   connected: boolean;
 }
 
-export function NetworkingMatchCard({ match, onConnect, onIgnore, onMessage }: NetworkingMatchCardProps) {
+export function NetworkingMatchCard({ match, unreadCount = 0, onConnect, onIgnore, onMessage }: NetworkingMatchCardProps) {
   const typeColors = {
     Attendee: 'bg-blue-500/10 text-blue-700 dark:text-blue-300',
     Speaker: 'bg-purple-500/10 text-purple-700 dark:text-purple-300',
@@ -87,6 +88,11 @@ export function NetworkingMatchCard({ match, onConnect, onIgnore, onMessage }: N
                 >
                   <MessageSquare className="size-4 mr-1" />
                   Message
+                  {unreadCount > 0 && (
+                    <Badge variant="destructive" className="ml-1">
+                      {unreadCount}
+                    </Badge>
+                  )}
                 </Button>
               </div>
             ) : (
@@ -1,7 +1,15 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import { NetworkingMatchCard } from '../components/NetworkingMatchCard';
 import { MessageDialog } from '../components/MessageDialog';
-import { networkingAPI, type NetworkingMatch, type ConnectedMatch } from '../services/api';
+import {
+  messageAPI,
+  networkingAPI,
+  type NetworkingMatch,
+  type ConnectedMatch,
+  type Message,
+  type UnreadCounts,
+} from '../services/api';
+import { MESSAGE_EVENT, subscribe } from '../services/realtime';
 import { toast } from 'sonner';
 
 export function Networking() {
@@ -14,6 +22,9 @@ export function Networking() {
     name: string;
   } | null>(null);
   const [eventId, setEventId] = useState<string>('');
+  const [unread, setUnread] = useState<Record<string, number>>({});
+  // User whose conversation is open, so their new messages are not counted as unread
+  const openConversation = useRef<string | null>(null);
 
   // Set eventId from localStorage on mount
   useEffect(() => {
@@ -27,8 +38,29 @@ export function Networking() {
   useEffect(() => {
     loadMatches();
     loadConnectedMatches();
+    loadUnreadCounts();
   }, []);
 
+  // Count new messages as they arrive
+  useEffect(
+    () =>
+      subscribe<Message>(MESSAGE_EVENT, (incoming) => {
+        if (incoming.sender_id === openConversation.current) return;
+        setUnread((prev) => ({ ...prev, [incoming.sender_id]: (prev[incoming.sender_id] || 0) + 1 }));
+      }),
+    []
+  );
+
+  const loadUnreadCounts = async () => {
+    try {
+      const response = await messageAPI.getUnreadCounts();
+      const counts: UnreadCounts = response.data.message;
+      setUnread(counts?.conversations || {});
+    } catch (error) {
+      console.error('Failed to load unread messages:', error);
+    }
+  };
+
   const loadMatches = async () => {
     try {
       const response = await networkingAPI.getMatches();
@@ -97,10 +129,23 @@ export function Networking() {
   };
 
   const handleMessage = (matchId: string, matchName: string) => {
-    setSelectedRecipient({ id: matchId, name: matchName });
+    // Messages are addressed to the match's user, not their attendee profile
+    const matched = connectedMatches.find((m) => m.id === matchId);
+    const recipientId = matched?.email || matchId;
+
+    openConversation.current = recipientId;
+    setUnread((prev) => ({ ...prev, [recipientId]: 0 }));
+    setSelectedRecipient({ id: recipientId, name: matchName });
     setMessageDialogOpen(true);
   };
 
+  const handleMessageDialogChange = (open: boolean) => {
+    if (!open) {
+      openConversation.current = null;
+    }
+    setMessageDialogOpen(open);
+  };
+
   const allMatches = [...connectedMatches, ...suggestedMatches];
 
   return (
@@ -135,6 +180,7 @@ export function Networking() {
                   <NetworkingMatchCard
                     key={match.id}
                     match={match}
+                    unreadCount={unread[match.email || match.id] || 0}
                     onMessage={handleMessage}
                   />
                 ))}
@@ -148,7 +194,7 @@ export function Networking() {
       {selectedRecipient && (
         <MessageDialog
           open={messageDialogOpen}
-          onOpenChange={setMessageDialogOpen}
+          onOpenChange={handleMessageDialogChange}
           recipientId={selectedRecipient.id}
           recipientName={selectedRecipient.name}
           eventId={eventId}
@@ -81,6 +81,14 @@ export const eventsAPI = {
     getById: (eventId: string) =>
         frappeClient.get(`/eventive.api.events.get_by_id?event_id=${eventId}`),
 
+    getBundle: (eventId: string, include?: string[]) =>
+        frappeClient.get('/eventive.api.events.get_event_bundle', {
+            params: { event_id: eventId, include: include ? JSON.stringify(include) : undefined },
+        }),
+
+    getCounters: (eventId: string) =>
+        frappeClient.get(`/eventive.api.events.get_event_counters?event_id=${eventId}`),
+
     getMyEvents: () =>
         frappeClient.get('/eventive.api.events.get_my_events'),
 
@@ -132,9 +140,34 @@ export const eventsAPI = {
             discount_amount: number;
             merchandise: { merchandise: string; quantity: number }[];
         }[];
+        hold_id?: string;
+        hold_token?: string;
+        queue_id?: string;
     }) =>
         frappeClient.post('/eventive.api.booking.create_booking', data),
 
+    startCheckout: (data: {
+        event_id: string;
+        email?: string;
+        items: { ticket_type?: string; merchandise?: string; quantity: number }[];
+        queue_id?: string;
+    }) =>
+        frappeClient.post('/eventive.api.booking.start_checkout', data),
+
+    getCheckoutHold: (holdId: string, holdToken?: string) =>
+        frappeClient.get('/eventive.api.booking.get_checkout_hold', {
+            params: { hold_id: holdId, hold_token: holdToken },
+        }),
+
+    cancelCheckout: (holdId: string, holdToken?: string) =>
+        frappeClient.post('/eventive.api.booking.cancel_checkout', { hold_id: holdId, hold_token: holdToken }),
+
+    joinQueue: (eventId: string) =>
+        frappeClient.post('/eventive.api.booking.join_queue', { event_id: eventId }),
+
+    getQueueStatus: (eventId: string, queueId: string) =>
+        frappeClient.get(`/eventive.api.booking.get_queue_status?event_id=${eventId}&queue_id=${queueId}`),
+
     registerForEvent: (eventId: string, attendees: Attendee[]) =>
         frappeClient.post('/eventive.api.events.register_for_event', {
             event_id: eventId,
@@ -160,10 +193,22 @@ export const sessionsAPI = {
         frappeClient.get(`/eventive.api.get_session?session_id=${sessionId}`),
 
     bookSession: (sessionId: string) =>
-        frappeClient.post('/eventive.api.book_session', { session_id: sessionId }),
+        frappeClient.post('/eventive.api.sessions.book_session', { session_id: sessionId }),
 
     cancelSessionBooking: (sessionId: string) =>
-        frappeClient.post('/eventive.api.cancel_session_booking', { session_id: sessionId }),
+        frappeClient.post('/eventive.api.sessions.cancel_session_booking', { session_id: sessionId }),
+
+    generateAgendas: (eventId: string) =>
+        frappeClient.post('/eventive.api.sessions.generate_agendas', { event_id: eventId }),
+
+    getFreeSlots: (eventId: string, day: number) =>
+        frappeClient.get(`/eventive.api.sessions.get_free_slots?event_id=${eventId}&day=${day}`),
+
+    solveTimetable: (eventId: string) =>
+        frappeClient.post('/eventive.api.sessions.solve_timetable', { event_id: eventId }),
+
+    getTimetableProposal: (eventId: string) =>
+        frappeClient.get(`/eventive.api.sessions.get_timetable_proposal?event_id=${eventId}`),
 };
 
 // Speaker APIs
@@ -224,6 +269,9 @@ export const ticketAPI = {
     getAllMyTickets: (email: string) =>
         frappeClient.get(`/eventive.api.ticket.get_my_tickets?email=${email}`),
 
+    getIssuanceStatus: (registrationId: string, email: string) =>
+        frappeClient.get(`/eventive.api.ticket.get_issuance_status?registration_id=${registrationId}&email=${email}`),
+
     getByBooking: (bookingId: string) =>
         frappeClient.get(`/eventive.api.get_tickets?booking_id=${bookingId}`),
 
@@ -234,18 +282,59 @@ export const ticketAPI = {
 
     hasTicket: (email: string, eventId: string) =>
         frappeClient.get(`/eventive.api.ticket.has_ticket?email=${email}&event_id=${eventId}`),
+
+    getSigningKeys: () =>
+        frappeClient.get('/eventive.api.ticket.get_ticket_signing_keys'),
+
+    getRevocationList: (eventId: string, since?: string) =>
+        frappeClient.get('/eventive.api.ticket.get_revocation_list', {
+            params: { event_id: eventId, since },
+        }),
+};
+
+// Check-in APIs
+export const checkInAPI = {
+    checkInBatch: (eventId: string, scans: { token: string; scanner_id: string; scanned_at: string }[]) =>
+        frappeClient.post('/eventive.api.check_in.check_in_batch', { event_id: eventId, scans }),
+
+    getDuplicateScans: (eventId: string, since?: string) =>
+        frappeClient.get('/eventive.api.check_in.get_duplicate_scans', {
+            params: { event_id: eventId, since },
+        }),
+
+    getManifest: (eventId: string) =>
+        frappeClient.get(`/eventive.api.check_in.get_manifest?event_id=${eventId}`),
+
+    getManifestChanges: (eventId: string, since: string) =>
+        frappeClient.get('/eventive.api.check_in.get_manifest_changes', {
+            params: { event_id: eventId, since },
+        }),
+};
+
+// Calendar feed APIs
+export const calendarAPI = {
+    getFeedUrls: (eventId: string) =>
+        frappeClient.get(`/eventive.api.calendar.get_feed_urls?event_id=${eventId}`),
 };
 
 // Networking APIs
 export const networkingAPI = {
-    getMatches: () =>
-        frappeClient.get('/eventive.api.networking.get_matches'),
+    getMatches: (params?: { event_id?: string; cursor?: string; limit?: number }) =>
+        frappeClient.get('/eventive.api.networking.get_matches', { params }),
 
     connect: (matchId: string) =>
         frappeClient.post('/eventive.api.connect', { match_id: matchId }),
 
-    getConnected: () =>
-        frappeClient.get('/eventive.api.networking.get_connected_matches'),
+    getConnected: (params?: { event_id?: string; cursor?: string; limit?: number }) =>
+        frappeClient.get('/eventive.api.networking.get_connected_matches', { params }),
+
+    getSuggestions: (eventId: string, limit?: number) =>
+        frappeClient.get('/eventive.api.networking.get_suggestions', {
+            params: { event_id: eventId, limit },
+        }),
+
+    generateMatches: (eventId: string) =>
+        frappeClient.post('/eventive.api.networking.generate_matches', { event_id: eventId }),
 };
 
 // Message APIs
@@ -253,17 +342,25 @@ export const messageAPI = {
     sendMessage: (data: {
         receiver_id: string;
         message: string;
+        event_id?: string;
     }) =>
         frappeClient.post('/eventive.api.networking.send_message', data),
 
-    getMessages: (otherUserId: string, eventId: string) =>
-        frappeClient.get(`/eventive.api.networking.get_messages?other_user_id=${otherUserId}&event_id=${eventId}`),
+    getMessages: (otherUserId: string, before?: string, limit?: number) =>
+        frappeClient.get('/eventive.api.networking.get_messages', {
+            params: { other_user_id: otherUserId, before, limit },
+        }),
 
-    getConversation: (otherUserId: string, eventId: string) =>
-        frappeClient.get(`/eventive.api.networking.get_messages?other_user_id=${otherUserId}&event_id=${eventId}`),
+    getConversation: (otherUserId: string, before?: string, limit?: number) =>
+        frappeClient.get('/eventive.api.networking.get_messages', {
+            params: { other_user_id: otherUserId, before, limit },
+        }),
+
+    getUnreadCounts: () =>
+        frappeClient.get('/eventive.api.networking.get_unread_counts'),
 
-    markAsRead: (messageId: string) =>
-        frappeClient.post('/eventive.api.mark_message_read', { message_id: messageId }),
+    markConversationRead: (otherUserId: string) =>
+        frappeClient.post('/eventive.api.networking.mark_conversation_read', { other_user_id: otherUserId }),
 };
 
 // Types for the API
@@ -304,6 +401,12 @@ export interface Message {
     created_at: string;
 }
 
+export interface UnreadCounts {
+    total: number;
+    // Other user ID -> unread messages from them
+    conversations: Record<string, number>;
+}
+
 export interface NetworkingMatch {
     id: string;
     name: string;
@@ -0,0 +1,80 @@
+// Realtime events pushed by frappe.publish_realtime.
+//
+// Frappe's socket.io server serves its own client script, so it is loaded
+// from there instead of being bundled. Each site is a socket.io namespace,
+// and the server joins signed in users to their `user:<id>` room from the
+// session cookie.
+
+interface Socket {
+    on: (event: string, handler: (data: never) => void) => void;
+    off: (event: string, handler: (data: never) => void) => void;
+}
+
+type SocketFactory = (url: string, options?: Record<string, unknown>) => Socket;
+
+declare global {
+    interface Window {
+        io?: SocketFactory;
+    }
+}
+
+// Site name the socket.io namespace is named after, when the app is not
+// served from the site's own host name (e.g. the Vite dev server)
+const SITE_NAME = import.meta.env.VITE_FRAPPE_SITE || window.location.hostname;
+
+const CLIENT_URL = '/socket.io/socket.io.js';
+
+let socket: Promise<Socket> | null = null;
+
+const loadClient = () =>
+    new Promise<SocketFactory>((resolve, reject) => {
+        if (window.io) {
+            resolve(window.io);
+            return;
+        }
+
+        const script = document.createElement('script');
+        script.src = CLIENT_URL;
+        script.async = true;
+        script.onload = () => (window.io ? resolve(window.io) : reject(new Error('socket.io client not found')));
+        script.onerror = () => reject(new Error('Failed to load the socket.io client'));
+        document.head.appendChild(script);
+    });
+
+const getSocket = () => {
+    if (!socket) {
+        socket = loadClient().then((io) =>
+            io(`${window.location.origin}/${SITE_NAME}`, {
+                withCredentials: true,
+                reconnectionAttempts: 5,
+            })
+        );
+        // Try again on the next subscription
+        socket.catch(() => {
+            socket = null;
+        });
+    }
+    return socket;
+};
+
+// Subscribe to a realtime event. Returns a function that unsubscribes.
+export const subscribe = <T>(event: string, handler: (data: T) => void) => {
+    let active = true;
+    let connected: Socket | null = null;
+
+    getSocket()
+        .then((s) => {
+            if (active) {
+                connected = s;
+                s.on(event, handler);
+            }
+        })
+        .catch((error) => console.error('Realtime connection failed:', error));
+
+    return () => {
+        active = false;
+        connected?.off(event, handler);
+    };
+};
+
+export const MESSAGE_EVENT = 'eventive_message';
@@ -12,6 +12,12 @@ export default defineConfig({
         changeOrigin: true,
         secure: false,
         rewrite: (path: string) => path.replace(/^\/api/, '')
+      },
+      // Frappe's socket.io server, for realtime events
+      '/socket.io': {
+        target: 'http://eventive.localhost:9000',
+        changeOrigin: true,
+        ws: true,
       }
     }
   }